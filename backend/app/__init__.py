@@ -3,6 +3,7 @@ from flask import Flask
 
 from app.config import config
 from app.extensions import db, migrate, cors
+from app.json_provider import OrjsonProvider
 
 
 def create_app(config_name=None):
@@ -11,6 +12,7 @@ def create_app(config_name=None):
         config_name = os.environ.get('FLASK_ENV', 'development')
 
     app = Flask(__name__)
+    app.json = OrjsonProvider(app)
     app.config.from_object(config[config_name])
 
     # Initialize extensions
@@ -31,6 +33,10 @@ def create_app(config_name=None):
     from app.api import api as api_blueprint
     app.register_blueprint(api_blueprint)
 
+    # Load the ODBC driver manager now rather than on the first connection
+    from app.connectors import SQLServerConnector
+    SQLServerConnector.preload_driver_manager(app.config.get('SQLSERVER_DRIVER'))
+
     # Initialize tenant middleware
     from app.middleware import TenantMiddleware
     TenantMiddleware(app)
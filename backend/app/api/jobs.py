@@ -4,6 +4,7 @@ from flask import request, jsonify, g
 
 from app.api import api
 from app.middleware import require_tenant
+from app.models import Tenant
 from app.models.tenant import Job
 from app.services.job_service import JobService, JobValidationError
 
@@ -13,6 +14,12 @@ def get_job_service() -> JobService:
     return JobService(g.tenant_session)
 
 
+def notify_scheduler(job: Job) -> None:
+    """Let the scheduler know the tenant has a job due at job.next_run_at."""
+    if job.is_enabled:
+        Tenant.lower_next_job_at(g.tenant.slug, job.next_run_at)
+
+
 @api.route('/jobs', methods=['GET'])
 @require_tenant
 def list_jobs():
@@ -84,6 +91,7 @@ def create_job():
             configuration=data.get('configuration'),
             is_enabled=data.get('is_enabled', True),
         )
+        notify_scheduler(job)
         return jsonify(job.to_dict()), 201
 
     except JobValidationError as e:
@@ -148,6 +156,7 @@ def update_job(job_id: UUID):
         if not job:
             return jsonify({'error': 'Job not found'}), 404
 
+        notify_scheduler(job)
         return jsonify(job.to_dict())
 
     except JobValidationError as e:
@@ -188,6 +197,8 @@ def run_job_now(job_id: UUID):
     if not job:
         return jsonify({'error': 'Job not found'}), 404
 
+    notify_scheduler(job)
+
     return jsonify({
         'message': 'Job queued for immediate execution',
         'job': job.to_dict(),
@@ -208,6 +219,8 @@ def enable_job(job_id: UUID):
     if not job:
         return jsonify({'error': 'Job not found'}), 404
 
+    notify_scheduler(job)
+
     return jsonify(job.to_dict())
 
 
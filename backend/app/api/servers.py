@@ -863,6 +863,35 @@ def get_latest_running_queries(server_id: str):
     return jsonify(data), 200
 
 
+@api.route('/running-queries/latest', methods=['GET'])
+@require_tenant
+def get_latest_running_queries_bulk():
+    """
+    Get the most recent running queries snapshot for several servers.
+
+    Query params:
+        server_ids: Comma-separated server UUIDs
+
+    Returns:
+        200: Latest snapshots keyed by server ID
+    """
+    raw_ids = [s for s in request.args.get('server_ids', '').split(',') if s.strip()]
+    try:
+        server_ids = [UUID(s.strip()) for s in raw_ids]
+    except ValueError:
+        return jsonify({
+            'error': {
+                'code': 'INVALID_ID',
+                'message': 'Invalid server ID format'
+            }
+        }), 400
+
+    service = RunningQueriesService(g.tenant_session)
+    data = service.get_latest_queries_bulk(server_ids)
+
+    return jsonify({'servers': data}), 200
+
+
 @api.route('/running-queries', methods=['GET'])
 @require_tenant
 def get_all_running_queries():
@@ -913,11 +942,18 @@ def get_all_running_queries():
                 }
             }), 400
 
+    # At most 1000 rows, so they are read in full before responding: a
+    # query error then returns a 500 instead of a truncated 200 body
     service = RunningQueriesService(g.tenant_session)
-    data = service.get_all_running_queries(
+    queries = list(service.iter_all_running_queries(
         server_id=uuid_server_id,
         time_range=time_range,
         limit=limit
-    )
+    ))
 
-    return jsonify(data), 200
+    return jsonify({
+        'time_range': time_range,
+        'server_id': str(uuid_server_id) if uuid_server_id else None,
+        'total': len(queries),
+        'queries': queries
+    }), 200
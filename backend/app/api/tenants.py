@@ -1,5 +1,6 @@
 """Tenant management API endpoints."""
 from flask import request, jsonify
+from sqlalchemy.exc import IntegrityError
 
 from app.api import api
 from app.extensions import db
@@ -20,6 +21,15 @@ def error_response(code: str, message: str, status_code: int, details=None):
     return jsonify(response), status_code
 
 
+def _slug_conflict(slug: str):
+    """Error response for a tenant slug that is already taken."""
+    return error_response(
+        'CONFLICT',
+        f"Tenant with slug '{slug}' already exists",
+        409
+    )
+
+
 def tenant_to_dict(tenant: Tenant) -> dict:
     """Convert Tenant model to dictionary."""
     return {
@@ -70,25 +80,26 @@ def create_tenant():
         )
 
     # Check for existing tenant
-    existing = Tenant.query.filter_by(slug=slug).first()
-    if existing:
-        return error_response(
-            'CONFLICT',
-            f"Tenant with slug '{slug}' already exists",
-            409
-        )
-
+    if db.session.query(Tenant.id).filter_by(slug=slug).first() is not None:
+        return _slug_conflict(slug)
+
+    # Create tenant record; the unique slug constraint still catches a
+    # concurrent create that got past the check above
+    tenant = Tenant(
+        name=data['name'],
+        slug=slug,
+        status='active',
+        settings=data.get('settings', {})
+    )
+    db.session.add(tenant)
     try:
-        # Create tenant record
-        tenant = Tenant(
-            name=data['name'],
-            slug=slug,
-            status='active',
-            settings=data.get('settings', {})
-        )
-        db.session.add(tenant)
         db.session.flush()  # Get ID before committing
+    except IntegrityError:
+        # The other request owns the database, so don't drop it here
+        db.session.rollback()
+        return _slug_conflict(slug)
 
+    try:
         # Provision tenant database
         tenant_manager.provision_tenant(slug)
 
@@ -24,6 +24,9 @@ class Config:
     TENANT_DB_PORT = os.environ.get('TENANT_DB_PORT', '5432')
     TENANT_DB_USER = os.environ.get('TENANT_DB_USER', 'postgres')
     TENANT_DB_PASSWORD = os.environ.get('TENANT_DB_PASSWORD', '1234')
+    # Connections each tenant engine keeps open; the metric collector raises
+    # it to its thread count
+    TENANT_DB_POOL_SIZE = int(os.environ.get('TENANT_DB_POOL_SIZE', '5'))
 
 
 class DevelopmentConfig(Config):
@@ -1,4 +1,5 @@
 """SQL Server connection handler."""
+import logging
 import re
 from dataclasses import dataclass, field
 from typing import Optional
@@ -16,6 +17,60 @@ try:
 except ImportError:
     PYODBC_AVAILABLE = False
 
+logger = logging.getLogger(__name__)
+
+
+# Product version (e.g. "16.0.1000.6") and the first edition name after it in
+# @@VERSION output, e.g. "... - 15.0.4261.1 (X64) ... Developer Edition (64-bit)
+# on Windows Server 2019 Standard"; the host OS name comes after the edition
+_VERSION_PATTERN = re.compile(
+    r'(?P<product>(?P<major>\d+)\.\d+\.\d+\.\d+)'
+    r'(?:.*?\b(?P<edition>Enterprise|Standard|Developer|Express|Web)\b)?',
+    re.DOTALL
+)
+
+# Connection error categories, checked in order: (substrings matched as
+# is, substrings matched case-insensitively, message, code)
+_ERROR_CATEGORIES = (
+    (
+        ('Login failed', '18456'), (),
+        "Authentication failed. Please check username and password.", "AUTH_FAILED",
+    ),
+    (
+        ('TCP Provider', 'Named Pipes Provider'), (),
+        "Cannot connect to server. Please check hostname and port.", "CONNECTION_FAILED",
+    ),
+    (
+        (), ('timeout',),
+        "Connection timed out. Server may be unavailable or blocked by firewall.", "TIMEOUT",
+    ),
+    (
+        ('Data source name not found',), ('driver',),
+        "ODBC driver not found. Please install SQL Server ODBC driver.", "DRIVER_NOT_FOUND",
+    ),
+    (
+        ('server was not found', 'could not be found'), (),
+        "Server not found. Please check hostname.", "SERVER_NOT_FOUND",
+    ),
+    (
+        ('SSL',), ('certificate',),
+        "SSL/TLS connection error. Certificate validation failed.", "SSL_ERROR",
+    ),
+)
+
+
+_ERROR_MESSAGES = {code: message for _, _, message, code in _ERROR_CATEGORIES}
+
+# ODBC SQLSTATEs (first element of pyodbc.Error.args) that identify a
+# category on their own; 08001 is left to the substring checks as it
+# covers network, server-not-found and TLS failures alike
+_SQLSTATE_CATEGORIES = {
+    '28000': 'AUTH_FAILED',
+    'HYT00': 'TIMEOUT',
+    'HYT01': 'TIMEOUT',
+    'IM002': 'DRIVER_NOT_FOUND',
+}
+
 
 class SQLServerConnectionError(Exception):
     """Raised when SQL Server connection fails."""
@@ -159,6 +214,28 @@ class SQLServerConnector:
         """Get the ODBC driver name."""
         return self._driver
 
+    @classmethod
+    def preload_driver_manager(cls, driver: Optional[str] = None) -> None:
+        """Load the ODBC driver manager ahead of the first connection.
+
+        Enumerating drivers loads and initializes the driver manager, which
+        pyodbc otherwise does lazily inside the first connect call. Also
+        warns at startup when the configured driver isn't installed.
+
+        Args:
+            driver: ODBC driver name expected to be installed
+        """
+        if not PYODBC_AVAILABLE:
+            return
+        try:
+            installed = pyodbc.drivers()
+        except pyodbc.Error as e:
+            logger.warning(f"Could not enumerate ODBC drivers: {e}")
+            return
+        driver = driver or cls.DEFAULT_DRIVER
+        if driver not in installed:
+            logger.warning(f"ODBC driver '{driver}' is not installed (found: {', '.join(installed) or 'none'})")
+
     def _build_connection_string(
         self,
         hostname: str,
@@ -192,21 +269,21 @@ class SQLServerConnector:
         else:
             server = f"{hostname},{port}"
 
-        # Start connection string
-        conn_str = f"DRIVER={{{driver}}};SERVER={server};DATABASE={database};"
+        parts = [f"DRIVER={{{driver}}}", f"SERVER={server}", f"DATABASE={database}"]
 
         # Add authentication
         if auth_type == 'windows':
-            conn_str += "Trusted_Connection=yes;"
+            parts.append("Trusted_Connection=yes")
         else:
             if not username:
                 raise SQLServerConnectionError("Username required for SQL authentication")
-            conn_str += f"UID={username};PWD={password or ''};"
+            parts.append(f"UID={username}")
+            parts.append(f"PWD={password or ''}")
 
         # Trust server certificate (required for newer drivers)
-        conn_str += "TrustServerCertificate=yes;"
+        parts.append("TrustServerCertificate=yes")
 
-        return conn_str
+        return ';'.join(parts) + ';'
 
     def _parse_version(self, version_string: str) -> tuple[int, str, str]:
         """
@@ -215,60 +292,32 @@ class SQLServerConnector:
         Returns:
             Tuple of (major_version, edition, full_version)
         """
-        # Extract version number (e.g., "16.0.1000.6")
-        version_match = re.search(r'(\d+\.\d+\.\d+\.\d+)', version_string)
-        product_version = version_match.group(1) if version_match else 'Unknown'
-
-        # Extract major version
-        major_version = int(product_version.split('.')[0]) if version_match else 0
-
-        # Extract edition
-        edition = 'Unknown'
-        if 'Enterprise' in version_string:
-            edition = 'Enterprise'
-        elif 'Standard' in version_string:
-            edition = 'Standard'
-        elif 'Developer' in version_string:
-            edition = 'Developer'
-        elif 'Express' in version_string:
-            edition = 'Express'
-        elif 'Web' in version_string:
-            edition = 'Web'
-
-        return major_version, edition, product_version
-
-    def _categorize_error(self, error: pyodbc.Error) -> tuple[str, str]:
+        match = _VERSION_PATTERN.search(version_string)
+        if not match:
+            return 0, 'Unknown', 'Unknown'
+
+        return int(match['major']), match['edition'] or 'Unknown', match['product']
+
+    def _categorize_error(self, error: 'pyodbc.Error') -> tuple[str, str]:
         """
         Categorize pyodbc error into user-friendly message and code.
 
         Returns:
             Tuple of (error_message, error_code)
         """
-        error_str = str(error)
-
-        # Login failed
-        if 'Login failed' in error_str or '18456' in error_str:
-            return "Authentication failed. Please check username and password.", "AUTH_FAILED"
-
-        # Network errors
-        if 'TCP Provider' in error_str or 'Named Pipes Provider' in error_str:
-            return "Cannot connect to server. Please check hostname and port.", "CONNECTION_FAILED"
+        args = getattr(error, 'args', None)
+        code = _SQLSTATE_CATEGORIES.get(args[0]) if args and isinstance(args[0], str) else None
+        if code:
+            return _ERROR_MESSAGES[code], code
 
-        # Timeout
-        if 'timeout' in error_str.lower() or 'Timeout expired' in error_str:
-            return "Connection timed out. Server may be unavailable or blocked by firewall.", "TIMEOUT"
-
-        # Driver not found
-        if 'Data source name not found' in error_str or 'driver' in error_str.lower():
-            return "ODBC driver not found. Please install SQL Server ODBC driver.", "DRIVER_NOT_FOUND"
-
-        # Server not found
-        if 'server was not found' in error_str or 'could not be found' in error_str:
-            return "Server not found. Please check hostname.", "SERVER_NOT_FOUND"
+        error_str = str(error)
+        error_lower = error_str.lower()
 
-        # SSL/Certificate errors
-        if 'SSL' in error_str or 'certificate' in error_str.lower():
-            return "SSL/TLS connection error. Certificate validation failed.", "SSL_ERROR"
+        for needles, lower_needles, message, code in _ERROR_CATEGORIES:
+            if any(needle in error_str for needle in needles) or any(
+                needle in error_lower for needle in lower_needles
+            ):
+                return message, code
 
         # Default
         return f"Connection failed: {error_str}", "UNKNOWN_ERROR"
@@ -1,6 +1,12 @@
-"""Encryption utilities for sensitive data."""
-from cryptography.fernet import Fernet, InvalidToken
+"""Encryption utilities for sensitive data.
+
+Uses rfernet, a Rust implementation of Fernet. Its tokens are standard
+Fernet tokens, interchangeable with cryptography.fernet.
+"""
+from functools import lru_cache
+
 from flask import current_app
+from rfernet import Fernet, DecryptionError
 
 
 class EncryptionError(Exception):
@@ -8,6 +14,12 @@ class EncryptionError(Exception):
     pass
 
 
+@lru_cache(maxsize=4)
+def _fernet_for_key(key: str) -> Fernet:
+    """Build a Fernet instance once per key; keys are parsed on construction."""
+    return Fernet(key)
+
+
 def get_fernet() -> Fernet:
     """Get Fernet instance with the configured encryption key."""
     key = current_app.config.get('ENCRYPTION_KEY')
@@ -16,7 +28,7 @@ def get_fernet() -> Fernet:
 
     # Ensure key is properly formatted
     try:
-        return Fernet(key.encode() if isinstance(key, str) else key)
+        return _fernet_for_key(key.decode() if isinstance(key, bytes) else key)
     except Exception as e:
         raise EncryptionError(f"Invalid encryption key: {e}")
 
@@ -35,8 +47,7 @@ def encrypt_password(password: str) -> str:
         return ""
 
     f = get_fernet()
-    encrypted = f.encrypt(password.encode('utf-8'))
-    return encrypted.decode('utf-8')
+    return f.encrypt(password.encode('utf-8'))
 
 
 def decrypt_password(encrypted: str) -> str:
@@ -57,9 +68,9 @@ def decrypt_password(encrypted: str) -> str:
 
     try:
         f = get_fernet()
-        decrypted = f.decrypt(encrypted.encode('utf-8'))
+        decrypted = f.decrypt(encrypted)
         return decrypted.decode('utf-8')
-    except InvalidToken:
+    except DecryptionError:
         raise EncryptionError("Failed to decrypt password - invalid token or key")
     except Exception as e:
         raise EncryptionError(f"Failed to decrypt password: {e}")
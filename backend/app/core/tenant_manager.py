@@ -1,12 +1,35 @@
 """Tenant database provisioning and management."""
-import os
+from functools import lru_cache
 from pathlib import Path
+from typing import Optional
 
 from flask import current_app
 from sqlalchemy import create_engine, text
 from sqlalchemy.orm import scoped_session, sessionmaker
 from alembic.config import Config
-from alembic import command
+from alembic.runtime.environment import EnvironmentContext
+from alembic.script import ScriptDirectory
+
+# Tenant migration scripts; backend/migrations_tenant
+MIGRATIONS_DIR = Path(__file__).parent.parent.parent / 'migrations_tenant'
+
+
+def _alembic_config() -> Config:
+    """Build an Alembic config for the tenant migrations."""
+    alembic_cfg = Config(str(MIGRATIONS_DIR / 'alembic.ini'))
+    alembic_cfg.set_main_option('script_location', str(MIGRATIONS_DIR))
+    return alembic_cfg
+
+
+@lru_cache(maxsize=1)
+def _script_directory() -> ScriptDirectory:
+    """Load the tenant migration scripts once per process.
+
+    The versions directory doesn't change at runtime, and ScriptDirectory
+    memoizes the revision map it builds from it, so every tenant upgrade
+    after the first skips the directory walk and module imports.
+    """
+    return ScriptDirectory.from_config(_alembic_config())
 
 
 class TenantManager:
@@ -27,7 +50,13 @@ class TenantManager:
         """Get or create SQLAlchemy engine for tenant."""
         if slug not in self._engines:
             url = self.get_tenant_db_url(slug)
-            self._engines[slug] = create_engine(url)
+            # Pooled connections can sit idle between scheduler ticks, so
+            # check them before use
+            self._engines[slug] = create_engine(
+                url,
+                pool_pre_ping=True,
+                pool_size=current_app.config.get('TENANT_DB_POOL_SIZE', 5)
+            )
         return self._engines[slug]
 
     def get_session(self, slug: str):
@@ -64,36 +93,52 @@ class TenantManager:
 
         engine.dispose()
 
-    def run_migrations(self, slug: str) -> None:
-        """Run tenant migrations on database using Alembic."""
-        tenant_url = self.get_tenant_db_url(slug)
-
-        # Get path to migrations_tenant directory
-        backend_dir = Path(__file__).parent.parent.parent
-        migrations_dir = backend_dir / 'migrations_tenant'
-        alembic_ini = migrations_dir / 'alembic.ini'
-
-        # Configure Alembic
-        alembic_cfg = Config(str(alembic_ini))
-        alembic_cfg.set_main_option('script_location', str(migrations_dir))
-
-        # Set the database URL via environment variable
-        os.environ['TENANT_DB_URL'] = tenant_url
-
-        try:
-            # Run migrations to head
-            command.upgrade(alembic_cfg, 'head')
-        finally:
-            # Clean up environment variable
-            if 'TENANT_DB_URL' in os.environ:
-                del os.environ['TENANT_DB_URL']
+    def run_migrations(self, slug: str) -> Optional[str]:
+        """Run tenant migrations on database using Alembic.
+
+        Migrations run on a connection checked out of the tenant's cached
+        engine, so provisioning many tenants back to back reuses pooled
+        connections instead of opening a fresh one per upgrade.
+
+        Returns:
+            The revision the database was at before upgrading, None for a
+            new database
+        """
+        alembic_cfg = _alembic_config()
+        script = _script_directory()
+        # Alembic reads the current revision before asking what to run
+        starting_revisions = []
+
+        def upgrade(rev, context):
+            starting_revisions.extend(rev)
+            return script._upgrade_revs('head', rev)
+
+        with self.get_engine(slug).connect() as connection:
+            # Picked up by migrations_tenant/env.py
+            alembic_cfg.attributes['connection'] = connection
+            # Same as alembic's command.upgrade(alembic_cfg, 'head'), but
+            # with the cached script directory
+            with EnvironmentContext(
+                alembic_cfg,
+                script,
+                fn=upgrade,
+                destination_rev='head',
+            ):
+                script.run_env()
+
+        return starting_revisions[0] if starting_revisions else None
+
+    def get_head_revision(self) -> str:
+        """Get the revision tenant databases are migrated up to."""
+        return _script_directory().get_current_head()
 
     def get_migration_status(self, slug: str) -> dict:
-        """Get migration status for a tenant database."""
-        tenant_url = self.get_tenant_db_url(slug)
-        engine = create_engine(tenant_url)
+        """Get migration status for a tenant database.
 
-        with engine.connect() as conn:
+        Uses the tenant's cached engine, so a status check followed by
+        run_migrations shares one pooled connection.
+        """
+        with self.get_engine(slug).connect() as conn:
             # Check if alembic_version table exists
             result = conn.execute(text("""
                 SELECT EXISTS (
@@ -110,7 +155,6 @@ class TenantManager:
             row = result.fetchone()
             current = row[0] if row else None
 
-        engine.dispose()
         return {'current_revision': current, 'has_migrations': True}
 
     def drop_database(self, slug: str) -> None:
@@ -1,9 +1,14 @@
 """Tenant context middleware."""
 import logging
+import time
 import uuid
+import weakref
+from dataclasses import dataclass
 from functools import wraps
 
-from flask import request, g, jsonify
+import orjson
+from flask import current_app, request, g, jsonify
+from sqlalchemy import event
 
 from app.extensions import db
 from app.models import Tenant
@@ -11,28 +16,91 @@ from app.core import tenant_manager
 
 logger = logging.getLogger(__name__)
 
+# Middleware instances whose tenant caches are invalidated on tenant writes
+_middlewares = weakref.WeakSet()
+
+# Error bodies that never vary, serialized once: code -> (status, body)
+_STATIC_ERRORS = {
+    code: (status, orjson.dumps({'error': {'code': code, 'message': message}}))
+    for code, status, message in (
+        ('MISSING_TENANT', 400, 'X-Tenant-Slug header is required'),
+        ('TENANT_SUSPENDED', 403, 'Tenant is suspended'),
+    )
+}
+
+
+def _static_error(code: str):
+    """Build a response for a constant error from its cached body."""
+    status, body = _STATIC_ERRORS[code]
+    return current_app.response_class(body, status=status, mimetype='application/json')
+
+
+@dataclass(frozen=True)
+class CachedTenant:
+    """Tenant fields the request context needs, cached by slug."""
+    id: uuid.UUID
+    slug: str
+    status: str
+
 
 class TenantMiddleware:
     """Middleware to resolve and validate tenant context from request headers."""
 
-    EXCLUDED_PATHS = ['/api/health', '/api/tenants']
+    # Seconds a resolved tenant is reused before it is looked up again;
+    # bounds staleness for changes made by other processes
+    TENANT_CACHE_TTL = 30
+    TENANT_CACHE_MAX_SIZE = 1024
+
+    EXCLUDED_PATHS = ('/api/health', '/api/tenants')
+    # Subpaths of excluded paths, matched with a single startswith call
+    _EXCLUDED_PREFIXES = tuple(path + '/' for path in EXCLUDED_PATHS)
 
     def __init__(self, app=None):
         self.app = app
+        # slug -> (expires at, tenant)
+        self._tenant_cache: dict[str, tuple[float, CachedTenant]] = {}
+        _middlewares.add(self)
         if app:
             self.init_app(app)
 
     def init_app(self, app):
         """Initialize middleware with Flask app."""
+        app.extensions['tenant_middleware'] = self
         app.before_request(self.resolve_tenant)
         app.teardown_request(self.cleanup_tenant)
 
     def _is_excluded(self, path: str) -> bool:
         """Check if path is excluded from tenant requirement."""
-        return any(
-            path == excluded or path.startswith(excluded + '/')
-            for excluded in self.EXCLUDED_PATHS
-        )
+        return path in self.EXCLUDED_PATHS or path.startswith(self._EXCLUDED_PREFIXES)
+
+    def _get_tenant(self, slug: str):
+        """Look up a tenant by slug, reusing recent lookups.
+
+        Only found tenants are cached, so a newly created tenant is seen
+        on its first request.
+        """
+        now = time.monotonic()
+        cached = self._tenant_cache.get(slug)
+        if cached and cached[0] > now:
+            return cached[1]
+
+        row = db.session.query(Tenant.id, Tenant.slug, Tenant.status).filter_by(slug=slug).first()
+        if row is None:
+            return None
+
+        if len(self._tenant_cache) >= self.TENANT_CACHE_MAX_SIZE:
+            self._tenant_cache.clear()
+        tenant = CachedTenant(id=row.id, slug=row.slug, status=row.status)
+        self._tenant_cache[slug] = (now + self.TENANT_CACHE_TTL, tenant)
+        return tenant
+
+    def invalidate_tenant(self, slug: str) -> None:
+        """Drop a tenant's cached lookup."""
+        self._tenant_cache.pop(slug, None)
+
+    def clear_tenant_cache(self) -> None:
+        """Drop all cached tenant lookups."""
+        self._tenant_cache.clear()
 
     def resolve_tenant(self):
         """Resolve tenant from X-Tenant-Slug header."""
@@ -54,14 +122,9 @@ class TenantMiddleware:
         logger.info(f"[{g.request_id}] {request.method} {request.path} tenant={slug or 'none'}")
 
         if not slug:
-            return jsonify({
-                'error': {
-                    'code': 'MISSING_TENANT',
-                    'message': 'X-Tenant-Slug header is required'
-                }
-            }), 400
+            return _static_error('MISSING_TENANT')
 
-        tenant = Tenant.query.filter_by(slug=slug).first()
+        tenant = self._get_tenant(slug)
 
         if not tenant:
             return jsonify({
@@ -72,12 +135,7 @@ class TenantMiddleware:
             }), 404
 
         if tenant.status == 'suspended':
-            return jsonify({
-                'error': {
-                    'code': 'TENANT_SUSPENDED',
-                    'message': 'Tenant is suspended'
-                }
-            }), 403
+            return _static_error('TENANT_SUSPENDED')
 
         # Set tenant context on Flask g object
         g.tenant = tenant
@@ -96,6 +154,14 @@ class TenantMiddleware:
                 logger.warning(f"Error cleaning up tenant session: {e}")
 
 
+@event.listens_for(Tenant, 'after_update')
+@event.listens_for(Tenant, 'after_delete')
+def _invalidate_cached_tenant(mapper, connection, target):
+    """Drop a changed tenant from every middleware's cache."""
+    for middleware in list(_middlewares):
+        middleware.invalidate_tenant(target.slug)
+
+
 def require_tenant(f):
     """Decorator to require tenant context for an endpoint."""
     @wraps(f)
@@ -1,14 +1,14 @@
-import re
 import uuid
 from datetime import datetime, timezone
+from typing import Optional
 
-from sqlalchemy import event
+from sqlalchemy import case, event, or_, update
 from sqlalchemy.dialects.postgresql import UUID
 
 from app.extensions import db
 
 # Slug validation: alphanumeric + hyphens, 3-50 chars, must start/end with alphanumeric
-SLUG_PATTERN = re.compile(r'^[a-z0-9][a-z0-9-]{1,48}[a-z0-9]$')
+SLUG_CHARS = frozenset('abcdefghijklmnopqrstuvwxyz0123456789-')
 
 
 def utc_now():
@@ -33,6 +33,12 @@ class Tenant(db.Model):
         default=utc_now,
         onupdate=utc_now
     )
+    # Earliest time any of the tenant's jobs can be due, so the scheduler
+    # can skip tenants with nothing to run. NULL means unknown (always checked).
+    next_job_at = db.Column(db.DateTime(timezone=True), nullable=True, index=True)
+    # Bumped on every lower_next_job_at() call, so the scheduler can tell a
+    # job was (re)scheduled while it was computing the hint
+    next_job_version = db.Column(db.Integer, nullable=False, default=0, server_default='0')
 
     __table_args__ = (
         db.CheckConstraint(
@@ -44,12 +50,78 @@ class Tenant(db.Model):
     def __repr__(self):
         return f'<Tenant {self.slug}>'
 
+    @classmethod
+    def tenants_with_due_jobs(cls, now: datetime) -> list['Tenant']:
+        """Get active tenants that may have jobs due at `now`.
+
+        Args:
+            now: Reference time
+
+        Returns:
+            Tenants whose next_job_at hint is unknown or not in the future
+        """
+        return cls.query.filter(
+            cls.status == 'active',
+            or_(cls.next_job_at.is_(None), cls.next_job_at <= now)
+        ).all()
+
+    @classmethod
+    def lower_next_job_at(cls, slug: str, when: Optional[datetime]) -> None:
+        """Move a tenant's next_job_at hint earlier after a job is (re)scheduled.
+
+        The version is bumped even when the hint is already earlier, so a
+        scheduler tick that started before this call can't overwrite the
+        hint with a time it computed without seeing the job.
+
+        Args:
+            slug: Tenant slug
+            when: The job's new next_run_at; no-op when None
+        """
+        if when is None:
+            return
+        db.session.execute(
+            update(cls)
+            .where(cls.slug == slug)
+            .values(
+                next_job_at=case((cls.next_job_at > when, when), else_=cls.next_job_at),
+                next_job_version=cls.next_job_version + 1,
+                updated_at=cls.updated_at,
+            )
+        )
+        db.session.commit()
+
+    @classmethod
+    def set_next_job_at(
+        cls,
+        slug: str,
+        when: Optional[datetime],
+        expected_version: int
+    ) -> None:
+        """Store the scheduler's computed next_job_at hint for a tenant.
+
+        The write only applies if next_job_version still equals
+        `expected_version`, so a job scheduled through the API while the
+        scheduler was working is not overwritten with a later time.
+
+        Args:
+            slug: Tenant slug
+            when: Earliest upcoming job time
+            expected_version: next_job_version the scheduler read before processing
+        """
+        db.session.execute(
+            update(cls)
+            .where(cls.slug == slug, cls.next_job_version == expected_version)
+            .values(next_job_at=when, updated_at=cls.updated_at)
+        )
+        db.session.commit()
+
     @staticmethod
     def validate_slug(slug: str) -> bool:
         """Validate slug format: alphanumeric + hyphens, 3-50 chars."""
         if not slug or len(slug) < 3 or len(slug) > 50:
             return False
-        return bool(SLUG_PATTERN.match(slug.lower()))
+        slug = slug.lower()
+        return slug[0] != '-' and slug[-1] != '-' and SLUG_CHARS.issuperset(slug)
 
 
 @event.listens_for(Tenant, 'before_insert')
@@ -2,11 +2,14 @@
 
 These models are used with tenant database sessions, not the system database.
 """
+import hashlib
+import os
+import time
 import uuid
 from datetime import datetime, timezone
-from sqlalchemy import Column, String, Integer, Boolean, Text, DateTime, Table, ForeignKey, Index, Numeric
-from sqlalchemy.dialects.postgresql import UUID, JSON, JSONB
-from sqlalchemy.orm import declarative_base, relationship
+from sqlalchemy import Column, String, Integer, SmallInteger, BigInteger, Boolean, Enum, Identity, Text, DateTime, Table, ForeignKey, Index, Numeric, FetchedValue, func, select
+from sqlalchemy.dialects.postgresql import UUID, JSONB, REAL, DOUBLE_PRECISION
+from sqlalchemy.orm import declarative_base, relationship, column_property
 
 # Base for tenant models - used with tenant database sessions
 TenantBase = declarative_base()
@@ -35,11 +38,29 @@ def utc_now():
     return datetime.now(timezone.utc)
 
 
+def uuid7() -> uuid.UUID:
+    """Generate a time-ordered UUID (RFC 9562 version 7).
+
+    The leading 48 bits are the Unix time in milliseconds, so new primary
+    keys land at the right edge of their b-tree index instead of on a
+    random page; the remaining 74 bits are random.
+    """
+    rand = int.from_bytes(os.urandom(10), 'big')
+    value = (
+        (time.time_ns() // 1_000_000 & 0xFFFF_FFFF_FFFF) << 80
+        | 0x7 << 76
+        | (rand >> 68 & 0xFFF) << 64
+        | 0b10 << 62
+        | rand & 0x3FFF_FFFF_FFFF_FFFF
+    )
+    return uuid.UUID(int=value)
+
+
 class Server(TenantBase):
     """SQL Server connection configuration."""
     __tablename__ = 'servers'
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     name = Column(String(255), nullable=False)
     hostname = Column(String(255), nullable=False)
     port = Column(Integer, nullable=False, default=1433)
@@ -51,7 +72,7 @@ class Server(TenantBase):
     is_deleted = Column(Boolean, nullable=False, default=False)
     last_checked = Column(DateTime(timezone=True), nullable=True)
     created_at = Column(DateTime(timezone=True), nullable=False, default=utc_now)
-    updated_at = Column(DateTime(timezone=True), nullable=False, default=utc_now, onupdate=utc_now)
+    updated_at = Column(DateTime(timezone=True), nullable=False, default=utc_now, server_onupdate=FetchedValue())
 
     # Valid auth types
     AUTH_TYPE_SQL = 'sql'
@@ -64,6 +85,18 @@ class Server(TenantBase):
     STATUS_OFFLINE = 'offline'
     STATUS_ERROR = 'error'
 
+    # Name uniqueness index (case-insensitive, non-deleted servers only)
+    NAME_UNIQUE_INDEX = 'ux_servers_name_active'
+
+    __table_args__ = (
+        Index(
+            NAME_UNIQUE_INDEX,
+            func.lower(name),
+            unique=True,
+            postgresql_where=(is_deleted == False),  # noqa: E712
+        ),
+    )
+
     def to_dict(self, include_password: bool = False, include_labels: bool = False) -> dict:
         """Convert server to dictionary representation.
 
@@ -122,12 +155,12 @@ class ServerGroup(TenantBase):
     """Server group for organizing servers."""
     __tablename__ = 'server_groups'
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     name = Column(String(255), nullable=False, unique=True)
     description = Column(Text, nullable=True)
     color = Column(String(7), nullable=True)  # Hex color like #FF5733
     created_at = Column(DateTime(timezone=True), nullable=False, default=utc_now)
-    updated_at = Column(DateTime(timezone=True), nullable=False, default=utc_now, onupdate=utc_now)
+    updated_at = Column(DateTime(timezone=True), nullable=False, default=utc_now, server_onupdate=FetchedValue())
 
     # Relationship to servers
     servers = relationship(
@@ -162,7 +195,7 @@ class Label(TenantBase):
     """Label/tag for categorizing servers."""
     __tablename__ = 'labels'
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     name = Column(String(50), nullable=False, unique=True)
     color = Column(String(7), nullable=True, default='#6B7280')  # Default gray color
     created_at = Column(DateTime(timezone=True), nullable=False, default=utc_now)
@@ -188,7 +221,7 @@ class MetricType(TenantBase):
     """Type of metric that can be collected."""
     __tablename__ = 'metric_types'
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     name = Column(String(50), nullable=False, unique=True)
     unit = Column(String(20), nullable=True)
     description = Column(Text, nullable=True)
@@ -208,27 +241,35 @@ class ServerSnapshot(TenantBase):
     """Point-in-time snapshot of server metrics."""
     __tablename__ = 'server_snapshots'
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     server_id = Column(UUID(as_uuid=True), ForeignKey('servers.id'), nullable=False)
-    collected_at = Column(DateTime(timezone=True), nullable=False, default=utc_now)
+    # Part of the primary key: the table is range-partitioned on it
+    collected_at = Column(DateTime(timezone=True), primary_key=True, default=utc_now)
 
     # Core metrics stored as individual columns for efficient querying
-    cpu_percent = Column(Numeric(5, 2), nullable=True)
-    memory_percent = Column(Numeric(5, 2), nullable=True)
+    cpu_percent = Column(REAL, nullable=True)
+    memory_percent = Column(REAL, nullable=True)
     connection_count = Column(Integer, nullable=True)
-    batch_requests_sec = Column(Numeric(10, 2), nullable=True)
+    batch_requests_sec = Column(DOUBLE_PRECISION, nullable=True)
     page_life_expectancy = Column(Integer, nullable=True)
     blocked_processes = Column(Integer, nullable=True)
 
-    # Extended metrics stored as JSON for flexibility
-    extended_metrics = Column(JSON, nullable=True)
+    # Extended metrics stored as JSONB for flexibility
+    extended_metrics = Column(JSONB, nullable=True)
 
     # Status at time of collection
     status = Column(String(20), nullable=True)
 
-    # Composite index for efficient time-range queries
+    # Composite index for per-server time ranges; BRIN for whole-table
+    # time scans such as retention cleanup
     __table_args__ = (
         Index('ix_snapshots_server_time', 'server_id', 'collected_at'),
+        Index(
+            'ix_snapshots_collected_at_brin',
+            'collected_at',
+            postgresql_using='brin',
+            postgresql_with={'pages_per_range': 32}
+        ),
     )
 
     def to_dict(self) -> dict:
@@ -248,13 +289,49 @@ class ServerSnapshot(TenantBase):
         }
 
 
+class QueryText(TenantBase):
+    """Distinct query text referenced by running query snapshots.
+
+    The same statement is usually captured by many consecutive snapshots,
+    so each text is stored once and snapshots carry its hash.
+    """
+    __tablename__ = 'query_texts'
+
+    hash = Column(BigInteger, primary_key=True)
+    text = Column(Text, nullable=False)
+    first_seen = Column(DateTime(timezone=True), nullable=False, default=utc_now)
+
+    @staticmethod
+    def hash_text(text: str) -> int:
+        """Hash query text to its query_texts key.
+
+        First 64 bits of the MD5 digest as a signed integer; matches
+        ('x' || substr(md5(text), 1, 16))::bit(64)::bigint in Postgres,
+        which migration 026 used to backfill existing snapshots.
+        """
+        return int.from_bytes(hashlib.md5(text.encode()).digest()[:8], 'big', signed=True)
+
+
+class WaitType(TenantBase):
+    """SQL Server wait type name referenced by running query snapshots."""
+    __tablename__ = 'wait_types'
+
+    id = Column(SmallInteger, Identity(), primary_key=True)
+    name = Column(String(60), nullable=False, unique=True)
+
+
+# Request statuses reported by sys.dm_exec_requests
+QUERY_STATUSES = ('background', 'rollback', 'running', 'runnable', 'sleeping', 'suspended')
+
+
 class RunningQuerySnapshot(TenantBase):
     """Snapshot of a running query captured from SQL Server."""
     __tablename__ = 'running_query_snapshots'
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     server_id = Column(UUID(as_uuid=True), ForeignKey('servers.id', ondelete='CASCADE'), nullable=False)
-    collected_at = Column(DateTime(timezone=True), nullable=False, default=utc_now)
+    # Part of the primary key: the table is range-partitioned on it
+    collected_at = Column(DateTime(timezone=True), primary_key=True, default=utc_now)
 
     # Query identification
     session_id = Column(Integer, nullable=False)
@@ -266,16 +343,24 @@ class RunningQuerySnapshot(TenantBase):
     host_name = Column(String(128), nullable=True)
     program_name = Column(String(128), nullable=True)
 
-    # Query text (the main payload)
-    query_text = Column(Text, nullable=True)
+    # Query text (the main payload), stored once in query_texts; read-only
+    # here, resolved per row by a correlated lookup on the hash
+    query_text_hash = Column(BigInteger, nullable=True)
+    query_text = column_property(
+        select(QueryText.text).where(QueryText.hash == query_text_hash).scalar_subquery()
+    )
 
     # Timing
     start_time = Column(DateTime(timezone=True), nullable=True)
     duration_ms = Column(Integer, nullable=True)
 
-    # Status & waits
-    status = Column(String(30), nullable=True)
-    wait_type = Column(String(60), nullable=True)
+    # Status & waits; wait type names are stored once in wait_types and
+    # resolved per row like query_text
+    status = Column(Enum(*QUERY_STATUSES, name='query_status'), nullable=True)
+    wait_type_id = Column(SmallInteger, ForeignKey('wait_types.id'), nullable=True)
+    wait_type = column_property(
+        select(WaitType.name).where(WaitType.id == wait_type_id).scalar_subquery()
+    )
     wait_time_ms = Column(Integer, nullable=True)
 
     # Blocking information (from sys.dm_exec_requests)
@@ -289,10 +374,26 @@ class RunningQuerySnapshot(TenantBase):
 
     # Indexes for efficient queries and aggregations
     __table_args__ = (
-        Index('ix_running_queries_server_time', 'server_id', 'collected_at'),
-        Index('ix_running_queries_blocking', 'server_id', 'blocking_session_id'),
-        Index('ix_running_queries_database', 'server_id', 'database_name'),
-        Index('ix_running_queries_login', 'server_id', 'login_name'),
+        # Covering index: analytics timelines and breakdowns scan index-only
+        Index(
+            'ix_running_queries_server_time_covering', 'server_id', 'collected_at',
+            postgresql_include=[
+                'database_name', 'login_name', 'host_name', 'program_name',
+                'wait_type_id', 'duration_ms', 'cpu_time_ms',
+            ],
+        ),
+        Index(
+            'ix_running_queries_collected_at_brin',
+            'collected_at',
+            postgresql_using='brin',
+            postgresql_with={'pages_per_range': 32}
+        ),
+        # Lets the metrics cleanup find unreferenced query texts cheaply
+        Index(
+            'ix_running_queries_query_text_hash',
+            'query_text_hash',
+            postgresql_where=query_text_hash.isnot(None)
+        ),
     )
 
     def to_dict(self) -> dict:
@@ -321,20 +422,40 @@ class RunningQuerySnapshot(TenantBase):
         }
 
 
+class RunningQueryHourly(TenantBase):
+    """Hourly rollup of running query snapshot counts per server.
+
+    Maintained incrementally by the metric collector so long-window counts
+    read one row per hour instead of scanning running_query_snapshots.
+    """
+    __tablename__ = 'running_query_hourly'
+
+    server_id = Column(UUID(as_uuid=True), ForeignKey('servers.id', ondelete='CASCADE'), primary_key=True)
+    hour = Column(DateTime(timezone=True), primary_key=True)
+    snapshot_count = Column(Integer, nullable=False, default=0)
+
+
 class Metric(TenantBase):
     """Individual metric data point (for detailed historical data)."""
     __tablename__ = 'metrics'
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     server_id = Column(UUID(as_uuid=True), ForeignKey('servers.id'), nullable=False)
     metric_type_id = Column(UUID(as_uuid=True), ForeignKey('metric_types.id'), nullable=False)
-    value = Column(Numeric(18, 4), nullable=False)
-    collected_at = Column(DateTime(timezone=True), nullable=False, default=utc_now)
+    value = Column(DOUBLE_PRECISION, nullable=False)
+    # Part of the primary key: the table is range-partitioned on it
+    collected_at = Column(DateTime(timezone=True), primary_key=True, default=utc_now)
 
     # Composite index for efficient time-range queries by server and metric type
     __table_args__ = (
         Index('ix_metrics_server_time', 'server_id', 'collected_at'),
         Index('ix_metrics_server_type_time', 'server_id', 'metric_type_id', 'collected_at'),
+        Index(
+            'ix_metrics_collected_at_brin',
+            'collected_at',
+            postgresql_using='brin',
+            postgresql_with={'pages_per_range': 32}
+        ),
     )
 
     def to_dict(self) -> dict:
@@ -354,7 +475,7 @@ class Setting(TenantBase):
 
     key = Column(String(100), primary_key=True)
     value = Column(JSONB, nullable=False)
-    updated_at = Column(DateTime(timezone=True), nullable=False, default=utc_now, onupdate=utc_now)
+    updated_at = Column(DateTime(timezone=True), nullable=False, default=utc_now, server_onupdate=FetchedValue())
 
     # Default settings keys
     KEY_RETENTION_DAYS = 'metrics_retention_days'
@@ -382,10 +503,10 @@ class CollectionConfig(TenantBase):
     server_id = Column(UUID(as_uuid=True), ForeignKey('servers.id', ondelete='CASCADE'), primary_key=True)
     interval_seconds = Column(Integer, nullable=False, default=60)
     enabled = Column(Boolean, nullable=False, default=False)
-    metrics_enabled = Column(JSON, nullable=False, default=['cpu_percent', 'memory_percent', 'connection_count'])
+    metrics_enabled = Column(JSONB, nullable=False, default=['cpu_percent', 'memory_percent', 'connection_count'])
     last_collected_at = Column(DateTime(timezone=True), nullable=True)
     created_at = Column(DateTime(timezone=True), nullable=False, default=utc_now)
-    updated_at = Column(DateTime(timezone=True), nullable=False, default=utc_now, onupdate=utc_now)
+    updated_at = Column(DateTime(timezone=True), nullable=False, default=utc_now, server_onupdate=FetchedValue())
 
     # Query collection settings
     query_collection_enabled = Column(Boolean, nullable=False, default=False)
@@ -400,6 +521,9 @@ class CollectionConfig(TenantBase):
     query_filter_text_include = Column(Text, nullable=True)
     query_filter_text_exclude = Column(Text, nullable=True)
 
+    # Free space per page so the per-poll timestamp updates stay HOT
+    __table_args__ = {'postgresql_with': {'fillfactor': 80}}
+
     # Validation constants
     MIN_INTERVAL = 30
     MAX_INTERVAL = 3600
@@ -447,16 +571,16 @@ class Policy(TenantBase):
     TYPE_CUSTOM_SCRIPT = 'custom_script'
     VALID_TYPES = [TYPE_BACKUP, TYPE_INDEX_MAINTENANCE, TYPE_INTEGRITY_CHECK, TYPE_CUSTOM_SCRIPT]
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     name = Column(String(255), nullable=False, unique=True)
     type = Column(String(50), nullable=False)
     description = Column(Text, nullable=True)
-    configuration = Column(JSON, nullable=False, default=dict)
+    configuration = Column(JSONB, nullable=False, default=dict)
     version = Column(Integer, nullable=False, default=1)
     is_active = Column(Boolean, nullable=False, default=True)
     is_deleted = Column(Boolean, nullable=False, default=False)
     created_at = Column(DateTime(timezone=True), nullable=False, default=utc_now)
-    updated_at = Column(DateTime(timezone=True), nullable=False, default=utc_now, onupdate=utc_now)
+    updated_at = Column(DateTime(timezone=True), nullable=False, default=utc_now, server_onupdate=FetchedValue())
 
     # Relationship to version history
     versions = relationship('PolicyVersion', back_populates='policy', order_by='desc(PolicyVersion.version)')
@@ -485,10 +609,10 @@ class PolicyVersion(TenantBase):
     """Historical version of a policy configuration (immutable versioning)."""
     __tablename__ = 'policy_versions'
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     policy_id = Column(UUID(as_uuid=True), ForeignKey('policies.id', ondelete='CASCADE'), nullable=False)
     version = Column(Integer, nullable=False)
-    configuration = Column(JSON, nullable=False)
+    configuration = Column(JSONB, nullable=False)
     description = Column(Text, nullable=True)  # Description at time of this version
     created_at = Column(DateTime(timezone=True), nullable=False, default=utc_now)
 
@@ -530,21 +654,30 @@ class Job(TenantBase):
     TYPE_ALERT_CHECK = 'alert_check'
     VALID_JOB_TYPES = [TYPE_POLICY_EXECUTION, TYPE_DATA_COLLECTION, TYPE_CUSTOM_SCRIPT, TYPE_ALERT_CHECK]
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     name = Column(String(255), nullable=False)
     type = Column(String(50), nullable=False)
-    configuration = Column(JSON, nullable=False, default=dict)
+    configuration = Column(JSONB, nullable=False, default=dict)
     schedule_type = Column(String(20), nullable=False)
-    schedule_config = Column(JSON, nullable=False, default=dict)
+    schedule_config = Column(JSONB, nullable=False, default=dict)
     is_enabled = Column(Boolean, nullable=False, default=True)
-    next_run_at = Column(DateTime(timezone=True), nullable=True, index=True)
+    next_run_at = Column(DateTime(timezone=True), nullable=True)
     last_run_at = Column(DateTime(timezone=True), nullable=True)
     created_at = Column(DateTime(timezone=True), nullable=False, default=utc_now)
-    updated_at = Column(DateTime(timezone=True), nullable=False, default=utc_now, onupdate=utc_now)
+    updated_at = Column(DateTime(timezone=True), nullable=False, default=utc_now, server_onupdate=FetchedValue())
 
     # Relationship to executions
     executions = relationship('JobExecution', back_populates='job', order_by='desc(JobExecution.started_at)')
 
+    # Partial index covering only rows the scheduler can claim
+    __table_args__ = (
+        Index(
+            'ix_jobs_due',
+            'next_run_at',
+            postgresql_where=(is_enabled == True) & (next_run_at.isnot(None))
+        ),
+    )
+
     def to_dict(self, include_executions: bool = False) -> dict:
         """Convert job to dictionary representation."""
         result = {
@@ -579,13 +712,13 @@ class JobExecution(TenantBase):
     STATUS_CANCELLED = 'cancelled'
     VALID_STATUSES = [STATUS_PENDING, STATUS_RUNNING, STATUS_SUCCESS, STATUS_FAILED, STATUS_CANCELLED]
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     job_id = Column(UUID(as_uuid=True), ForeignKey('jobs.id', ondelete='CASCADE'), nullable=False)
     server_id = Column(UUID(as_uuid=True), ForeignKey('servers.id', ondelete='SET NULL'), nullable=True)
     status = Column(String(20), nullable=False, default=STATUS_PENDING)
     started_at = Column(DateTime(timezone=True), nullable=True)
     completed_at = Column(DateTime(timezone=True), nullable=True)
-    result = Column(JSON, nullable=True)
+    result = Column(JSONB, nullable=True)
     error_message = Column(Text, nullable=True)
     created_at = Column(DateTime(timezone=True), nullable=False, default=utc_now)
 
@@ -639,7 +772,7 @@ class PolicyDeployment(TenantBase):
     """Deployment of a policy to a server group."""
     __tablename__ = 'policy_deployments'
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     policy_id = Column(UUID(as_uuid=True), ForeignKey('policies.id', ondelete='CASCADE'), nullable=False)
     policy_version = Column(Integer, nullable=False)
     group_id = Column(UUID(as_uuid=True), ForeignKey('server_groups.id', ondelete='CASCADE'), nullable=False)
@@ -709,7 +842,7 @@ class AlertRule(TenantBase):
         'batch_requests_sec', 'page_life_expectancy', 'blocked_processes',
     ]
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     name = Column(String(255), nullable=False)
     metric_type = Column(String(50), nullable=False)
     operator = Column(String(10), nullable=False)  # gt, gte, lt, lte, eq
@@ -717,7 +850,7 @@ class AlertRule(TenantBase):
     severity = Column(String(20), nullable=False)  # info, warning, critical
     is_enabled = Column(Boolean, nullable=False, default=True)
     created_at = Column(DateTime(timezone=True), nullable=False, default=utc_now)
-    updated_at = Column(DateTime(timezone=True), nullable=False, default=utc_now, onupdate=utc_now)
+    updated_at = Column(DateTime(timezone=True), nullable=False, default=utc_now, server_onupdate=FetchedValue())
 
     # Relationship to alerts
     alerts = relationship('Alert', back_populates='rule', cascade='all, delete-orphan')
@@ -762,7 +895,7 @@ class Alert(TenantBase):
     STATUS_RESOLVED = 'resolved'
     VALID_STATUSES = [STATUS_ACTIVE, STATUS_ACKNOWLEDGED, STATUS_RESOLVED]
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     rule_id = Column(UUID(as_uuid=True), ForeignKey('alert_rules.id', ondelete='CASCADE'), nullable=False)
     server_id = Column(UUID(as_uuid=True), ForeignKey('servers.id', ondelete='CASCADE'), nullable=False)
     status = Column(String(20), nullable=False, default=STATUS_ACTIVE)
@@ -773,10 +906,23 @@ class Alert(TenantBase):
     resolved_at = Column(DateTime(timezone=True), nullable=True)
     notes = Column(Text, nullable=True)
 
-    # Indexes for efficient querying
+    # Indexes for efficient querying; open alerts get partial indexes so
+    # resolved history doesn't bloat them
     __table_args__ = (
-        Index('ix_alerts_status', 'status'),
-        Index('ix_alerts_rule_server', 'rule_id', 'server_id'),
+        Index(
+            'ix_alerts_active',
+            triggered_at.desc(),
+            server_id,
+            postgresql_where=(status == STATUS_ACTIVE)
+        ),
+        Index(
+            'ix_alerts_acknowledged',
+            triggered_at.desc(),
+            server_id,
+            postgresql_where=(status == STATUS_ACKNOWLEDGED)
+        ),
+        Index('ix_alerts_rule_id', 'rule_id'),
+        Index('ix_alerts_server_id', 'server_id'),
         Index('ix_alerts_triggered_at', 'triggered_at'),
     )
 
@@ -838,7 +984,7 @@ class ActivityLog(TenantBase):
     ENTITY_POLICY = 'policy'
     ENTITY_SERVER = 'server'
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     action = Column(String(100), nullable=False)
     entity_type = Column(String(50), nullable=True)
     entity_id = Column(UUID(as_uuid=True), nullable=True)
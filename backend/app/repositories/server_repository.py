@@ -39,13 +39,3 @@ class ServerRepository(BaseRepository[Server]):
         server.is_deleted = True
         self.session.flush()
         return server
-
-    def name_exists(self, name: str, exclude_id: Optional[UUID] = None) -> bool:
-        """Check if server name already exists (excluding specified ID)."""
-        query = self.session.query(Server).filter(
-            Server.name.ilike(name),
-            Server.is_deleted == False  # noqa: E712
-        )
-        if exclude_id:
-            query = query.filter(Server.id != exclude_id)
-        return query.first() is not None
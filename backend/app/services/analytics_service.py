@@ -5,7 +5,8 @@ from uuid import UUID
 from sqlalchemy import func, desc, and_, or_, case
 from sqlalchemy.orm import Session
 
-from app.models.tenant import RunningQuerySnapshot, Server
+from app.models.tenant import RunningQuerySnapshot, Server, WaitType
+from app.services.running_queries_service import SNAPSHOT_COLUMNS, snapshot_row_to_dict
 
 
 class AnalyticsServiceError(Exception):
@@ -76,15 +77,16 @@ class AnalyticsService:
                 'collected_at': None
             }
 
-        # Get all queries from the latest snapshot
-        queries = self.session.query(RunningQuerySnapshot).filter(
+        # Get all queries from the latest snapshot as plain rows; the
+        # response is JSON, so ORM objects would only add overhead
+        queries = self.session.query(*SNAPSHOT_COLUMNS).filter(
             RunningQuerySnapshot.server_id == server_id,
             RunningQuerySnapshot.collected_at == latest_time
         ).order_by(desc(RunningQuerySnapshot.duration_ms)).all()
 
         return {
             'columns': self._get_query_columns(),
-            'rows': [q.to_dict() for q in queries],
+            'rows': [snapshot_row_to_dict(q) for q in queries],
             'total_rows': len(queries),
             'collected_at': latest_time.isoformat() if latest_time else None
         }
@@ -118,7 +120,7 @@ class AnalyticsService:
             return {'chains': [], 'total_blocked_sessions': 0, 'collected_at': None}
 
         # Get all queries from the latest snapshot
-        queries = self.session.query(RunningQuerySnapshot).filter(
+        queries = self.session.query(*SNAPSHOT_COLUMNS).filter(
             RunningQuerySnapshot.server_id == server_id,
             RunningQuerySnapshot.collected_at == latest_time
         ).all()
@@ -133,8 +135,8 @@ class AnalyticsService:
             'collected_at': latest_time.isoformat() if latest_time else None
         }
 
-    def _build_blocking_chains(self, queries: List[RunningQuerySnapshot]) -> List[Dict]:
-        """Build hierarchical blocking chain tree from query snapshots."""
+    def _build_blocking_chains(self, queries: List) -> List[Dict]:
+        """Build hierarchical blocking chain tree from SNAPSHOT_COLUMNS rows."""
         # Create lookup by session_id
         by_session = {q.session_id: q for q in queries}
 
@@ -215,9 +217,9 @@ class AnalyticsService:
         ).filter(
             RunningQuerySnapshot.server_id == server_id,
             RunningQuerySnapshot.collected_at.between(start_dt, end_dt),
-            RunningQuerySnapshot.query_text.isnot(None)
+            RunningQuerySnapshot.query_text_hash.isnot(None)
         ).group_by(
-            RunningQuerySnapshot.query_text,
+            RunningQuerySnapshot.query_text_hash,
             RunningQuerySnapshot.session_id
         ).order_by(
             desc('value')
@@ -257,7 +259,7 @@ class AnalyticsService:
             'login': RunningQuerySnapshot.login_name,
             'host': RunningQuerySnapshot.host_name,
             'application': RunningQuerySnapshot.program_name,
-            'wait-type': RunningQuerySnapshot.wait_type,
+            'wait-type': WaitType.name,
         }
 
         if dimension not in dimension_columns:
@@ -266,10 +268,14 @@ class AnalyticsService:
         column = dimension_columns[dimension]
 
         # Query for breakdown
-        results = self.session.query(
+        query = self.session.query(
             func.coalesce(column, 'Unknown').label('label'),
             func.count().label('value')
-        ).filter(
+        ).select_from(RunningQuerySnapshot)
+        if dimension == 'wait-type':
+            # Wait type names live in the wait_types lookup table
+            query = query.outerjoin(WaitType, WaitType.id == RunningQuerySnapshot.wait_type_id)
+        results = query.filter(
             RunningQuerySnapshot.server_id == server_id,
             RunningQuerySnapshot.collected_at.between(start_dt, end_dt)
         ).group_by(
@@ -331,7 +337,7 @@ class AnalyticsService:
 
         # Build the time bucket query based on metric
         if metric == 'query-count':
-            agg_func = func.count(RunningQuerySnapshot.id)
+            agg_func = func.count()
             unit = 'queries'
         elif metric == 'avg-duration':
             agg_func = func.avg(RunningQuerySnapshot.duration_ms)
@@ -340,7 +346,7 @@ class AnalyticsService:
             agg_func = func.sum(RunningQuerySnapshot.cpu_time_ms)
             unit = 'ms'
         else:
-            agg_func = func.count(RunningQuerySnapshot.id)
+            agg_func = func.count()
             unit = 'queries'
 
         # Use date_trunc for PostgreSQL
@@ -0,0 +1,167 @@
+"""Service for maintaining monthly partitions of time-series tables."""
+import logging
+import re
+from datetime import datetime, timezone
+from typing import Optional
+
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+
+logger = logging.getLogger(__name__)
+
+# Tables range-partitioned by month on collected_at (migrations 019, 023)
+PARTITIONED_TABLES = ('server_snapshots', 'metrics', 'running_query_snapshots')
+
+# How many months ahead of the current one to keep partitions for
+DEFAULT_MONTHS_AHEAD = 2
+
+_PARTITION_SUFFIX = re.compile(r'_p(\d{4})_(\d{2})$')
+
+
+def _month_start(year: int, month: int) -> datetime:
+    """First instant of a month in UTC, normalizing month overflow."""
+    year += (month - 1) // 12
+    month = (month - 1) % 12 + 1
+    return datetime(year, month, 1, tzinfo=timezone.utc)
+
+
+def partition_name(table: str, month_start: datetime) -> str:
+    """Get the partition name for the month starting at month_start."""
+    return f'{table}_p{month_start:%Y_%m}'
+
+
+class PartitionService:
+    """Creates upcoming and drops expired monthly partitions."""
+
+    def __init__(self, session: Session):
+        self.session = session
+
+    def list_partitions(self, table: str) -> list[tuple[str, datetime]]:
+        """List a table's monthly partitions.
+
+        Args:
+            table: Partitioned parent table name
+
+        Returns:
+            (partition name, month start) tuples, oldest first; the default
+            partition is not included
+        """
+        rows = self.session.execute(text("""
+            SELECT child.relname
+            FROM pg_inherits
+            JOIN pg_class parent ON parent.oid = pg_inherits.inhparent
+            JOIN pg_class child ON child.oid = pg_inherits.inhrelid
+            WHERE parent.relname = :table
+        """), {'table': table}).scalars()
+
+        partitions = []
+        for name in rows:
+            match = _PARTITION_SUFFIX.search(name)
+            if match:
+                partitions.append((name, _month_start(int(match[1]), int(match[2]))))
+        return sorted(partitions, key=lambda partition: partition[1])
+
+    def ensure_partitions(
+        self,
+        table: str,
+        now: Optional[datetime] = None,
+        months_ahead: int = DEFAULT_MONTHS_AHEAD
+    ) -> list[str]:
+        """Create partitions for the current month and the next few.
+
+        Earlier months with rows in the default partition, such as after the
+        cleanup worker was down, get partitions too. Postgres won't create a
+        partition for a range the default partition holds rows for, so those
+        rows are moved out first and re-inserted once the partition exists.
+
+        Args:
+            table: Partitioned parent table name
+            now: Reference time (defaults to current UTC time)
+            months_ahead: Months after the current one to cover
+
+        Returns:
+            Names of partitions created
+        """
+        now = now or datetime.now(timezone.utc)
+        existing = {name for name, _ in self.list_partitions(table)}
+        default = f'{table}_default'
+
+        start = _month_start(now.year, now.month)
+        last = _month_start(now.year, now.month + months_ahead)
+        oldest = self.session.execute(text(f'SELECT min(collected_at) FROM "{default}"')).scalar()
+        if oldest is not None:
+            oldest = oldest.astimezone(timezone.utc)
+            start = min(start, _month_start(oldest.year, oldest.month))
+
+        created = []
+        while start <= last:
+            end = _month_start(start.year, start.month + 1)
+            name = partition_name(table, start)
+            if name not in existing:
+                moved = self._create_partition(table, name, start, end)
+                if moved:
+                    logger.info(f'Moved {moved} rows from {default} into {name}')
+                created.append(name)
+            start = end
+
+        if self.session.execute(text(f'SELECT EXISTS (SELECT 1 FROM "{default}")')).scalar():
+            logger.warning(f'{default} still has rows outside the monthly partitions')
+        self.session.commit()
+        return created
+
+    def _create_partition(self, table: str, name: str, start: datetime, end: datetime) -> int:
+        """Create one monthly partition, moving its rows out of the default partition.
+
+        Returns:
+            Number of rows moved from the default partition
+        """
+        default = f'{table}_default'
+        bounds = {'start': start, 'end': end}
+
+        # Park the month's rows from the default partition in a temp table
+        # so creating the partition doesn't fail on them; the lock keeps new
+        # rows for the month out of the default partition until it exists
+        self.session.execute(text(f'LOCK TABLE "{default}" IN EXCLUSIVE MODE'))
+        self.session.execute(text(f'CREATE TEMP TABLE _partition_rows (LIKE "{table}")'))
+        moved = self.session.execute(text(f"""
+            WITH moved AS (
+                DELETE FROM "{default}"
+                WHERE collected_at >= :start AND collected_at < :end
+                RETURNING *
+            )
+            INSERT INTO _partition_rows SELECT * FROM moved
+        """), bounds).rowcount
+
+        self.session.execute(text(
+            f'CREATE TABLE "{name}" PARTITION OF "{table}" '
+            f"FOR VALUES FROM ('{start.isoformat()}') TO ('{end.isoformat()}')"
+        ))
+        if moved:
+            self.session.execute(text(f'INSERT INTO "{table}" SELECT * FROM _partition_rows'))
+        self.session.execute(text('DROP TABLE _partition_rows'))
+
+        # Commit each month so its locks on the default partition are released
+        self.session.commit()
+        return moved
+
+    def drop_partitions_before(self, table: str, cutoff: datetime) -> list[str]:
+        """Drop partitions whose whole month is older than cutoff.
+
+        Args:
+            table: Partitioned parent table name
+            cutoff: Rows older than this are past retention
+
+        Returns:
+            Names of partitions dropped
+        """
+        dropped = []
+        for name, start in self.list_partitions(table):
+            end = _month_start(start.year, start.month + 1)
+            if end > cutoff:
+                break
+            self.session.execute(text(f'DROP TABLE "{name}"'))
+            dropped.append(name)
+
+        self.session.commit()
+        return dropped
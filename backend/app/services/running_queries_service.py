@@ -1,12 +1,12 @@
 """Service for querying running query snapshots."""
 from datetime import datetime, timezone, timedelta
-from typing import Optional
+from typing import Iterator, Optional
 from uuid import UUID
 
-from sqlalchemy import desc
+from sqlalchemy import and_, bindparam, desc, func, select
 from sqlalchemy.orm import Session
 
-from app.models.tenant import Server, RunningQuerySnapshot
+from app.models.tenant import Server, RunningQuerySnapshot, RunningQueryHourly
 
 
 # Time range definitions in hours
@@ -18,6 +18,63 @@ TIME_RANGES = {
     '30d': 720,
 }
 
+# Pre-built window per range so requests don't allocate a timedelta each
+_TIME_RANGES_DELTA = {key: timedelta(hours=hours) for key, hours in TIME_RANGES.items()}
+_DEFAULT_RANGE_DELTA = _TIME_RANGES_DELTA['1h']
+
+# Columns read for API responses; rows are serialized straight from these
+# tuples instead of hydrating RunningQuerySnapshot objects
+SNAPSHOT_COLUMNS = (
+    RunningQuerySnapshot.id,
+    RunningQuerySnapshot.server_id,
+    RunningQuerySnapshot.collected_at,
+    RunningQuerySnapshot.session_id,
+    RunningQuerySnapshot.request_id,
+    RunningQuerySnapshot.database_name,
+    RunningQuerySnapshot.login_name,
+    RunningQuerySnapshot.host_name,
+    RunningQuerySnapshot.program_name,
+    RunningQuerySnapshot.query_text,
+    RunningQuerySnapshot.start_time,
+    RunningQuerySnapshot.duration_ms,
+    RunningQuerySnapshot.status,
+    RunningQuerySnapshot.wait_type,
+    RunningQuerySnapshot.wait_time_ms,
+    RunningQuerySnapshot.blocking_session_id,
+    RunningQuerySnapshot.cpu_time_ms,
+    RunningQuerySnapshot.logical_reads,
+    RunningQuerySnapshot.physical_reads,
+    RunningQuerySnapshot.writes,
+)
+
+# Built once at import; only bound parameters change between calls
+_STMT_RANGE = select(*SNAPSHOT_COLUMNS).where(
+    RunningQuerySnapshot.server_id == bindparam('sid'),
+    RunningQuerySnapshot.collected_at >= bindparam('start'),
+).order_by(desc(RunningQuerySnapshot.collected_at)).limit(bindparam('lim'))
+
+# Every query from a server's most recent collection, in one round trip
+_STMT_LATEST = select(*SNAPSHOT_COLUMNS).where(
+    RunningQuerySnapshot.server_id == bindparam('sid'),
+    RunningQuerySnapshot.collected_at == select(
+        func.max(RunningQuerySnapshot.collected_at)
+    ).where(
+        RunningQuerySnapshot.server_id == bindparam('sid')
+    ).scalar_subquery(),
+).order_by(desc(RunningQuerySnapshot.duration_ms))
+
+
+def snapshot_row_to_dict(row) -> dict:
+    """Convert a SNAPSHOT_COLUMNS row to the RunningQuerySnapshot.to_dict() shape."""
+    data = row._asdict()
+    data['id'] = str(data['id'])
+    data['server_id'] = str(data['server_id'])
+    collected_at = data['collected_at']
+    data['collected_at'] = collected_at.isoformat() if collected_at else None
+    start_time = data['start_time']
+    data['start_time'] = start_time.isoformat() if start_time else None
+    return data
+
 
 class RunningQueriesService:
     """Service for querying running query snapshots."""
@@ -36,7 +93,9 @@ class RunningQueriesService:
         self,
         server_id: UUID,
         time_range: str = '1h',
-        limit: int = 100
+        limit: int = 100,
+        *,
+        now: Optional[datetime] = None
     ) -> dict:
         """
         Get running query snapshots for a server within a time range.
@@ -45,6 +104,7 @@ class RunningQueriesService:
             server_id: Server UUID
             time_range: Time range (1h, 6h, 24h, 7d, 30d)
             limit: Maximum number of records to return
+            now: Reference time for the window (defaults to current UTC time)
 
         Returns:
             Dictionary with query snapshots data
@@ -52,21 +112,21 @@ class RunningQueriesService:
         server = self._get_server(server_id)
 
         # Get time range in hours
-        hours = TIME_RANGES.get(time_range, 1)
-        start_time = datetime.now(timezone.utc) - timedelta(hours=hours)
+        now = now or datetime.now(timezone.utc)
+        start_time = now - _TIME_RANGES_DELTA.get(time_range, _DEFAULT_RANGE_DELTA)
 
         # Query snapshots
-        snapshots = self.session.query(RunningQuerySnapshot).filter(
-            RunningQuerySnapshot.server_id == server_id,
-            RunningQuerySnapshot.collected_at >= start_time
-        ).order_by(desc(RunningQuerySnapshot.collected_at)).limit(limit).all()
+        rows = self.session.execute(
+            _STMT_RANGE,
+            {'sid': server_id, 'start': start_time, 'lim': limit}
+        ).all()
 
         return {
             'server_id': str(server_id),
             'server_name': server.name if server else None,
             'time_range': time_range,
-            'total': len(snapshots),
-            'queries': [q.to_dict() for q in snapshots]
+            'total': len(rows),
+            'queries': [snapshot_row_to_dict(row) for row in rows]
         }
 
     def get_latest_queries(self, server_id: UUID) -> dict:
@@ -83,109 +143,167 @@ class RunningQueriesService:
         """
         server = self._get_server(server_id)
 
-        # Find the most recent collected_at time
-        latest_snapshot = self.session.query(RunningQuerySnapshot).filter(
-            RunningQuerySnapshot.server_id == server_id
-        ).order_by(desc(RunningQuerySnapshot.collected_at)).first()
+        rows = self.session.execute(_STMT_LATEST, {'sid': server_id}).all()
+        collected_at = rows[0].collected_at if rows else None
+
+        return {
+            'server_id': str(server_id),
+            'server_name': server.name if server else None,
+            'collected_at': collected_at.isoformat() if collected_at else None,
+            'total': len(rows),
+            'queries': [snapshot_row_to_dict(row) for row in rows]
+        }
+
+    def get_latest_queries_bulk(self, server_ids: list[UUID]) -> dict[str, dict]:
+        """
+        Get the most recent running query snapshots for several servers.
+
+        Equivalent to calling get_latest_queries() per server, but resolves
+        every server's latest collection in a single statement instead of
+        two round trips per server.
 
-        if not latest_snapshot:
-            return {
+        Args:
+            server_ids: Server UUIDs
+
+        Returns:
+            Dictionary mapping server ID string to its latest query snapshots
+        """
+        server_ids = list(dict.fromkeys(server_ids))
+        if not server_ids:
+            return {}
+
+        servers = self.session.query(Server.id, Server.name).filter(
+            Server.id.in_(server_ids),
+            Server.is_deleted == False
+        ).all()
+        server_names = {row.id: row.name for row in servers}
+
+        latest = select(
+            RunningQuerySnapshot.server_id,
+            func.max(RunningQuerySnapshot.collected_at).label('collected_at'),
+        ).where(
+            RunningQuerySnapshot.server_id.in_(server_ids)
+        ).group_by(RunningQuerySnapshot.server_id).subquery()
+
+        rows = self.session.execute(
+            select(*SNAPSHOT_COLUMNS).join(
+                latest,
+                and_(
+                    RunningQuerySnapshot.server_id == latest.c.server_id,
+                    RunningQuerySnapshot.collected_at == latest.c.collected_at,
+                )
+            ).order_by(desc(RunningQuerySnapshot.duration_ms))
+        ).all()
+
+        result = {
+            str(server_id): {
                 'server_id': str(server_id),
-                'server_name': server.name if server else None,
+                'server_name': server_names.get(server_id),
                 'collected_at': None,
                 'total': 0,
                 'queries': []
             }
-
-        # Get all queries from that collection time
-        collected_at = latest_snapshot.collected_at
-        snapshots = self.session.query(RunningQuerySnapshot).filter(
-            RunningQuerySnapshot.server_id == server_id,
-            RunningQuerySnapshot.collected_at == collected_at
-        ).order_by(desc(RunningQuerySnapshot.duration_ms)).all()
-
-        return {
-            'server_id': str(server_id),
-            'server_name': server.name if server else None,
-            'collected_at': collected_at.isoformat() if collected_at else None,
-            'total': len(snapshots),
-            'queries': [q.to_dict() for q in snapshots]
+            for server_id in server_ids
         }
+        for row in rows:
+            entry = result[str(row.server_id)]
+            entry['queries'].append(snapshot_row_to_dict(row))
+            entry['collected_at'] = row.collected_at.isoformat()
+            entry['total'] += 1
 
-    def get_query_count(self, server_id: UUID, hours: int = 24) -> int:
+        return result
+
+    def get_query_count(
+        self,
+        server_id: UUID,
+        hours: int = 24,
+        *,
+        now: Optional[datetime] = None
+    ) -> int:
         """
         Get count of running query snapshots for a server within time range.
 
+        Whole hours are summed from the running_query_hourly rollup; only the
+        leading partial hour of the window is counted from raw snapshots.
+
         Args:
             server_id: Server UUID
             hours: Number of hours to look back
+            now: Reference time for the window (defaults to current UTC time)
 
         Returns:
             Count of snapshots
         """
-        start_time = datetime.now(timezone.utc) - timedelta(hours=hours)
+        now = now or datetime.now(timezone.utc)
+        start_time = now - timedelta(hours=hours)
 
-        from sqlalchemy import func
-        count = self.session.query(func.count(RunningQuerySnapshot.id)).filter(
-            RunningQuerySnapshot.server_id == server_id,
-            RunningQuerySnapshot.collected_at >= start_time
+        # First hour boundary at or after the window start
+        first_hour = start_time.replace(minute=0, second=0, microsecond=0)
+        if first_hour < start_time:
+            first_hour += timedelta(hours=1)
+
+        rolled_up = self.session.query(func.sum(RunningQueryHourly.snapshot_count)).filter(
+            RunningQueryHourly.server_id == server_id,
+            RunningQueryHourly.hour >= first_hour
         ).scalar()
 
-        return count or 0
+        partial = 0
+        if first_hour > start_time:
+            partial = self.session.query(func.count(RunningQuerySnapshot.id)).filter(
+                RunningQuerySnapshot.server_id == server_id,
+                RunningQuerySnapshot.collected_at >= start_time,
+                RunningQuerySnapshot.collected_at < first_hour
+            ).scalar()
 
-    def get_all_running_queries(
+        return int(rolled_up or 0) + (partial or 0)
+
+    def iter_all_running_queries(
         self,
         server_id: Optional[UUID] = None,
         time_range: str = '1h',
-        limit: int = 500
-    ) -> dict:
+        limit: int = 500,
+        batch_size: int = 100,
+        *,
+        now: Optional[datetime] = None
+    ) -> Iterator[dict]:
         """
-        Get running query snapshots across all servers or filtered by server.
+        Stream running query snapshots across all servers or filtered by server.
+
+        Server names are joined in the query and rows are fetched with a
+        server-side cursor in batches, so callers can serialize them without
+        materializing the full list.
 
         Args:
             server_id: Optional server UUID to filter by
             time_range: Time range (1h, 6h, 24h, 7d, 30d)
             limit: Maximum number of records to return
+            batch_size: Rows fetched per round trip
+            now: Reference time for the window (defaults to current UTC time)
 
-        Returns:
-            Dictionary with query snapshots and server info
+        Yields:
+            Snapshot dictionaries including server_name
         """
-        hours = TIME_RANGES.get(time_range, 1)
-        start_time = datetime.now(timezone.utc) - timedelta(hours=hours)
-
-        # Build base query
-        query = self.session.query(RunningQuerySnapshot).filter(
+        now = now or datetime.now(timezone.utc)
+        start_time = now - _TIME_RANGES_DELTA.get(time_range, _DEFAULT_RANGE_DELTA)
+
+        query = self.session.query(RunningQuerySnapshot, Server.name).outerjoin(
+            Server,
+            and_(
+                Server.id == RunningQuerySnapshot.server_id,
+                Server.is_deleted == False
+            )
+        ).filter(
             RunningQuerySnapshot.collected_at >= start_time
         )
 
-        # Filter by server if provided
         if server_id:
             query = query.filter(RunningQuerySnapshot.server_id == server_id)
 
-        # Order and limit
-        snapshots = query.order_by(
+        query = query.order_by(
             desc(RunningQuerySnapshot.collected_at)
-        ).limit(limit).all()
-
-        # Get server info for all unique server_ids
-        server_ids = list(set(s.server_id for s in snapshots))
-        servers = self.session.query(Server).filter(
-            Server.id.in_(server_ids),
-            Server.is_deleted == False
-        ).all() if server_ids else []
-        server_map = {s.id: s for s in servers}
+        ).limit(limit).yield_per(batch_size)
 
-        # Build response with server info included
-        queries = []
-        for snapshot in snapshots:
+        for snapshot, server_name in query:
             data = snapshot.to_dict()
-            server = server_map.get(snapshot.server_id)
-            data['server_name'] = server.name if server else None
-            queries.append(data)
-
-        return {
-            'time_range': time_range,
-            'server_id': str(server_id) if server_id else None,
-            'total': len(snapshots),
-            'queries': queries
-        }
+            data['server_name'] = server_name
+            yield data
@@ -1,11 +1,19 @@
 """Job scheduler service for executing scheduled jobs across tenants."""
 import logging
+import multiprocessing
+import signal
+import threading
+import time
+from contextlib import contextmanager
 from datetime import datetime, timezone, timedelta
-from concurrent.futures import ThreadPoolExecutor, TimeoutError as FuturesTimeoutError
-from typing import Optional, Callable
+from functools import lru_cache
+from multiprocessing.pool import Pool
+from types import SimpleNamespace
+from typing import Literal, Optional, Callable
 from uuid import UUID
 
 from croniter import croniter
+from sqlalchemy import bindparam, func, select, update, insert
 from sqlalchemy.orm import Session
 
 from app.models.tenant import Job, JobExecution
@@ -16,16 +24,117 @@ logger = logging.getLogger(__name__)
 # Default configuration
 DEFAULT_CONCURRENCY_LIMIT = 5
 DEFAULT_TIMEOUT_SECONDS = 1800  # 30 minutes
+DEFAULT_CLAIM_BATCH_SIZE = 50
+
+# Handler kinds: 'io' handlers run on the calling thread with the live
+# context, 'cpu' handlers in worker processes that are killed on timeout
+HANDLER_KIND_IO = 'io'
+HANDLER_KIND_CPU = 'cpu'
+HandlerKind = Literal['io', 'cpu']
+
+# Worker processes are spawned rather than forked so they don't inherit the
+# scheduler's threads, held locks or open database connections
+_process_context = multiprocessing.get_context('spawn')
+
+# Parsed cron schedules are shared across threads; croniter instances are
+# stateful, so advancing one must happen under this lock
+_cron_lock = threading.Lock()
+
+# Due-job statements are built once at import and take the time and batch
+# size as bound parameters; the where clause matches the ix_jobs_due
+# partial index predicate
+_DUE_JOBS_STMT = (
+    select(Job)
+    .where(Job.next_run_at <= bindparam('now'), Job.is_enabled == True)
+    .order_by(Job.next_run_at)
+)
+_CLAIM_DUE_JOBS_STMT = (
+    _DUE_JOBS_STMT
+    .limit(bindparam('limit'))
+    .with_for_update(skip_locked=True)
+)
+
+
+@lru_cache(maxsize=4096)
+def _parsed_cron(expression: str) -> croniter:
+    """Parse a cron expression once and cache the schedule in process."""
+    return croniter(expression)
+
+
+class _JobTimeout(TimeoutError):
+    """Raised by the executor when a job exceeds its timeout.
+
+    Kept distinct from TimeoutError so timeouts raised by the handler itself,
+    such as socket or ODBC timeouts, are reported as ordinary failures.
+    """
 
 
 class JobExecutionContext:
-    """Context for a job execution."""
+    """Context for a job execution.
+
+    Handlers running on a worker thread can't be interrupted, so long-running
+    ones should call `check_timeout()` between units of work.
+    """
 
     def __init__(self, job: Job, execution: JobExecution, session: Session, tenant_slug: str):
         self.job = job
         self.execution = execution
         self.session = session
         self.tenant_slug = tenant_slug
+        # time.monotonic() value the execution must finish by, set by the executor
+        self.deadline: Optional[float] = None
+
+    def check_timeout(self):
+        """Raise _JobTimeout once the execution is past its deadline."""
+        if self.deadline is not None and time.monotonic() >= self.deadline:
+            raise _JobTimeout()
+
+
+class DetachedJobContext:
+    """Picklable job context for handlers run in a worker process.
+
+    Carries a snapshot of the job's identifying fields and configuration
+    instead of ORM objects. There is no session; handlers that need the
+    database open their own from `tenant_slug`.
+    """
+
+    def __init__(self, context: JobExecutionContext):
+        job = context.job
+        self.job = SimpleNamespace(
+            id=job.id,
+            name=job.name,
+            type=job.type,
+            configuration=dict(job.configuration or {}),
+        )
+        self.execution_id = context.execution.id if context.execution else None
+        self.tenant_slug = context.tenant_slug
+        self.session = None
+
+
+def _alarm_available() -> bool:
+    """Check if SIGALRM-based timeouts can be used from the current thread."""
+    return (
+        hasattr(signal, 'setitimer')
+        and threading.current_thread() is threading.main_thread()
+    )
+
+
+@contextmanager
+def alarm_timeout(seconds: float):
+    """Raise _JobTimeout in the current thread after `seconds`.
+
+    Uses SIGALRM, so it only works in the main thread on Unix.
+    """
+    def _raise_timeout(signum, frame):
+        raise _JobTimeout()
+
+    previous = signal.signal(signal.SIGALRM, _raise_timeout)
+    signal.setitimer(signal.ITIMER_REAL, seconds)
+    try:
+        yield
+    finally:
+        signal.setitimer(signal.ITIMER_REAL, 0)
+        signal.signal(signal.SIGALRM, previous)
 
 
 class SchedulerService:
@@ -33,6 +142,19 @@ class SchedulerService:
 
     def __init__(self, session: Session):
         self.session = session
+        # next_run_at of each claimed job before claiming, for release_jobs()
+        self.claimed_due_at: dict[UUID, datetime] = {}
+
+    def rebind(self, session: Session) -> None:
+        """Point the service at a new session, e.g. the next tick's.
+
+        Claims tracked for the previous session are forgotten.
+
+        Args:
+            session: SQLAlchemy session to use from now on
+        """
+        self.session = session
+        self.claimed_due_at.clear()
 
     def get_due_jobs(self) -> list[Job]:
         """Get all jobs that are due to run.
@@ -43,10 +165,62 @@ class SchedulerService:
         """
         now = datetime.now(timezone.utc)
 
-        return self.session.query(Job).filter(
-            Job.next_run_at <= now,
-            Job.is_enabled == True
-        ).order_by(Job.next_run_at).all()
+        return self.session.execute(_DUE_JOBS_STMT, {'now': now}).scalars().all()
+
+    def get_next_run_time(self) -> Optional[datetime]:
+        """Get the earliest next_run_at across enabled jobs.
+
+        Returns:
+            Earliest scheduled run time, or None if nothing is scheduled
+        """
+        return self.session.execute(
+            select(func.min(Job.next_run_at)).where(
+                Job.is_enabled == True,
+                Job.next_run_at.isnot(None)
+            )
+        ).scalar()
+
+    def claim_due_jobs(self, batch_size: int = DEFAULT_CLAIM_BATCH_SIZE) -> list[Job]:
+        """Claim a batch of due jobs for execution.
+
+        Due rows are locked with FOR UPDATE SKIP LOCKED so concurrent workers
+        never claim the same job, and their last_run_at/next_run_at are
+        advanced in a single bulk UPDATE before the transaction commits.
+        Claimed jobs therefore don't need update_job_after_execution().
+
+        Args:
+            batch_size: Maximum number of jobs to claim
+
+        Returns:
+            Claimed jobs, ordered by their original next_run_at; jobs
+            deleted between the claim and the reload are left out
+        """
+        now = datetime.now(timezone.utc)
+
+        jobs = self.session.execute(
+            _CLAIM_DUE_JOBS_STMT, {'now': now, 'limit': batch_size}
+        ).scalars().all()
+
+        if not jobs:
+            self.session.commit()
+            return []
+
+        self.claimed_due_at.update((job.id, job.next_run_at) for job in jobs)
+
+        # Cron schedules need Python to compute next_run_at, so build the
+        # mappings in a loop and write them back in one statement
+        self.session.execute(update(Job), [
+            {
+                'id': job.id,
+                'last_run_at': now,
+                'next_run_at': self.calculate_next_run(job),
+            }
+            for job in jobs
+        ])
+        job_ids = [job.id for job in jobs]
+        self.session.commit()
+
+        return self._reload(Job, job_ids)
 
     def create_execution(self, job: Job, server_id: Optional[UUID] = None) -> JobExecution:
         """Create a new job execution record.
@@ -69,6 +243,71 @@ class SchedulerService:
 
         return execution
 
+    def create_executions(self, jobs: list[Job]) -> list[JobExecution]:
+        """Create 'running' execution records for a batch of jobs.
+
+        Inserts all rows with a single INSERT ... RETURNING and one commit.
+
+        Args:
+            jobs: The jobs about to be executed
+
+        Returns:
+            Created executions, in the same order as jobs; jobs deleted in
+            the meantime have none, so match them up by job_id
+        """
+        if not jobs:
+            return []
+
+        started_at = datetime.now(timezone.utc)
+        job_ids = [job.id for job in jobs]
+        executions = self.session.execute(
+            insert(JobExecution).returning(JobExecution),
+            [
+                {
+                    'job_id': job_id,
+                    'status': JobExecution.STATUS_RUNNING,
+                    'started_at': started_at,
+                }
+                for job_id in job_ids
+            ]
+        ).scalars().all()
+        execution_ids = [execution.id for execution in executions]
+        self.session.commit()
+
+        # Reload both batches so the caller's jobs stay populated too
+        self._reload(Job, job_ids)
+        by_job_id = {execution.job_id: execution for execution in self._reload(JobExecution, execution_ids)}
+        return [by_job_id[job_id] for job_id in job_ids if job_id in by_job_id]
+
+    def release_jobs(self, jobs: list[Job], executions: list[JobExecution]) -> None:
+        """Hand claimed jobs that were never started back to the scheduler.
+
+        Restores each job's pre-claim next_run_at so any worker can claim it
+        again, and marks its execution cancelled, in one commit.
+
+        Args:
+            jobs: Jobs claimed by this service but not executed
+            executions: Their execution records, in the same order
+        """
+        if not jobs:
+            return
+
+        now = datetime.now(timezone.utc)
+        self.session.execute(update(Job), [
+            {'id': job.id, 'next_run_at': self.claimed_due_at.get(job.id, now)}
+            for job in jobs
+        ])
+        self.session.execute(update(JobExecution), [
+            {
+                'id': execution.id,
+                'status': JobExecution.STATUS_CANCELLED,
+                'completed_at': now,
+                'error_message': 'Released before start',
+            }
+            for execution in executions
+        ])
+        self.session.commit()
+
     def complete_execution(
         self,
         execution: JobExecution,
@@ -95,6 +334,56 @@ class SchedulerService:
         self.session.commit()
         return execution
 
+    def complete_executions(
+        self,
+        results: list[tuple[UUID, bool, Optional[dict], Optional[str]]]
+    ) -> None:
+        """Mark a batch of executions as complete with a single UPDATE.
+
+        Args:
+            results: (execution_id, success, result, error_message) tuples
+        """
+        if not results:
+            return
+
+        completed_at = datetime.now(timezone.utc)
+        self.session.execute(update(JobExecution), [
+            {
+                'id': execution_id,
+                'status': JobExecution.STATUS_SUCCESS if success else JobExecution.STATUS_FAILED,
+                'completed_at': completed_at,
+                'result': result,
+                'error_message': error_message,
+            }
+            for execution_id, success, result, error_message in results
+        ])
+        self.session.commit()
+
+    def _reload(self, model, ids: list[UUID]) -> list:
+        """Reload rows expired by a commit with a single IN query.
+
+        Without this, each object would be refreshed lazily with its own
+        SELECT the first time one of its attributes is read.
+
+        Args:
+            model: Mapped class to load
+            ids: Primary keys, in the order to return
+
+        Returns:
+            Loaded objects, in the same order as ids; rows deleted since
+            the ids were read (e.g. a job removed through the API) are
+            left out
+        """
+        if not ids:
+            return []
+        by_id = {
+            obj.id: obj
+            for obj in self.session.execute(
+                select(model).where(model.id.in_(ids))
+            ).scalars()
+        }
+        return [by_id[id_] for id_ in ids if id_ in by_id]
+
     def calculate_next_run(self, job: Job) -> Optional[datetime]:
         """Calculate the next run time for a job based on its schedule.
 
@@ -121,8 +410,10 @@ class SchedulerService:
             # Cron-based scheduling
             expression = schedule_config.get('expression', '0 * * * *')  # Default: every hour
             try:
-                cron = croniter(expression, now)
-                return cron.get_next(datetime)
+                with _cron_lock:
+                    cron = _parsed_cron(expression)
+                    cron.set_current(now, force=True)
+                    return cron.get_next(datetime)
             except (ValueError, KeyError) as e:
                 logger.error(f"Invalid cron expression for job {job.id}: {expression} - {e}")
                 return None
@@ -157,19 +448,70 @@ class JobExecutor:
         max_workers: int = DEFAULT_CONCURRENCY_LIMIT,
         default_timeout: int = DEFAULT_TIMEOUT_SECONDS
     ):
-        self.executor = ThreadPoolExecutor(max_workers=max_workers)
         self.default_timeout = default_timeout
         self.handlers: dict[str, Callable[[JobExecutionContext], dict]] = {}
+        self.handler_kinds: dict[str, HandlerKind] = {}
+        self._max_workers = max_workers
+        self._idle_workers: list[Pool] = []
+        self._workers_lock = threading.Lock()
+        self._closed = False
 
-    def register_handler(self, job_type: str, handler: Callable[[JobExecutionContext], dict]):
+    def register_handler(
+        self,
+        job_type: str,
+        handler: Callable[[JobExecutionContext], dict],
+        kind: HandlerKind = HANDLER_KIND_IO
+    ):
         """Register a handler for a specific job type.
 
         Args:
             job_type: The job type (e.g., 'policy_execution', 'data_collection')
             handler: Function that takes JobExecutionContext and returns result dict
+            kind: 'io' to run on the calling thread with the live context,
+                or 'cpu' to run in a worker process that is terminated on
+                timeout; 'cpu' handlers must be module-level functions and
+                receive a DetachedJobContext
         """
+        if kind not in (HANDLER_KIND_IO, HANDLER_KIND_CPU):
+            raise ValueError(f"Invalid handler kind: {kind}")
         self.handlers[job_type] = handler
-        logger.info(f"Registered handler for job type: {job_type}")
+        self.handler_kinds[job_type] = kind
+        logger.info(f"Registered {kind} handler for job type: {job_type}")
+
+    def _checkout_worker(self) -> Pool:
+        """Take an idle single-process worker, starting a new one if none is free."""
+        with self._workers_lock:
+            if self._idle_workers:
+                return self._idle_workers.pop()
+        return _process_context.Pool(processes=1)
+
+    def _checkin_worker(self, worker: Pool):
+        """Return a worker for reuse, or close it if enough are already idle."""
+        with self._workers_lock:
+            if not self._closed and len(self._idle_workers) < self._max_workers:
+                self._idle_workers.append(worker)
+                return
+        worker.close()
+
+    def _execute_in_process(self, handler, context: JobExecutionContext, timeout: float) -> dict:
+        """Run a handler in a worker process, terminating that process on timeout.
+
+        Each job has a single-process worker to itself, so a timeout kills
+        only the timed-out job and leaves other jobs' workers running.
+        """
+        worker = self._checkout_worker()
+        async_result = worker.apply_async(handler, (DetachedJobContext(context),))
+        try:
+            result = async_result.get(timeout=timeout)
+        except multiprocessing.TimeoutError:
+            worker.terminate()
+            raise _JobTimeout() from None
+        except Exception:
+            # The handler raised; its worker process is still usable
+            self._checkin_worker(worker)
+            raise
+        self._checkin_worker(worker)
+        return result
 
     def execute(
         self,
@@ -195,11 +537,24 @@ class JobExecutor:
             return False, None, error_msg
 
         try:
-            future = self.executor.submit(handler, context)
-            result = future.result(timeout=timeout)
+            if self.handler_kinds.get(job.type) == HANDLER_KIND_CPU:
+                result = self._execute_in_process(handler, context, timeout)
+                return True, result, None
+
+            context.deadline = time.monotonic() + timeout
+            if _alarm_available():
+                # Run inline so the alarm interrupts the handler itself
+                with alarm_timeout(timeout):
+                    result = handler(context)
+            else:
+                # Signals only reach the main thread and threads can't be
+                # killed: the handler checks the deadline itself, and a run
+                # that finishes past it is still reported as timed out
+                result = handler(context)
+                context.check_timeout()
             return True, result, None
 
-        except FuturesTimeoutError:
+        except _JobTimeout:
             error_msg = f"Job execution timed out after {timeout} seconds"
             logger.error(f"Job {job.id} ({job.name}): {error_msg}")
             return False, None, error_msg
@@ -213,9 +568,15 @@ class JobExecutor:
         """Shutdown the executor.
 
         Args:
-            wait: Whether to wait for pending jobs to complete
+            wait: Whether to wait for idle worker processes to exit
         """
-        self.executor.shutdown(wait=wait)
+        with self._workers_lock:
+            self._closed = True
+            workers, self._idle_workers = self._idle_workers, []
+        for worker in workers:
+            worker.close()
+            if wait:
+                worker.join()
 
 
 # ============== Default Job Handlers ==============
@@ -2,12 +2,26 @@
 from typing import Optional
 from uuid import UUID
 from dataclasses import dataclass
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
 from app.models.tenant import Server
 from app.repositories.server_repository import ServerRepository
 from app.core.encryption import encrypt_password
 
+_VALID_AUTH_TYPES_STR = ', '.join(Server.VALID_AUTH_TYPES)
+
+# Input fields normalized with strip(); passwords are kept verbatim
+_STRIPPED_FIELDS = ('name', 'hostname', 'instance_name', 'username')
+
+
+def _strip_fields(input) -> None:
+    """Strip surrounding whitespace from string input fields in place."""
+    for field_name in _STRIPPED_FIELDS:
+        value = getattr(input, field_name)
+        if isinstance(value, str):
+            setattr(input, field_name, value.strip())
+
 
 class ServerValidationError(Exception):
     """Raised when server validation fails."""
@@ -33,6 +47,9 @@ class CreateServerInput:
     username: Optional[str] = None
     password: Optional[str] = None
 
+    def __post_init__(self):
+        _strip_fields(self)
+
 
 @dataclass
 class UpdateServerInput:
@@ -45,6 +62,9 @@ class UpdateServerInput:
     username: Optional[str] = None
     password: Optional[str] = None
 
+    def __post_init__(self):
+        _strip_fields(self)
+
 
 class ServerService:
     """Service for server management operations."""
@@ -69,16 +89,20 @@ class ServerService:
         self._validate_create(input)
 
         server = Server(
-            name=input.name.strip(),
-            hostname=input.hostname.strip(),
+            name=input.name,
+            hostname=input.hostname,
             port=input.port,
-            instance_name=input.instance_name.strip() if input.instance_name else None,
+            instance_name=input.instance_name or None,
             auth_type=input.auth_type,
-            username=input.username.strip() if input.username else None,
+            username=input.username or None,
             encrypted_password=encrypt_password(input.password) if input.password else None,
         )
 
-        return self.repository.create(server)
+        try:
+            return self.repository.create(server)
+        except IntegrityError as e:
+            self._raise_if_name_conflict(e)
+            raise
 
     def update(self, server_id: UUID, input: UpdateServerInput) -> Server:
         """Update an existing server."""
@@ -86,33 +110,43 @@ class ServerService:
         self._validate_update(input, server)
 
         if input.name is not None:
-            server.name = input.name.strip()
+            server.name = input.name
         if input.hostname is not None:
-            server.hostname = input.hostname.strip()
+            server.hostname = input.hostname
         if input.port is not None:
             server.port = input.port
         if input.instance_name is not None:
-            server.instance_name = input.instance_name.strip() if input.instance_name else None
+            server.instance_name = input.instance_name or None
         if input.auth_type is not None:
             server.auth_type = input.auth_type
         if input.username is not None:
-            server.username = input.username.strip() if input.username else None
+            server.username = input.username or None
         if input.password is not None:
             server.encrypted_password = encrypt_password(input.password) if input.password else None
 
-        return self.repository.update(server)
+        try:
+            return self.repository.update(server)
+        except IntegrityError as e:
+            self._raise_if_name_conflict(e)
+            raise
 
     def delete(self, server_id: UUID) -> None:
         """Soft delete a server."""
         server = self.get_by_id(server_id)
         self.repository.soft_delete(server)
 
+    def _raise_if_name_conflict(self, error: IntegrityError) -> None:
+        """Translate a unique name index violation into a validation error."""
+        if Server.NAME_UNIQUE_INDEX in str(error.orig):
+            self.session.rollback()
+            raise ServerValidationError("Server with this name already exists", "name")
+
     def _validate_create(self, input: CreateServerInput) -> None:
         """Validate input for creating a server."""
-        if not input.name or not input.name.strip():
+        if not input.name:
             raise ServerValidationError("Name is required", "name")
 
-        if not input.hostname or not input.hostname.strip():
+        if not input.hostname:
             raise ServerValidationError("Hostname is required", "hostname")
 
         if not input.auth_type:
@@ -120,32 +154,26 @@ class ServerService:
 
         if input.auth_type not in Server.VALID_AUTH_TYPES:
             raise ServerValidationError(
-                f"Invalid auth type. Must be one of: {', '.join(Server.VALID_AUTH_TYPES)}",
+                f"Invalid auth type. Must be one of: {_VALID_AUTH_TYPES_STR}",
                 "auth_type"
             )
 
         if input.auth_type == Server.AUTH_TYPE_SQL:
-            if not input.username or not input.username.strip():
+            if not input.username:
                 raise ServerValidationError("Username is required for SQL authentication", "username")
 
-        if self.repository.name_exists(input.name.strip()):
-            raise ServerValidationError("Server with this name already exists", "name")
-
     def _validate_update(self, input: UpdateServerInput, server: Server) -> None:
         """Validate input for updating a server."""
-        if input.name is not None:
-            if not input.name.strip():
-                raise ServerValidationError("Name cannot be empty", "name")
-            if self.repository.name_exists(input.name.strip(), exclude_id=server.id):
-                raise ServerValidationError("Server with this name already exists", "name")
+        if input.name is not None and not input.name:
+            raise ServerValidationError("Name cannot be empty", "name")
 
-        if input.hostname is not None and not input.hostname.strip():
+        if input.hostname is not None and not input.hostname:
             raise ServerValidationError("Hostname cannot be empty", "hostname")
 
         if input.auth_type is not None:
             if input.auth_type not in Server.VALID_AUTH_TYPES:
                 raise ServerValidationError(
-                    f"Invalid auth type. Must be one of: {', '.join(Server.VALID_AUTH_TYPES)}",
+                    f"Invalid auth type. Must be one of: {_VALID_AUTH_TYPES_STR}",
                     "auth_type"
                 )
 
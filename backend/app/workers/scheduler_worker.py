@@ -15,14 +15,27 @@ Or import and run programmatically:
     worker.start()
 """
 import logging
+import queue
+import random
 import signal
 import sys
 import time
-from datetime import datetime, timezone
-from threading import Event
-
-from apscheduler.schedulers.background import BackgroundScheduler
-from apscheduler.triggers.interval import IntervalTrigger
+from collections import deque
+from concurrent.futures import Future, wait
+from datetime import datetime, timezone, timedelta
+from threading import Event, Lock, Thread
+from typing import Optional
+
+from app import create_app
+from app.core.tenant_manager import tenant_manager
+from app.extensions import db
+from app.models.system import Tenant
+from app.services.scheduler_service import (
+    DEFAULT_CLAIM_BATCH_SIZE,
+    JobExecutionContext,
+    SchedulerService,
+    create_default_executor,
+)
 
 # Setup logging
 logging.basicConfig(
@@ -31,6 +44,17 @@ logging.basicConfig(
 )
 logger = logging.getLogger('scheduler_worker')
 
+# Upper bound on a tenant's next_job_at hint, so a stale hint is re-checked
+TENANT_RECHECK_INTERVAL = timedelta(minutes=5)
+
+# Poll interval adapts to load: shrinks while ticks find jobs, grows while idle
+POLL_SPEEDUP_FACTOR = 0.5
+POLL_BACKOFF_FACTOR = 1.5
+POLL_JITTER = 0.1
+
+# Claimed jobs not started within this many seconds are handed back
+DEFAULT_LOCAL_QUEUE_TTL = 300
+
 
 class JobSchedulerWorker:
     """Background worker that polls and executes scheduled jobs."""
@@ -39,157 +63,298 @@ class JobSchedulerWorker:
         self,
         poll_interval_seconds: int = 30,
         max_workers: int = 5,
-        default_timeout: int = 1800
+        default_timeout: int = 1800,
+        min_poll_seconds: Optional[float] = None,
+        max_poll_seconds: Optional[float] = None,
+        local_queue_size: Optional[int] = None,
+        local_queue_ttl: float = DEFAULT_LOCAL_QUEUE_TTL
     ):
         """Initialize the scheduler worker.
 
         Args:
-            poll_interval_seconds: How often to poll for due jobs
+            poll_interval_seconds: Initial seconds between polls for due jobs
             max_workers: Maximum concurrent job executions
             default_timeout: Default job timeout in seconds
+            min_poll_seconds: Shortest poll interval while jobs keep arriving
+                (default: a sixth of poll_interval_seconds)
+            max_poll_seconds: Longest poll interval while idle
+                (default: twice poll_interval_seconds)
+            local_queue_size: Jobs claimed per tenant per round trip
+                (default: DEFAULT_CLAIM_BATCH_SIZE)
+            local_queue_ttl: Seconds a claimed job may wait locally before
+                it is released back to the database
         """
+
         self.poll_interval = poll_interval_seconds
+        self.min_poll_interval = min_poll_seconds or poll_interval_seconds / 6
+        self.max_poll_interval = max_poll_seconds or poll_interval_seconds * 2
         self.max_workers = max_workers
         self.default_timeout = default_timeout
+        self.local_queue_size = local_queue_size or DEFAULT_CLAIM_BATCH_SIZE
+        self.local_queue_ttl = local_queue_ttl
 
-        self.scheduler = None
         self.executor = None
         self.app = None
+        self._poll_thread = None
+        self._shards: list[queue.SimpleQueue] = []
+        self._shard_threads: list[Thread] = []
+        self._inflight_tenants: set[str] = set()
+        self._inflight_lock = Lock()
+        # One SchedulerService per tenant, rebound to each tick's session;
+        # a tenant is only ever processed on its own shard thread, so the
+        # cache needs no lock
+        self._services: dict[str, SchedulerService] = {}
+        self._next_interval = float(poll_interval_seconds)
         self._shutdown_event = Event()
 
     def create_app(self):
         """Create Flask app instance."""
-        # Import here to avoid circular imports
-        from app import create_app
         return create_app()
 
     def start(self):
         """Start the scheduler worker."""
         logger.info("Starting Job Scheduler Worker...")
 
-        # Create Flask app context
         self.app = self.create_app()
-
-        # Import services within app context
-        with self.app.app_context():
-            from app.services.scheduler_service import create_default_executor
-
-            self.executor = create_default_executor()
-
-            # Create APScheduler
-            self.scheduler = BackgroundScheduler()
-
-            # Add job checker
-            self.scheduler.add_job(
-                self._check_jobs,
-                IntervalTrigger(seconds=self.poll_interval),
-                id='job_checker',
-                name='Check for due jobs',
-                replace_existing=True,
-            )
-
-            # Start scheduler
-            self.scheduler.start()
-            logger.info(f"Scheduler started. Polling every {self.poll_interval} seconds.")
-
-            # Run initial check immediately
-            self._check_jobs()
+        self.executor = create_default_executor()
+
+        # Each shard thread drains its own queue of tenants; a tenant always
+        # hashes to the same shard, so there is no shared task queue
+        self._shards = [queue.SimpleQueue() for _ in range(self.max_workers)]
+        self._shard_threads = [
+            Thread(target=self._drain_shard, args=(i,), name=f'tenant-shard-{i}', daemon=True)
+            for i in range(self.max_workers)
+        ]
+        for thread in self._shard_threads:
+            thread.start()
+
+        # Poll loop runs the first check immediately
+        self._poll_thread = Thread(target=self._poll_loop, name='job_checker', daemon=True)
+        self._poll_thread.start()
+        logger.info(
+            f"Scheduler started. Polling every {self.min_poll_interval:g}-"
+            f"{self.max_poll_interval:g} seconds."
+        )
 
     def stop(self):
         """Stop the scheduler worker gracefully."""
         logger.info("Stopping Job Scheduler Worker...")
         self._shutdown_event.set()
 
-        if self.scheduler:
-            self.scheduler.shutdown(wait=True)
+        if self._poll_thread:
+            self._poll_thread.join()
             logger.info("Scheduler stopped.")
 
+        for shard in self._shards:
+            shard.put(None)
+        for thread in self._shard_threads:
+            thread.join()
+
         if self.executor:
             self.executor.shutdown(wait=True)
             logger.info("Executor stopped.")
 
-    def _check_jobs(self):
-        """Check for and execute due jobs across all tenants."""
+    def _poll_loop(self):
+        """Check for due jobs until shutdown, adapting the wait between checks."""
+        # One app context for the thread's lifetime rather than one per tick
+        with self.app.app_context():
+            while not self._shutdown_event.is_set():
+                found = self._check_jobs()
+                self._shutdown_event.wait(timeout=self._adapt_interval(found))
+
+    def _adapt_interval(self, found: int) -> float:
+        """Compute the wait before the next poll from the last tick's result.
+
+        Args:
+            found: Number of due jobs the last tick found
+
+        Returns:
+            Seconds to wait, with jitter so replicas don't poll in lockstep
+        """
+        factor = POLL_SPEEDUP_FACTOR if found else POLL_BACKOFF_FACTOR
+        self._next_interval = max(
+            self.min_poll_interval,
+            min(self.max_poll_interval, self._next_interval * factor)
+        )
+        return self._next_interval * (1 + random.uniform(-POLL_JITTER, POLL_JITTER))
+
+    def _check_jobs(self) -> int:
+        """Check for and execute due jobs across all tenants.
+
+        Returns:
+            Number of due jobs found
+        """
+        found = 0
         if self._shutdown_event.is_set():
-            return
+            return found
+
+        try:
+            # Only open sessions for tenants whose hint says a job may be due
+            tenants = Tenant.tenants_with_due_jobs(datetime.now(timezone.utc))
+            logger.debug(f"Checking {len(tenants)} tenants with due jobs")
+
+            futures = []
+            for tenant in tenants:
+                if self._shutdown_event.is_set():
+                    break
+
+                # A tenant still busy from an earlier tick is left to finish
+                with self._inflight_lock:
+                    if tenant.slug in self._inflight_tenants:
+                        continue
+                    self._inflight_tenants.add(tenant.slug)
 
+                future = Future()
+                self._shard_for(tenant.slug).put((tenant, tenant_manager, future))
+                futures.append(future)
+
+            # Don't let one slow tenant hold up the next tick
+            done, _ = wait(futures, timeout=self.poll_interval * 0.9)
+            found = sum(future.result() for future in done)
+
+        except Exception as e:
+            logger.exception(f"Error in job checker: {e}")
+        finally:
+            # Don't carry the system DB session across ticks
+            db.session.remove()
+
+        return found
+
+    def _shard_for(self, tenant_slug: str) -> queue.SimpleQueue:
+        """Get the shard queue that owns a tenant."""
+        return self._shards[hash(tenant_slug) % len(self._shards)]
+
+    def _drain_shard(self, index: int):
+        """Process tenants queued on one shard until a None sentinel arrives.
+
+        Args:
+            index: Shard index
+        """
+        shard = self._shards[index]
+        # Tenants this thread holds a session for
+        slugs = set()
         with self.app.app_context():
-            try:
-                from app.models.system import Tenant
-                from app.core.tenant_manager import tenant_manager
-                from app.models.tenant import Job
-                from app.services.scheduler_service import (
-                    SchedulerService,
-                    JobExecutionContext
-                )
-
-                # Get all active tenants
-                tenants = Tenant.query.filter_by(status='active').all()
-                logger.debug(f"Checking {len(tenants)} active tenants for due jobs")
-
-                for tenant in tenants:
-                    if self._shutdown_event.is_set():
-                        break
+            while True:
+                item = shard.get()
+                if item is None:
+                    break
 
-                    try:
-                        self._process_tenant_jobs(tenant, tenant_manager)
-                    except Exception as e:
-                        logger.error(f"Error processing jobs for tenant {tenant.slug}: {e}")
+                tenant, tenant_manager, future = item
+                slugs.add(tenant.slug)
+                if future.set_running_or_notify_cancel():
+                    future.set_result(self._run_tenant(tenant, tenant_manager))
 
-            except Exception as e:
-                logger.exception(f"Error in job checker: {e}")
+            for slug in slugs:
+                tenant_manager.get_session(slug).remove()
 
-    def _process_tenant_jobs(self, tenant, tenant_manager):
-        """Process due jobs for a specific tenant.
+    def _run_tenant(self, tenant, tenant_manager) -> int:
+        """Process a tenant's due jobs on its shard thread.
 
         Args:
             tenant: Tenant instance
             tenant_manager: TenantManager instance
+
+        Returns:
+            Number of due jobs claimed
         """
-        from app.models.tenant import Job
-        from app.services.scheduler_service import (
-            SchedulerService,
-            JobExecutionContext
-        )
+        try:
+            return self._process_tenant_jobs(tenant, tenant_manager)
+        except Exception as e:
+            logger.error(f"Error processing jobs for tenant {tenant.slug}: {e}")
+            return 0
+        finally:
+            db.session.remove()
+            with self._inflight_lock:
+                self._inflight_tenants.discard(tenant.slug)
+
+    def _process_tenant_jobs(self, tenant, tenant_manager) -> int:
+        """Process due jobs for a specific tenant.
+
+        Args:
+            tenant: Tenant instance
+            tenant_manager: TenantManager instance
 
+        Returns:
+            Number of due jobs claimed
+        """
         session = tenant_manager.get_session(tenant.slug)
 
         try:
-            service = SchedulerService(session)
-            due_jobs = service.get_due_jobs()
+            service = self._services.get(tenant.slug)
+            if service is None:
+                service = self._services[tenant.slug] = SchedulerService(session)
+            else:
+                service.rebind(session)
+            due_jobs = service.claim_due_jobs(batch_size=self.local_queue_size)
+            fetched_at = time.monotonic()
 
             if due_jobs:
                 logger.info(f"Found {len(due_jobs)} due jobs for tenant {tenant.slug}")
 
-            for job in due_jobs:
-                if self._shutdown_event.is_set():
-                    break
+            executions = {execution.job_id: execution for execution in service.create_executions(due_jobs)}
+            local_queue = deque(
+                (job, executions[job.id]) for job in due_jobs if job.id in executions
+            )
+            results = []
+
+            try:
+                while local_queue:
+                    if self._shutdown_event.is_set():
+                        break
+                    if time.monotonic() - fetched_at > self.local_queue_ttl:
+                        logger.info(
+                            f"Releasing {len(local_queue)} unstarted jobs for tenant {tenant.slug}"
+                        )
+                        break
+
+                    job, execution = local_queue.popleft()
+                    results.append(self._execute_job(tenant.slug, job, execution, session))
+            finally:
+                # Jobs left over go back to the database for any worker to
+                # claim; done before completing so their rows aren't expired
+                if local_queue:
+                    unstarted_jobs, unstarted_executions = zip(*local_queue)
+                    service.release_jobs(list(unstarted_jobs), list(unstarted_executions))
+                # Record all outcomes of the batch in one UPDATE
+                service.complete_executions(results)
 
-                try:
-                    self._execute_job(tenant.slug, job, session, service)
-                except Exception as e:
-                    logger.error(f"Error executing job {job.id} ({job.name}): {e}")
+            self._update_tenant_hint(tenant, service)
+            return len(due_jobs)
 
         finally:
-            # Clean up session
-            session.remove()
+            # Close rather than remove: the connection goes back to the pool
+            # and the identity map is cleared, but this thread keeps its
+            # Session for the next tick; _drain_shard removes it on exit
+            session.close()
 
-    def _execute_job(self, tenant_slug: str, job, session, service):
+    def _update_tenant_hint(self, tenant, service):
+        """Record when the tenant next needs checking.
+
+        Args:
+            tenant: Tenant instance, as loaded at the start of the tick
+            service: SchedulerService bound to the tenant's session
+        """
+        recheck_at = datetime.now(timezone.utc) + TENANT_RECHECK_INTERVAL
+        next_run_at = service.get_next_run_time()
+        if next_run_at is None or next_run_at > recheck_at:
+            next_run_at = recheck_at
+
+        Tenant.set_next_job_at(tenant.slug, next_run_at, expected_version=tenant.next_job_version)
+
+    def _execute_job(self, tenant_slug: str, job, execution, session) -> tuple:
         """Execute a single job.
 
         Args:
             tenant_slug: Tenant identifier
             job: Job instance to execute
+            execution: Running JobExecution record for this job
             session: SQLAlchemy session
-            service: SchedulerService instance
-        """
-        from app.services.scheduler_service import JobExecutionContext
 
+        Returns:
+            Tuple of (execution_id, success, result, error_message)
+        """
         logger.info(f"Executing job {job.id} ({job.name}) for tenant {tenant_slug}")
 
-        # Create execution record
-        execution = service.create_execution(job)
-
         try:
             # Create execution context
             context = JobExecutionContext(
@@ -202,34 +367,18 @@ class JobSchedulerWorker:
             # Execute job
             success, result, error_message = self.executor.execute(context)
 
-            # Update execution record
-            service.complete_execution(
-                execution,
-                success=success,
-                result=result,
-                error_message=error_message
-            )
-
-            # Update job's next_run_at
-            service.update_job_after_execution(job)
-
             if success:
                 logger.info(f"Job {job.id} ({job.name}) completed successfully")
             else:
                 logger.warning(f"Job {job.id} ({job.name}) failed: {error_message}")
 
+            return execution.id, success, result, error_message
+
         except Exception as e:
             logger.exception(f"Error executing job {job.id}: {e}")
 
             # Mark execution as failed
-            service.complete_execution(
-                execution,
-                success=False,
-                error_message=str(e)
-            )
-
-            # Still update next_run_at to avoid infinite retries
-            service.update_job_after_execution(job)
+            return execution.id, False, None, str(e)
 
     def run_forever(self):
         """Run the worker until shutdown signal received."""
@@ -244,10 +393,11 @@ class JobSchedulerWorker:
         signal.signal(signal.SIGINT, signal_handler)
         signal.signal(signal.SIGTERM, signal_handler)
 
-        # Keep running
+        # Block until stop() sets the event; signal handlers still run while
+        # waiting, and the loop guards against any early return
         try:
             while not self._shutdown_event.is_set():
-                time.sleep(1)
+                self._shutdown_event.wait()
         except KeyboardInterrupt:
             self.stop()
 
@@ -261,7 +411,31 @@ def main():
         '--poll-interval',
         type=int,
         default=30,
-        help='Seconds between job checks (default: 30)'
+        help='Initial seconds between job checks (default: 30)'
+    )
+    parser.add_argument(
+        '--min-poll',
+        type=float,
+        default=None,
+        help='Shortest seconds between job checks while busy (default: poll-interval / 6)'
+    )
+    parser.add_argument(
+        '--max-poll',
+        type=float,
+        default=None,
+        help='Longest seconds between job checks while idle (default: poll-interval * 2)'
+    )
+    parser.add_argument(
+        '--local-queue-size',
+        type=int,
+        default=None,
+        help='Jobs claimed per tenant in one round trip (default: 50)'
+    )
+    parser.add_argument(
+        '--local-queue-ttl',
+        type=float,
+        default=DEFAULT_LOCAL_QUEUE_TTL,
+        help=f'Seconds a claimed job may wait before release (default: {DEFAULT_LOCAL_QUEUE_TTL})'
     )
     parser.add_argument(
         '--max-workers',
@@ -281,7 +455,11 @@ def main():
     worker = JobSchedulerWorker(
         poll_interval_seconds=args.poll_interval,
         max_workers=args.max_workers,
-        default_timeout=args.timeout
+        default_timeout=args.timeout,
+        min_poll_seconds=args.min_poll,
+        max_poll_seconds=args.max_poll,
+        local_queue_size=args.local_queue_size,
+        local_queue_ttl=args.local_queue_ttl
     )
     worker.run_forever()
 
@@ -0,0 +1,28 @@
+"""Add next_job_at scheduling hint to tenants
+
+Revision ID: 3f9a1c7d2b64
+Revises: 677c200848b9
+Create Date: 2026-01-19 10:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '3f9a1c7d2b64'
+down_revision = '677c200848b9'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('tenants', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('next_job_at', sa.DateTime(timezone=True), nullable=True))
+        batch_op.create_index(batch_op.f('ix_tenants_next_job_at'), ['next_job_at'], unique=False)
+
+
+def downgrade():
+    with op.batch_alter_table('tenants', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_tenants_next_job_at'))
+        batch_op.drop_column('next_job_at')
@@ -0,0 +1,26 @@
+"""Add next_job_version to guard the tenant next_job_at hint
+
+Revision ID: 8c2e5d41a9f3
+Revises: 3f9a1c7d2b64
+Create Date: 2026-01-19 12:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '8c2e5d41a9f3'
+down_revision = '3f9a1c7d2b64'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('tenants', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('next_job_version', sa.Integer(), nullable=False, server_default='0'))
+
+
+def downgrade():
+    with op.batch_alter_table('tenants', schema=None) as batch_op:
+        batch_op.drop_column('next_job_version')
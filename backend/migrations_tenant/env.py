@@ -11,7 +11,10 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 config = context.config
 
-if config.config_file_name is not None:
+# Only configure logging when run from the alembic CLI; when the app passes
+# in a connection it owns logging, and fileConfig would disable its loggers
+# and re-read the ini on every tenant upgrade
+if config.config_file_name is not None and 'connection' not in config.attributes:
     fileConfig(config.config_file_name)
 
 target_metadata = None
@@ -37,7 +40,17 @@ def run_migrations_offline():
 
 
 def run_migrations_online():
-    """Run migrations in 'online' mode."""
+    """Run migrations in 'online' mode.
+
+    A caller may pass an open connection in config.attributes['connection']
+    (TenantManager.run_migrations does, from the tenant's pooled engine);
+    otherwise a one-off connection is made to TENANT_DB_URL.
+    """
+    connection = config.attributes.get('connection')
+    if connection is not None:
+        _run_with_connection(connection)
+        return
+
     url = get_url()
     if not url:
         raise ValueError("TENANT_DB_URL environment variable must be set")
@@ -49,13 +62,18 @@ def run_migrations_online():
     )
 
     with connectable.connect() as connection:
-        context.configure(
-            connection=connection,
-            target_metadata=target_metadata
-        )
+        _run_with_connection(connection)
+
+
+def _run_with_connection(connection):
+    """Run migrations on an open connection."""
+    context.configure(
+        connection=connection,
+        target_metadata=target_metadata
+    )
 
-        with context.begin_transaction():
-            context.run_migrations()
+    with context.begin_transaction():
+        context.run_migrations()
 
 
 if context.is_offline_mode():
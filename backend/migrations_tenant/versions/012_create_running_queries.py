@@ -51,23 +51,26 @@ def upgrade():
     # Create index on collected_at for retention cleanup
     op.create_index('ix_running_queries_collected_at', 'running_query_snapshots', ['collected_at'])
 
-    # Add query collection columns to collection_configs
-    op.add_column('collection_configs',
-        sa.Column('query_collection_enabled', sa.Boolean(), nullable=False, server_default='false'))
-    op.add_column('collection_configs',
-        sa.Column('query_collection_interval', sa.Integer(), nullable=False, server_default='30'))
-    op.add_column('collection_configs',
-        sa.Column('query_min_duration_ms', sa.Integer(), nullable=False, server_default='0'))
-    op.add_column('collection_configs',
-        sa.Column('last_query_collected_at', sa.DateTime(timezone=True), nullable=True))
+    # Add query collection columns to collection_configs in one ALTER TABLE
+    # so the table is locked once
+    op.execute("""
+        ALTER TABLE collection_configs
+            ADD COLUMN query_collection_enabled BOOLEAN NOT NULL DEFAULT false,
+            ADD COLUMN query_collection_interval INTEGER NOT NULL DEFAULT 30,
+            ADD COLUMN query_min_duration_ms INTEGER NOT NULL DEFAULT 0,
+            ADD COLUMN last_query_collected_at TIMESTAMP WITH TIME ZONE
+    """)
 
 
 def downgrade():
     # Remove columns from collection_configs
-    op.drop_column('collection_configs', 'last_query_collected_at')
-    op.drop_column('collection_configs', 'query_min_duration_ms')
-    op.drop_column('collection_configs', 'query_collection_interval')
-    op.drop_column('collection_configs', 'query_collection_enabled')
+    op.execute("""
+        ALTER TABLE collection_configs
+            DROP COLUMN last_query_collected_at,
+            DROP COLUMN query_min_duration_ms,
+            DROP COLUMN query_collection_interval,
+            DROP COLUMN query_collection_enabled
+    """)
 
     # Drop running_query_snapshots table
     op.drop_index('ix_running_queries_collected_at', 'running_query_snapshots')
@@ -4,7 +4,6 @@ Revision ID: 013
 Create Date: 2026-01-17
 """
 from alembic import op
-import sqlalchemy as sa
 
 revision = '013'
 down_revision = '012'
@@ -13,22 +12,23 @@ depends_on = None
 
 
 def upgrade():
-    # Add query filter columns to collection_configs
-    op.add_column('collection_configs',
-        sa.Column('query_filter_database', sa.String(128), nullable=True))
-    op.add_column('collection_configs',
-        sa.Column('query_filter_login', sa.String(128), nullable=True))
-    op.add_column('collection_configs',
-        sa.Column('query_filter_user', sa.String(128), nullable=True))
-    op.add_column('collection_configs',
-        sa.Column('query_filter_text_include', sa.Text(), nullable=True))
-    op.add_column('collection_configs',
-        sa.Column('query_filter_text_exclude', sa.Text(), nullable=True))
+    # Add query filter columns to collection_configs in one ALTER TABLE
+    op.execute("""
+        ALTER TABLE collection_configs
+            ADD COLUMN query_filter_database VARCHAR(128),
+            ADD COLUMN query_filter_login VARCHAR(128),
+            ADD COLUMN query_filter_user VARCHAR(128),
+            ADD COLUMN query_filter_text_include TEXT,
+            ADD COLUMN query_filter_text_exclude TEXT
+    """)
 
 
 def downgrade():
-    op.drop_column('collection_configs', 'query_filter_text_exclude')
-    op.drop_column('collection_configs', 'query_filter_text_include')
-    op.drop_column('collection_configs', 'query_filter_user')
-    op.drop_column('collection_configs', 'query_filter_login')
-    op.drop_column('collection_configs', 'query_filter_database')
+    op.execute("""
+        ALTER TABLE collection_configs
+            DROP COLUMN query_filter_text_exclude,
+            DROP COLUMN query_filter_text_include,
+            DROP COLUMN query_filter_user,
+            DROP COLUMN query_filter_login,
+            DROP COLUMN query_filter_database
+    """)
@@ -8,7 +8,6 @@ Revision ID: 014
 Create Date: 2026-01-18
 """
 from alembic import op
-import sqlalchemy as sa
 
 revision = '014'
 down_revision = '013'
@@ -17,17 +16,15 @@ depends_on = None
 
 
 def upgrade():
-    # Add session context columns for analytics breakdowns
-    op.add_column('running_query_snapshots',
-        sa.Column('login_name', sa.String(128), nullable=True))
-    op.add_column('running_query_snapshots',
-        sa.Column('host_name', sa.String(128), nullable=True))
-    op.add_column('running_query_snapshots',
-        sa.Column('program_name', sa.String(128), nullable=True))
-
-    # Add blocking information for blocking chain visualization
-    op.add_column('running_query_snapshots',
-        sa.Column('blocking_session_id', sa.Integer(), nullable=True))
+    # Add session context columns for analytics breakdowns and blocking
+    # information for blocking chain visualization, in one ALTER TABLE
+    op.execute("""
+        ALTER TABLE running_query_snapshots
+            ADD COLUMN login_name VARCHAR(128),
+            ADD COLUMN host_name VARCHAR(128),
+            ADD COLUMN program_name VARCHAR(128),
+            ADD COLUMN blocking_session_id INTEGER
+    """)
 
     # Create indexes for efficient aggregation queries
     op.create_index('ix_running_queries_blocking', 'running_query_snapshots',
@@ -45,7 +42,10 @@ def downgrade():
     op.drop_index('ix_running_queries_blocking', 'running_query_snapshots')
 
     # Drop columns
-    op.drop_column('running_query_snapshots', 'blocking_session_id')
-    op.drop_column('running_query_snapshots', 'program_name')
-    op.drop_column('running_query_snapshots', 'host_name')
-    op.drop_column('running_query_snapshots', 'login_name')
+    op.execute("""
+        ALTER TABLE running_query_snapshots
+            DROP COLUMN blocking_session_id,
+            DROP COLUMN program_name,
+            DROP COLUMN host_name,
+            DROP COLUMN login_name
+    """)
@@ -0,0 +1,38 @@
+"""Enforce case-insensitive unique server names in the database.
+
+Replaces the case-sensitive ix_servers_name_unique index with a unique
+index on lower(name) for non-deleted servers, so duplicate names are
+rejected by the INSERT/UPDATE itself instead of a separate pre-check.
+
+Revision ID: 015
+Create Date: 2026-01-19
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = '015'
+down_revision = '014'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.drop_index('ix_servers_name_unique', 'servers')
+    op.create_index(
+        'ux_servers_name_active',
+        'servers',
+        [sa.text('lower(name)')],
+        unique=True,
+        postgresql_where=sa.text('is_deleted = false')
+    )
+
+
+def downgrade():
+    op.drop_index('ux_servers_name_active', 'servers')
+    op.create_index(
+        'ix_servers_name_unique',
+        'servers',
+        ['name'],
+        unique=True,
+        postgresql_where=sa.text('is_deleted = false')
+    )
@@ -0,0 +1,39 @@
+"""Create running_query_hourly rollup table.
+
+Keeps a per-server, per-hour count of running query snapshots so that
+long-window counts sum at most one row per hour instead of scanning
+running_query_snapshots. Existing snapshots are backfilled.
+
+Revision ID: 016
+Create Date: 2026-01-19
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects.postgresql import UUID
+
+revision = '016'
+down_revision = '015'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        'running_query_hourly',
+        sa.Column('server_id', UUID(as_uuid=True), sa.ForeignKey('servers.id', ondelete='CASCADE'), primary_key=True),
+        sa.Column('hour', sa.DateTime(timezone=True), primary_key=True),
+        sa.Column('snapshot_count', sa.Integer(), nullable=False, server_default='0'),
+    )
+
+    op.execute("""
+        INSERT INTO running_query_hourly (server_id, hour, snapshot_count)
+        SELECT server_id,
+               date_trunc('hour', collected_at AT TIME ZONE 'UTC') AT TIME ZONE 'UTC',
+               count(*)
+        FROM running_query_snapshots
+        GROUP BY 1, 2
+    """)
+
+
+def downgrade():
+    op.drop_table('running_query_hourly')
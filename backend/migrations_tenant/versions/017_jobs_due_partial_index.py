@@ -0,0 +1,30 @@
+"""Replace the jobs next_run_at index with a partial due-jobs index.
+
+The scheduler only ever looks for enabled jobs with a next_run_at, so
+ix_jobs_due indexes just those rows instead of every job.
+
+Revision ID: 017
+Create Date: 2026-01-19
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = '017'
+down_revision = '016'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.drop_index('ix_jobs_next_run_at', table_name='jobs')
+    op.create_index(
+        'ix_jobs_due',
+        'jobs',
+        ['next_run_at'],
+        postgresql_where=sa.text('is_enabled = true AND next_run_at IS NOT NULL')
+    )
+
+
+def downgrade():
+    op.drop_index('ix_jobs_due', table_name='jobs')
+    op.create_index('ix_jobs_next_run_at', 'jobs', ['next_run_at'])
@@ -0,0 +1,38 @@
+"""Add BRIN indexes on collected_at for metrics and server_snapshots.
+
+Both tables are append-only and time ordered; retention cleanup deletes by
+collected_at alone, which no existing index covers. BRIN indexes are tiny
+and cheap to maintain on this insert pattern. The (server_id, collected_at)
+btrees stay for per-server range queries.
+
+Revision ID: 018
+Create Date: 2026-01-19
+"""
+from alembic import op
+
+revision = '018'
+down_revision = '017'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_index(
+        'ix_snapshots_collected_at_brin',
+        'server_snapshots',
+        ['collected_at'],
+        postgresql_using='brin',
+        postgresql_with={'pages_per_range': 32}
+    )
+    op.create_index(
+        'ix_metrics_collected_at_brin',
+        'metrics',
+        ['collected_at'],
+        postgresql_using='brin',
+        postgresql_with={'pages_per_range': 32}
+    )
+
+
+def downgrade():
+    op.drop_index('ix_metrics_collected_at_brin', table_name='metrics')
+    op.drop_index('ix_snapshots_collected_at_brin', table_name='server_snapshots')
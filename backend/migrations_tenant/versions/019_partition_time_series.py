@@ -0,0 +1,127 @@
+"""Range-partition metrics and server_snapshots by month on collected_at.
+
+Each table is rebuilt as a partitioned parent with monthly partitions
+named <table>_pYYYY_MM plus a default partition, and existing rows are
+copied across. The primary key becomes (id, collected_at), as Postgres
+requires the partition key in unique constraints. Retention cleanup can
+then drop whole expired partitions instead of deleting row by row.
+
+Revision ID: 019
+Create Date: 2026-01-19
+"""
+from alembic import op
+
+revision = '019'
+down_revision = '018'
+branch_labels = None
+depends_on = None
+
+
+# (table, foreign keys, btree indexes, brin index)
+TABLES = [
+    (
+        'server_snapshots',
+        ['FOREIGN KEY (server_id) REFERENCES servers (id) ON DELETE CASCADE'],
+        [('ix_snapshots_server_time', 'server_id, collected_at')],
+        'ix_snapshots_collected_at_brin',
+    ),
+    (
+        'metrics',
+        [
+            'FOREIGN KEY (server_id) REFERENCES servers (id) ON DELETE CASCADE',
+            'FOREIGN KEY (metric_type_id) REFERENCES metric_types (id) ON DELETE CASCADE',
+        ],
+        [
+            ('ix_metrics_server_time', 'server_id, collected_at'),
+            ('ix_metrics_server_type_time', 'server_id, metric_type_id, collected_at'),
+        ],
+        'ix_metrics_collected_at_brin',
+    ),
+]
+
+# Monthly partitions are created from the oldest existing row up to this
+# many months ahead; the cleanup worker keeps creating them from then on
+MONTHS_AHEAD = 2
+
+
+def _create_indexes(table, btree_indexes, brin_index):
+    for name, columns in btree_indexes:
+        op.execute(f'CREATE INDEX {name} ON {table} ({columns})')
+    op.execute(
+        f'CREATE INDEX {brin_index} ON {table} USING brin (collected_at) '
+        f'WITH (pages_per_range = 32)'
+    )
+
+
+def _drop_indexes(btree_indexes, brin_index):
+    for name, _ in btree_indexes:
+        op.execute(f'DROP INDEX {name}')
+    op.execute(f'DROP INDEX {brin_index}')
+
+
+def upgrade():
+    op.execute("SET LOCAL TimeZone = 'UTC'")
+
+    for table, foreign_keys, btree_indexes, brin_index in TABLES:
+        old = f'{table}_unpartitioned'
+
+        op.execute(f'ALTER TABLE {table} RENAME TO {old}')
+        op.execute(f'ALTER TABLE {old} RENAME CONSTRAINT {table}_pkey TO {old}_pkey')
+        _drop_indexes(btree_indexes, brin_index)
+
+        constraints = ',\n'.join(['PRIMARY KEY (id, collected_at)'] + foreign_keys)
+        op.execute(f"""
+            CREATE TABLE {table} (
+                LIKE {old} INCLUDING DEFAULTS,
+                {constraints}
+            ) PARTITION BY RANGE (collected_at)
+        """)
+        op.execute(f'CREATE TABLE {table}_default PARTITION OF {table} DEFAULT')
+
+        # One partition per month covering existing data and the next few
+        # months (the session time zone is UTC, so months are UTC months)
+        op.execute(f"""
+            DO $$
+            DECLARE
+                month_start timestamptz;
+            BEGIN
+                SELECT date_trunc('month', coalesce(min(collected_at), now()))
+                INTO month_start FROM {old};
+
+                WHILE month_start <= date_trunc('month', now()) + interval '{MONTHS_AHEAD} months' LOOP
+                    EXECUTE format(
+                        'CREATE TABLE %I PARTITION OF {table} FOR VALUES FROM (%L) TO (%L)',
+                        '{table}_p' || to_char(month_start, 'YYYY_MM'),
+                        month_start,
+                        month_start + interval '1 month'
+                    );
+                    month_start := month_start + interval '1 month';
+                END LOOP;
+            END $$
+        """)
+
+        op.execute(f'INSERT INTO {table} SELECT * FROM {old}')
+        op.execute(f'DROP TABLE {old}')
+
+        _create_indexes(table, btree_indexes, brin_index)
+
+
+def downgrade():
+    for table, foreign_keys, btree_indexes, brin_index in TABLES:
+        partitioned = f'{table}_partitioned'
+
+        op.execute(f'ALTER TABLE {table} RENAME TO {partitioned}')
+        op.execute(f'ALTER TABLE {partitioned} RENAME CONSTRAINT {table}_pkey TO {partitioned}_pkey')
+        _drop_indexes(btree_indexes, brin_index)
+
+        constraints = ',\n'.join(['PRIMARY KEY (id)'] + foreign_keys)
+        op.execute(f"""
+            CREATE TABLE {table} (
+                LIKE {partitioned} INCLUDING DEFAULTS,
+                {constraints}
+            )
+        """)
+        op.execute(f'INSERT INTO {table} SELECT * FROM {partitioned}')
+        op.execute(f'DROP TABLE {partitioned} CASCADE')
+
+        _create_indexes(table, btree_indexes, brin_index)
@@ -0,0 +1,32 @@
+"""Store metric values as fixed-width floats instead of numeric.
+
+numeric is variable-length and slow to aggregate. metrics.value and
+server_snapshots.batch_requests_sec become double precision (8 bytes);
+cpu_percent and memory_percent become real (4 bytes), ample precision
+for a 0-100 percentage.
+
+Revision ID: 020
+Create Date: 2026-01-19
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects.postgresql import REAL, DOUBLE_PRECISION
+
+revision = '020'
+down_revision = '019'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.alter_column('metrics', 'value', type_=DOUBLE_PRECISION(), existing_nullable=False)
+    op.alter_column('server_snapshots', 'cpu_percent', type_=REAL(), existing_nullable=True)
+    op.alter_column('server_snapshots', 'memory_percent', type_=REAL(), existing_nullable=True)
+    op.alter_column('server_snapshots', 'batch_requests_sec', type_=DOUBLE_PRECISION(), existing_nullable=True)
+
+
+def downgrade():
+    op.alter_column('server_snapshots', 'batch_requests_sec', type_=sa.Numeric(10, 2), existing_nullable=True)
+    op.alter_column('server_snapshots', 'memory_percent', type_=sa.Numeric(5, 2), existing_nullable=True)
+    op.alter_column('server_snapshots', 'cpu_percent', type_=sa.Numeric(5, 2), existing_nullable=True)
+    op.alter_column('metrics', 'value', type_=sa.Numeric(18, 4), existing_nullable=False)
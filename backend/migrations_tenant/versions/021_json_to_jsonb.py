@@ -0,0 +1,50 @@
+"""Convert json columns to jsonb.
+
+json is stored as text and reparsed on every read; jsonb is stored
+decomposed, matching settings.value and activity_log.details.
+
+Revision ID: 021
+Create Date: 2026-01-19
+"""
+from alembic import op
+
+revision = '021'
+down_revision = '020'
+branch_labels = None
+depends_on = None
+
+
+# (table, column, server default)
+COLUMNS = [
+    ('server_snapshots', 'extended_metrics', None),
+    ('collection_configs', 'metrics_enabled', '\'["cpu_percent", "memory_percent", "connection_count"]\''),
+    ('policies', 'configuration', "'{}'"),
+    ('policy_versions', 'configuration', None),
+    ('jobs', 'configuration', "'{}'"),
+    ('jobs', 'schedule_config', "'{}'"),
+    ('job_executions', 'result', None),
+]
+
+
+def _convert(target_type):
+    for table, column, default in COLUMNS:
+        # Defaults can't be cast implicitly, so drop and restore them
+        if default is not None:
+            op.execute(f'ALTER TABLE {table} ALTER COLUMN {column} DROP DEFAULT')
+        op.execute(
+            f'ALTER TABLE {table} ALTER COLUMN {column} '
+            f'TYPE {target_type} USING {column}::{target_type}'
+        )
+        if default is not None:
+            op.execute(
+                f'ALTER TABLE {table} ALTER COLUMN {column} '
+                f'SET DEFAULT {default}::{target_type}'
+            )
+
+
+def upgrade():
+    _convert('jsonb')
+
+
+def downgrade():
+    _convert('json')
@@ -0,0 +1,53 @@
+"""Maintain updated_at with a trigger.
+
+updated_at was only kept current by the ORM's onupdate hook, so bulk
+Core UPDATEs and raw SQL left it stale. A BEFORE UPDATE trigger now
+sets it on every update, and its server default uses
+statement_timestamp() rather than the transaction start time.
+
+Revision ID: 022
+Create Date: 2026-01-19
+"""
+from alembic import op
+
+revision = '022'
+down_revision = '021'
+branch_labels = None
+depends_on = None
+
+
+TABLES = [
+    'servers',
+    'server_groups',
+    'settings',
+    'collection_configs',
+    'policies',
+    'jobs',
+    'alert_rules',
+]
+
+
+def upgrade():
+    op.execute("""
+        CREATE OR REPLACE FUNCTION set_updated_at() RETURNS trigger AS $$
+        BEGIN
+            NEW.updated_at = statement_timestamp();
+            RETURN NEW;
+        END;
+        $$ LANGUAGE plpgsql
+    """)
+
+    for table in TABLES:
+        op.execute(f'ALTER TABLE {table} ALTER COLUMN updated_at SET DEFAULT statement_timestamp()')
+        op.execute(
+            f'CREATE TRIGGER {table}_set_updated_at BEFORE UPDATE ON {table} '
+            f'FOR EACH ROW EXECUTE FUNCTION set_updated_at()'
+        )
+
+
+def downgrade():
+    for table in TABLES:
+        op.execute(f'DROP TRIGGER {table}_set_updated_at ON {table}')
+        op.execute(f'ALTER TABLE {table} ALTER COLUMN updated_at SET DEFAULT now()')
+
+    op.execute('DROP FUNCTION set_updated_at()')
@@ -0,0 +1,110 @@
+"""Range-partition running_query_snapshots by month on collected_at.
+
+Same layout as migration 019: monthly partitions named
+running_query_snapshots_pYYYY_MM plus a default partition, with the
+primary key widened to (id, collected_at). Retention cleanup then drops
+expired months instead of deleting snapshots row by row, and each
+partition's indexes stay small.
+
+Revision ID: 023
+Create Date: 2026-01-19
+"""
+from alembic import op
+
+revision = '023'
+down_revision = '022'
+branch_labels = None
+depends_on = None
+
+
+TABLE = 'running_query_snapshots'
+
+FOREIGN_KEYS = ['FOREIGN KEY (server_id) REFERENCES servers (id) ON DELETE CASCADE']
+
+INDEXES = [
+    ('ix_running_queries_server_time', 'server_id, collected_at'),
+    ('ix_running_queries_collected_at', 'collected_at'),
+    ('ix_running_queries_blocking', 'server_id, blocking_session_id'),
+    ('ix_running_queries_database', 'server_id, database_name'),
+    ('ix_running_queries_login', 'server_id, login_name'),
+]
+
+# Monthly partitions are created from the oldest existing row up to this
+# many months ahead; the cleanup worker keeps creating them from then on
+MONTHS_AHEAD = 2
+
+
+def _create_indexes():
+    for name, columns in INDEXES:
+        op.execute(f'CREATE INDEX {name} ON {TABLE} ({columns})')
+
+
+def _drop_indexes():
+    for name, _ in INDEXES:
+        op.execute(f'DROP INDEX {name}')
+
+
+def upgrade():
+    op.execute("SET LOCAL TimeZone = 'UTC'")
+
+    old = f'{TABLE}_unpartitioned'
+
+    op.execute(f'ALTER TABLE {TABLE} RENAME TO {old}')
+    op.execute(f'ALTER TABLE {old} RENAME CONSTRAINT {TABLE}_pkey TO {old}_pkey')
+    _drop_indexes()
+
+    constraints = ',\n'.join(['PRIMARY KEY (id, collected_at)'] + FOREIGN_KEYS)
+    op.execute(f"""
+        CREATE TABLE {TABLE} (
+            LIKE {old} INCLUDING DEFAULTS,
+            {constraints}
+        ) PARTITION BY RANGE (collected_at)
+    """)
+    op.execute(f'CREATE TABLE {TABLE}_default PARTITION OF {TABLE} DEFAULT')
+
+    # One partition per month covering existing data and the next few
+    # months (the session time zone is UTC, so months are UTC months)
+    op.execute(f"""
+        DO $$
+        DECLARE
+            month_start timestamptz;
+        BEGIN
+            SELECT date_trunc('month', coalesce(min(collected_at), now()))
+            INTO month_start FROM {old};
+
+            WHILE month_start <= date_trunc('month', now()) + interval '{MONTHS_AHEAD} months' LOOP
+                EXECUTE format(
+                    'CREATE TABLE %I PARTITION OF {TABLE} FOR VALUES FROM (%L) TO (%L)',
+                    '{TABLE}_p' || to_char(month_start, 'YYYY_MM'),
+                    month_start,
+                    month_start + interval '1 month'
+                );
+                month_start := month_start + interval '1 month';
+            END LOOP;
+        END $$
+    """)
+
+    op.execute(f'INSERT INTO {TABLE} SELECT * FROM {old}')
+    op.execute(f'DROP TABLE {old}')
+
+    _create_indexes()
+
+
+def downgrade():
+    partitioned = f'{TABLE}_partitioned'
+
+    op.execute(f'ALTER TABLE {TABLE} RENAME TO {partitioned}')
+    op.execute(f'ALTER TABLE {partitioned} RENAME CONSTRAINT {TABLE}_pkey TO {partitioned}_pkey')
+    _drop_indexes()
+
+    constraints = ',\n'.join(['PRIMARY KEY (id)'] + FOREIGN_KEYS)
+    op.execute(f"""
+        CREATE TABLE {TABLE} (
+            LIKE {partitioned} INCLUDING DEFAULTS,
+            {constraints}
+        )
+    """)
+    op.execute(f'INSERT INTO {TABLE} SELECT * FROM {partitioned}')
+    op.execute(f'DROP TABLE {partitioned} CASCADE')
+
+    _create_indexes()
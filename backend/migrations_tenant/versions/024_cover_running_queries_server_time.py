@@ -0,0 +1,40 @@
+"""Make the running_query_snapshots (server_id, collected_at) index covering.
+
+The analytics timeline and breakdown queries filter on server_id and a
+collected_at range and read only the dimension and timing columns;
+carrying those as INCLUDE columns lets them run as index-only scans.
+query_text stays out, as it is unbounded and would bloat the index.
+
+Revision ID: 024
+Create Date: 2026-01-19
+"""
+from alembic import op
+
+revision = '024'
+down_revision = '023'
+branch_labels = None
+depends_on = None
+
+
+INCLUDE_COLUMNS = (
+    'database_name, login_name, host_name, program_name, wait_type, '
+    'duration_ms, cpu_time_ms'
+)
+
+
+def upgrade():
+    # CONCURRENTLY isn't supported on a partitioned table's parent index
+    op.execute('DROP INDEX ix_running_queries_server_time')
+    op.execute(
+        'CREATE INDEX ix_running_queries_server_time_covering '
+        'ON running_query_snapshots (server_id, collected_at) '
+        f'INCLUDE ({INCLUDE_COLUMNS})'
+    )
+
+
+def downgrade():
+    op.execute('DROP INDEX ix_running_queries_server_time_covering')
+    op.execute(
+        'CREATE INDEX ix_running_queries_server_time '
+        'ON running_query_snapshots (server_id, collected_at)'
+    )
@@ -0,0 +1,46 @@
+"""Trim the b-tree indexes maintained on every running query insert.
+
+The collected_at b-tree only serves retention range scans, which a BRIN
+index handles at a fraction of the size. The (server_id, blocking),
+(server_id, database) and (server_id, login) b-trees back no query:
+breakdowns filter on server_id and a collected_at range, which the
+covering index from migration 024 serves.
+
+Revision ID: 025
+Create Date: 2026-01-19
+"""
+from alembic import op
+
+revision = '025'
+down_revision = '024'
+branch_labels = None
+depends_on = None
+
+
+BREAKDOWN_INDEXES = [
+    ('ix_running_queries_blocking', ['server_id', 'blocking_session_id']),
+    ('ix_running_queries_database', ['server_id', 'database_name']),
+    ('ix_running_queries_login', ['server_id', 'login_name']),
+]
+
+
+def upgrade():
+    op.drop_index('ix_running_queries_collected_at', table_name='running_query_snapshots')
+    op.create_index(
+        'ix_running_queries_collected_at_brin',
+        'running_query_snapshots',
+        ['collected_at'],
+        postgresql_using='brin',
+        postgresql_with={'pages_per_range': 32}
+    )
+
+    for name, _ in BREAKDOWN_INDEXES:
+        op.drop_index(name, table_name='running_query_snapshots')
+
+
+def downgrade():
+    for name, columns in BREAKDOWN_INDEXES:
+        op.create_index(name, 'running_query_snapshots', columns)
+
+    op.drop_index('ix_running_queries_collected_at_brin', table_name='running_query_snapshots')
+    op.create_index('ix_running_queries_collected_at', 'running_query_snapshots', ['collected_at'])
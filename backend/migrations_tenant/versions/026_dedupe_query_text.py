@@ -0,0 +1,59 @@
+"""Store running query text once in query_texts.
+
+Consecutive snapshots of a long-running statement all carried the same
+text. Distinct texts now live in query_texts keyed by a 64-bit hash
+(the first 16 hex digits of their MD5), and running_query_snapshots
+keeps only query_text_hash.
+
+Revision ID: 026
+Create Date: 2026-01-19
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = '026'
+down_revision = '025'
+branch_labels = None
+depends_on = None
+
+
+# Must match QueryText.hash_text()
+HASH_SQL = "('x' || substr(md5(query_text), 1, 16))::bit(64)::bigint"
+
+
+def upgrade():
+    op.create_table(
+        'query_texts',
+        sa.Column('hash', sa.BigInteger(), primary_key=True),
+        sa.Column('text', sa.Text(), nullable=False),
+        sa.Column('first_seen', sa.DateTime(timezone=True), nullable=False, server_default=sa.func.now()),
+    )
+
+    op.execute(f"""
+        INSERT INTO query_texts (hash, text, first_seen)
+        SELECT DISTINCT ON (hash) hash, query_text, collected_at
+        FROM (
+            SELECT {HASH_SQL} AS hash, query_text, collected_at
+            FROM running_query_snapshots
+            WHERE query_text IS NOT NULL
+        ) texts
+        ORDER BY hash, collected_at
+    """)
+
+    op.add_column('running_query_snapshots', sa.Column('query_text_hash', sa.BigInteger(), nullable=True))
+    op.execute(f"""
+        UPDATE running_query_snapshots SET query_text_hash = {HASH_SQL}
+        WHERE query_text IS NOT NULL
+    """)
+    op.drop_column('running_query_snapshots', 'query_text')
+
+
+def downgrade():
+    op.add_column('running_query_snapshots', sa.Column('query_text', sa.Text(), nullable=True))
+    op.execute("""
+        UPDATE running_query_snapshots SET query_text = query_texts.text
+        FROM query_texts
+        WHERE query_texts.hash = running_query_snapshots.query_text_hash
+    """)
+    op.drop_column('running_query_snapshots', 'query_text_hash')
+    op.drop_table('query_texts')
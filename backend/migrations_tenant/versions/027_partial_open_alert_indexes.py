@@ -0,0 +1,41 @@
+"""Replace the alerts status index with partial indexes on open alerts.
+
+The full ix_alerts_status index grows with every resolved alert, while
+the alert list only ever filters it down to the active or acknowledged
+ones. Partial indexes on those two statuses, ordered by triggered_at
+descending like the list, stay a small fraction of the size.
+
+Revision ID: 027
+Create Date: 2026-01-19
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = '027'
+down_revision = '026'
+branch_labels = None
+depends_on = None
+
+
+# (index name, status covered)
+PARTIAL_INDEXES = [
+    ('ix_alerts_active', 'active'),
+    ('ix_alerts_acknowledged', 'acknowledged'),
+]
+
+
+def upgrade():
+    op.drop_index('ix_alerts_status', table_name='alerts')
+    for name, status in PARTIAL_INDEXES:
+        op.create_index(
+            name,
+            'alerts',
+            [sa.text('triggered_at DESC'), 'server_id'],
+            postgresql_where=sa.text(f"status = '{status}'")
+        )
+
+
+def downgrade():
+    for name, _ in PARTIAL_INDEXES:
+        op.drop_index(name, table_name='alerts')
+    op.create_index('ix_alerts_status', 'alerts', ['status'])
@@ -0,0 +1,27 @@
+"""Split the alerts (rule_id, server_id) index into single-column indexes.
+
+Alerts are looked up per server far more often than per rule, and the
+composite index can't serve server_id on its own. rule_id keeps its own
+index for the alert_rules foreign key.
+
+Revision ID: 028
+Create Date: 2026-01-19
+"""
+from alembic import op
+
+revision = '028'
+down_revision = '027'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.drop_index('ix_alerts_rule_server', table_name='alerts')
+    op.create_index('ix_alerts_rule_id', 'alerts', ['rule_id'])
+    op.create_index('ix_alerts_server_id', 'alerts', ['server_id'])
+
+
+def downgrade():
+    op.drop_index('ix_alerts_server_id', table_name='alerts')
+    op.drop_index('ix_alerts_rule_id', table_name='alerts')
+    op.create_index('ix_alerts_rule_server', 'alerts', ['rule_id', 'server_id'])
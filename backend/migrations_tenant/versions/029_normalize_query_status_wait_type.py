@@ -0,0 +1,85 @@
+"""Store running query status as an enum and wait type as a lookup id.
+
+Every snapshot repeated one of a handful of request statuses and a few
+dozen wait type names as strings. status becomes the query_status enum
+(4 bytes) and wait_type moves to a wait_types lookup table referenced
+by a SMALLINT wait_type_id. The covering index from migration 024 is
+rebuilt to include wait_type_id in place of wait_type.
+
+Revision ID: 029
+Create Date: 2026-01-19
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = '029'
+down_revision = '028'
+branch_labels = None
+depends_on = None
+
+
+# sys.dm_exec_requests statuses; must match QUERY_STATUSES in the models
+QUERY_STATUSES = ('background', 'rollback', 'running', 'runnable', 'sleeping', 'suspended')
+
+COVERING_INDEX = 'ix_running_queries_server_time_covering'
+
+
+def _create_covering_index(wait_type_column):
+    op.execute(
+        f'CREATE INDEX {COVERING_INDEX} '
+        'ON running_query_snapshots (server_id, collected_at) '
+        'INCLUDE (database_name, login_name, host_name, program_name, '
+        f'{wait_type_column}, duration_ms, cpu_time_ms)'
+    )
+
+
+def upgrade():
+    statuses = ', '.join(f"'{status}'" for status in QUERY_STATUSES)
+    op.execute(f'CREATE TYPE query_status AS ENUM ({statuses})')
+    # Anything outside the enum was never a valid request status
+    op.execute(f"""
+        ALTER TABLE running_query_snapshots
+        ALTER COLUMN status TYPE query_status
+        USING CASE WHEN lower(status) IN ({statuses})
+                   THEN lower(status)::query_status END
+    """)
+
+    op.create_table(
+        'wait_types',
+        sa.Column('id', sa.SmallInteger(), sa.Identity(), primary_key=True),
+        sa.Column('name', sa.String(60), nullable=False, unique=True),
+    )
+    op.execute("""
+        INSERT INTO wait_types (name)
+        SELECT DISTINCT wait_type FROM running_query_snapshots
+        WHERE wait_type IS NOT NULL
+    """)
+
+    op.execute(f'DROP INDEX {COVERING_INDEX}')
+    op.add_column(
+        'running_query_snapshots',
+        sa.Column('wait_type_id', sa.SmallInteger(), sa.ForeignKey('wait_types.id'), nullable=True)
+    )
+    op.execute("""
+        UPDATE running_query_snapshots SET wait_type_id = wait_types.id
+        FROM wait_types
+        WHERE wait_types.name = running_query_snapshots.wait_type
+    """)
+    op.drop_column('running_query_snapshots', 'wait_type')
+    _create_covering_index('wait_type_id')
+
+
+def downgrade():
+    op.execute(f'DROP INDEX {COVERING_INDEX}')
+    op.add_column('running_query_snapshots', sa.Column('wait_type', sa.String(60), nullable=True))
+    op.execute("""
+        UPDATE running_query_snapshots SET wait_type = wait_types.name
+        FROM wait_types
+        WHERE wait_types.id = running_query_snapshots.wait_type_id
+    """)
+    op.drop_column('running_query_snapshots', 'wait_type_id')
+    op.drop_table('wait_types')
+    _create_covering_index('wait_type')
+
+    op.execute('ALTER TABLE running_query_snapshots ALTER COLUMN status TYPE VARCHAR(30) USING status::text')
+    op.execute('DROP TYPE query_status')
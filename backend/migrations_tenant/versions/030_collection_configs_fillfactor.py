@@ -0,0 +1,25 @@
+"""Leave free space in collection_configs pages for HOT updates.
+
+The collector stamps last_collected_at and last_query_collected_at on
+every poll, and config edits touch only unindexed columns. With pages
+kept 20% free, Postgres can write those row versions in place as
+heap-only tuples and skip updating the primary key index. Existing
+pages take the new fillfactor as they are rewritten.
+
+Revision ID: 030
+Create Date: 2026-01-19
+"""
+from alembic import op
+
+revision = '030'
+down_revision = '029'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.execute('ALTER TABLE collection_configs SET (fillfactor = 80)')
+
+
+def downgrade():
+    op.execute('ALTER TABLE collection_configs RESET (fillfactor)')
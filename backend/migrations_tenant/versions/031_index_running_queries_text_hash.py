@@ -0,0 +1,30 @@
+"""Index running_query_snapshots.query_text_hash.
+
+The metrics cleanup drops query texts no snapshot refers to, which
+without an index is an anti-join over every running query partition on
+each run. The index is partial since snapshots without text never take
+part in that lookup.
+
+Revision ID: 031
+Create Date: 2026-01-19
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = '031'
+down_revision = '030'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_index(
+        'ix_running_queries_query_text_hash',
+        'running_query_snapshots',
+        ['query_text_hash'],
+        postgresql_where=sa.text('query_text_hash IS NOT NULL')
+    )
+
+
+def downgrade():
+    op.drop_index('ix_running_queries_query_text_hash', table_name='running_query_snapshots')
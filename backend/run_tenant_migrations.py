@@ -1,41 +1,60 @@
 """Run tenant migrations for all active tenants."""
 import os
 import sys
+from concurrent.futures import ProcessPoolExecutor, as_completed
 
 # Ensure we can import from app
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
 from app import create_app
+from app.extensions import db
 from app.models.system import Tenant
 from app.core.tenant_manager import tenant_manager
 
+# Tenants are separate databases, so their migrations can run side by side
+MAX_WORKERS = 8
+
+# Per worker process app, set by _init_worker
+_app = None
+
+
+def _init_worker():
+    global _app
+    _app = create_app()
+
+
+def _migrate(slug):
+    """Migrate one tenant; returns (slug, revision before, revision after)."""
+    with _app.app_context():
+        before = tenant_manager.run_migrations(slug)
+        # A successful upgrade leaves the tenant at head
+        after = tenant_manager.get_head_revision()
+    return slug, before, after
+
+
 def main():
     app = create_app()
 
     with app.app_context():
         # Get all active tenants
-        tenants = Tenant.query.filter_by(status='active').all()
-
-        if not tenants:
-            print("No active tenants found")
-            return
-
-        for tenant in tenants:
-            print(f"Running migrations for tenant: {tenant.slug}")
+        slugs = [slug for (slug,) in db.session.query(Tenant.slug).filter_by(status='active')]
+
+    if not slugs:
+        print("No active tenants found")
+        return
+
+    # Alembic keeps its migration context in module globals, so concurrent
+    # upgrades need separate processes rather than threads
+    workers = min(MAX_WORKERS, len(slugs))
+    print(f"Running migrations for {len(slugs)} tenants ({workers} at a time)")
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker) as executor:
+        futures = {executor.submit(_migrate, slug): slug for slug in slugs}
+        for future in as_completed(futures):
             try:
-                # Check current status
-                status = tenant_manager.get_migration_status(tenant.slug)
-                print(f"  Current revision: {status['current_revision']}")
-
-                # Run migrations
-                tenant_manager.run_migrations(tenant.slug)
-
-                # Check new status
-                status = tenant_manager.get_migration_status(tenant.slug)
-                print(f"  New revision: {status['current_revision']}")
-                print(f"  [OK] Migrations complete for {tenant.slug}")
+                slug, before, after = future.result()
+                print(f"  [OK] {slug}: {before} -> {after}")
             except Exception as e:
-                print(f"  [ERROR] {e}")
+                print(f"  [ERROR] {futures[future]}: {e}")
 
 if __name__ == '__main__':
     main()
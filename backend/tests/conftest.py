@@ -4,9 +4,9 @@ from app import create_app
 from app.extensions import db
 
 
-@pytest.fixture
-def app():
-    """Create application for testing."""
+@pytest.fixture(scope='session')
+def _app():
+    """Create the application once for the test session."""
     app = create_app('testing')
 
     # Add test endpoint that requires tenant
@@ -17,11 +17,19 @@ def app():
             return {'tenant': tenant.slug}
         return {'tenant': None}
 
-    with app.app_context():
+    return app
+
+
+@pytest.fixture
+def app(_app):
+    """Application with fresh tables for each test."""
+    with _app.app_context():
         db.create_all()
-        yield app
+        yield _app
         db.session.remove()
         db.drop_all()
+        # Tenants cached by an earlier test no longer exist
+        _app.extensions['tenant_middleware'].clear_tenant_cache()
 
 
 @pytest.fixture
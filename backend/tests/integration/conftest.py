@@ -0,0 +1,60 @@
+"""Shared fixtures for integration tests against real databases."""
+import os
+from pathlib import Path
+
+import pytest
+
+from app import create_app
+from app.extensions import db
+from app.models import Tenant
+from app.core import tenant_manager
+
+# Test data is thrown away, so don't wait for WAL flushes on commit. libpq
+# reads PGOPTIONS for every connection: the system DB, tenant DBs and the
+# Alembic migrations that provision them.
+os.environ.setdefault('PGOPTIONS', '-c synchronous_commit=off')
+
+
+def pytest_collection_modifyitems(items):
+    """Keep integration tests on one worker under pytest -n --dist loadgroup.
+
+    They share the system database, and integration_app's teardown drops
+    every test- tenant, so they can't run alongside each other; unit tests
+    use in-memory SQLite and still spread across workers.
+    """
+    integration_dir = Path(__file__).parent
+    for item in items:
+        if integration_dir in item.path.parents:
+            item.add_marker(pytest.mark.xdist_group('integration'))
+
+
+@pytest.fixture(scope='package')
+def integration_app():
+    """Create application with real database for integration testing.
+
+    Built once for all integration tests; provisioning tenant databases
+    dominates the run time, so tests share what they can and the test
+    tenants are only dropped at the end.
+    """
+    app = create_app('development')
+    app.config['SQLALCHEMY_ECHO'] = False  # Reduce noise in test output
+
+    with app.app_context():
+        db.create_all()
+        yield app
+        # Cleanup: remove any test tenants
+        db.session.rollback()
+        test_tenants = Tenant.query.filter(Tenant.slug.like('test-%')).all()
+        for tenant in test_tenants:
+            try:
+                tenant_manager.drop_database(tenant.slug)
+            except Exception:
+                pass
+            db.session.delete(tenant)
+        db.session.commit()
+
+
+@pytest.fixture
+def integration_client(integration_app):
+    """Create test client for integration tests."""
+    return integration_app.test_client()
@@ -4,48 +4,22 @@ from datetime import datetime, timezone
 from unittest.mock import Mock, MagicMock, patch
 from uuid import uuid4
 
-from app import create_app
-from app.extensions import db
-from app.models import Tenant
-from app.models.tenant import Server, CollectionConfig, RunningQuerySnapshot
+from sqlalchemy import delete, insert, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+
+from app.models.tenant import Server, CollectionConfig, QueryText, RunningQuerySnapshot, WaitType
 from app.core import tenant_manager
 from workers.metric_collector import MetricCollector
 
 
-@pytest.fixture
-def integration_app():
-    """Create application with real database for integration testing."""
-    app = create_app('development')
-    app.config['SQLALCHEMY_ECHO'] = False
-
-    with app.app_context():
-        db.create_all()
-        yield app
-        # Cleanup: remove any test tenants
-        test_tenants = Tenant.query.filter(Tenant.slug.like('test-%')).all()
-        for tenant in test_tenants:
-            try:
-                tenant_manager.drop_database(tenant.slug)
-            except Exception:
-                pass
-            db.session.delete(tenant)
-        db.session.commit()
-
-
-@pytest.fixture
-def integration_client(integration_app):
-    """Create test client for integration tests."""
-    return integration_app.test_client()
-
-
-@pytest.fixture
-def test_tenant(integration_app, integration_client):
-    """Create a test tenant for running queries tests."""
+@pytest.fixture(scope='module')
+def test_tenant(integration_app):
+    """Create the test tenant once for all running queries tests."""
     payload = {
         'name': 'Test Running Queries',
         'slug': 'test-running-queries'
     }
-    response = integration_client.post('/api/tenants', json=payload)
+    response = integration_app.test_client().post('/api/tenants', json=payload)
     assert response.status_code == 201
     return response.get_json()
 
@@ -54,9 +28,10 @@ def test_tenant(integration_app, integration_client):
 def test_server(integration_app, test_tenant):
     """Create a test server in the tenant database."""
     session = tenant_manager.get_session(test_tenant['slug'])
+    server_id = uuid4()
     try:
         server = Server(
-            id=uuid4(),
+            id=server_id,
             name='Test SQL Server',
             hostname='localhost',
             port=1433,
@@ -79,8 +54,18 @@ def test_server(integration_app, test_tenant):
         session.add(config)
         session.commit()
 
-        yield {'server': server, 'config': config, 'tenant_slug': test_tenant['slug']}
+        yield {
+            'server': server,
+            'server_id': server_id,
+            'config': config,
+            'tenant_slug': test_tenant['slug'],
+        }
     finally:
+        # The tenant is shared by the module's tests; deleting the server
+        # cascades to its collection config and snapshots
+        session.rollback()
+        session.execute(delete(Server).where(Server.id == server_id))
+        session.commit()
         session.remove()
 
 
@@ -139,7 +124,7 @@ class TestRunningQueriesCollection:
 
         # Create mock cursor that returns our test data
         mock_cursor = MagicMock()
-        mock_cursor.fetchall.return_value = mock_running_queries
+        mock_cursor.fetchmany.side_effect = [mock_running_queries, []]
         mock_cursor.fetchone.side_effect = [
             (50,),  # CPU
             (65.5,),  # Memory
@@ -159,8 +144,8 @@ class TestRunningQueriesCollection:
 
             try:
                 # Re-fetch server and config in this session
-                server = session.query(Server).filter_by(name='Test SQL Server').first()
-                config = session.query(CollectionConfig).filter_by(server_id=server.id).first()
+                server = session.get(Server, test_server['server_id'])
+                config = session.get(CollectionConfig, test_server['server_id'])
 
                 # Create metric collector and call _collect_running_queries directly
                 collector = MetricCollector()
@@ -206,27 +191,40 @@ class TestRunningQueriesCollection:
             session = tenant_manager.get_session(tenant_slug)
             try:
                 # Re-fetch server in this session
-                server = session.query(Server).filter_by(name='Test SQL Server').first()
-                assert server is not None, "Server not found in database"
-
-                # Insert a test query snapshot directly
-                snapshot = RunningQuerySnapshot(
-                    server_id=server.id,
-                    collected_at=datetime.now(timezone.utc),
-                    session_id=100,
-                    request_id=1,
-                    database_name='TestDB',
-                    query_text='SELECT COUNT(*) FROM LargeTable',
-                    duration_ms=5000,
-                    status='running',
-                    wait_type='IO_COMPLETION',
-                    wait_time_ms=4000,
-                    cpu_time_ms=1000,
-                    logical_reads=100000,
-                    physical_reads=5000,
-                    writes=0
+                server = session.get(Server, test_server['server_id'])
+
+                # Insert a test query snapshot directly with plain INSERTs
+                # rather than through the unit of work; its text is stored
+                # once in query_texts
+                query_text = 'SELECT COUNT(*) FROM LargeTable'
+                text_hash = QueryText.hash_text(query_text)
+                session.execute(
+                    pg_insert(QueryText).on_conflict_do_nothing(index_elements=['hash']),
+                    [{'hash': text_hash, 'text': query_text}]
                 )
-                session.add(snapshot)
+                session.execute(
+                    pg_insert(WaitType).on_conflict_do_nothing(index_elements=['name']),
+                    [{'name': 'IO_COMPLETION'}]
+                )
+                wait_type_id = session.execute(
+                    select(WaitType.id).where(WaitType.name == 'IO_COMPLETION')
+                ).scalar_one()
+                session.execute(insert(RunningQuerySnapshot), [{
+                    'server_id': server.id,
+                    'collected_at': datetime.now(timezone.utc),
+                    'session_id': 100,
+                    'request_id': 1,
+                    'database_name': 'TestDB',
+                    'query_text_hash': text_hash,
+                    'duration_ms': 5000,
+                    'status': 'running',
+                    'wait_type_id': wait_type_id,
+                    'wait_time_ms': 4000,
+                    'cpu_time_ms': 1000,
+                    'logical_reads': 100000,
+                    'physical_reads': 5000,
+                    'writes': 0,
+                }])
                 session.commit()
                 server_id = str(server.id)
             finally:
@@ -262,8 +260,8 @@ class TestRunningQueriesCollection:
         with integration_app.app_context():
             session = tenant_manager.get_session(tenant_slug)
             try:
-                server = session.query(Server).filter_by(name='Test SQL Server').first()
-                config = session.query(CollectionConfig).filter_by(server_id=server.id).first()
+                server = session.get(Server, test_server['server_id'])
+                config = session.get(CollectionConfig, test_server['server_id'])
 
                 # Set minimum duration to 1000ms
                 config.query_min_duration_ms = 1000
@@ -271,6 +269,16 @@ class TestRunningQueriesCollection:
 
                 # Verify config was updated
                 assert config.query_min_duration_ms == 1000
+
+                # The threshold is bound into the SQL Server query
+                mock_cursor = MagicMock()
+                mock_cursor.fetchmany.return_value = []
+                collector = MetricCollector()
+                collector._collect_running_queries(session, server, config, mock_cursor)
+
+                sql, params = mock_cursor.execute.call_args[0]
+                assert 'DATEDIFF(MILLISECOND, r.start_time, GETDATE()) >= ?' in sql
+                assert params[0] == 1000
             finally:
                 session.remove()
 
@@ -281,8 +289,7 @@ class TestRunningQueriesCollection:
         with integration_app.app_context():
             session = tenant_manager.get_session(tenant_slug)
             try:
-                server = session.query(Server).filter_by(name='Test SQL Server').first()
-                assert server is not None, "Server not found in database"
+                server = session.get(Server, test_server['server_id'])
                 server_id = str(server.id)
             finally:
                 session.remove()
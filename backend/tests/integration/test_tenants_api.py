@@ -1,35 +1,4 @@
 """Integration tests for tenant API endpoints."""
-import pytest
-from app import create_app
-from app.extensions import db
-from app.models import Tenant
-from app.core import tenant_manager
-
-
-@pytest.fixture
-def integration_app():
-    """Create application with real database for integration testing."""
-    app = create_app('development')
-    app.config['SQLALCHEMY_ECHO'] = False  # Reduce noise in test output
-
-    with app.app_context():
-        db.create_all()
-        yield app
-        # Cleanup: remove any test tenants
-        test_tenants = Tenant.query.filter(Tenant.slug.like('test-%')).all()
-        for tenant in test_tenants:
-            try:
-                tenant_manager.drop_database(tenant.slug)
-            except Exception:
-                pass
-            db.session.delete(tenant)
-        db.session.commit()
-
-
-@pytest.fixture
-def integration_client(integration_app):
-    """Create test client for integration tests."""
-    return integration_app.test_client()
 
 
 class TestTenantsAPI:
@@ -0,0 +1,39 @@
+"""Tests for the orjson JSON provider."""
+import uuid
+from datetime import datetime, timezone
+from decimal import Decimal
+
+from flask.json.provider import DefaultJSONProvider
+
+from app.json_provider import OrjsonProvider
+
+
+class TestOrjsonProvider:
+    """Tests for OrjsonProvider output."""
+
+    def test_app_uses_orjson_provider(self, app):
+        """Test the app factory installs the provider."""
+        assert isinstance(app.json, OrjsonProvider)
+
+    def test_matches_default_provider(self, app):
+        """Test output matches Flask's default provider for API values."""
+        obj = {
+            'updated_at': datetime(2026, 1, 1, tzinfo=timezone.utc),
+            'id': uuid.UUID(int=5),
+            'value': Decimal('1.5'),
+            'nested': {'b': [1, 2.5, None, True], 'a': 'x'},
+        }
+        expected = DefaultJSONProvider(app).dumps(obj, separators=(',', ':'))
+
+        assert app.json.dumps(obj) == expected
+
+    def test_error_response(self, client):
+        """Test jsonify responses parse back unchanged."""
+        response = client.get('/api/test-tenant-required')
+
+        assert response.get_json() == {
+            'error': {
+                'code': 'MISSING_TENANT',
+                'message': 'X-Tenant-Slug header is required'
+            }
+        }
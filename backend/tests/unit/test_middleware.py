@@ -28,6 +28,11 @@ class TestTenantMiddlewareExclusions:
         assert middleware._is_excluded('/api/servers') is False
         assert middleware._is_excluded('/api/policies') is False
 
+    def test_excluded_path_prefix_without_separator_not_excluded(self):
+        """Test a path merely starting with an excluded path is not excluded."""
+        middleware = TenantMiddleware()
+        assert middleware._is_excluded('/api/tenantsx') is False
+
 
 class TestTenantMiddlewareIntegration:
     """Integration tests for tenant middleware."""
@@ -91,3 +96,52 @@ class TestTenantMiddlewareIntegration:
         assert response.status_code == 200
         data = response.get_json()
         assert data['tenant'] == 'active-tenant'
+
+
+class TestTenantMiddlewareCache:
+    """Test tenant lookup caching."""
+
+    def test_lookup_is_cached(self, app):
+        """Test a resolved tenant is served from the cache."""
+        from app.extensions import db
+        from app.models import Tenant
+
+        middleware = TenantMiddleware()
+        with app.app_context():
+            db.session.add(Tenant(name='Cached', slug='cached-tenant', status='active'))
+            db.session.commit()
+
+            first = middleware._get_tenant('cached-tenant')
+            assert first.slug == 'cached-tenant'
+            assert middleware._get_tenant('cached-tenant') is first
+
+    def test_unknown_tenant_not_cached(self, app):
+        """Test a tenant created after a failed lookup is found."""
+        from app.extensions import db
+        from app.models import Tenant
+
+        middleware = TenantMiddleware()
+        with app.app_context():
+            assert middleware._get_tenant('late-tenant') is None
+
+            db.session.add(Tenant(name='Late', slug='late-tenant', status='active'))
+            db.session.commit()
+
+            assert middleware._get_tenant('late-tenant').status == 'active'
+
+    def test_tenant_update_invalidates_cache(self, app):
+        """Test suspending a tenant is seen on the next lookup."""
+        from app.extensions import db
+        from app.models import Tenant
+
+        middleware = TenantMiddleware()
+        with app.app_context():
+            tenant = Tenant(name='Changing', slug='changing-tenant', status='active')
+            db.session.add(tenant)
+            db.session.commit()
+            assert middleware._get_tenant('changing-tenant').status == 'active'
+
+            tenant.status = 'suspended'
+            db.session.commit()
+
+            assert middleware._get_tenant('changing-tenant').status == 'suspended'
@@ -1,4 +1,6 @@
 import pytest
+from datetime import datetime, timezone
+
 from app.models.system import Tenant
 
 
@@ -50,6 +52,10 @@ class TestTenantSlugValidation:
         assert Tenant.validate_slug('demo.tenant') is False
         assert Tenant.validate_slug('demo@tenant') is False
 
+    def test_invalid_slug_trailing_newline(self):
+        """Invalid slug - trailing newline."""
+        assert Tenant.validate_slug('demo\n') is False
+
     def test_invalid_slug_empty(self):
         """Invalid slug - empty string."""
         assert Tenant.validate_slug('') is False
@@ -114,3 +120,62 @@ class TestTenantModel:
             with pytest.raises(ValueError):
                 db.session.add(tenant)
                 db.session.flush()
+
+
+class TestTenantNextJobHint:
+    """Test the scheduler's next_job_at hint updates."""
+
+    def _tenant(self, next_job_at=None):
+        from app.extensions import db
+
+        tenant = Tenant(name='Hint Tenant', slug='hint', next_job_at=next_job_at)
+        db.session.add(tenant)
+        db.session.commit()
+        return tenant
+
+    def _hint(self):
+        from app.extensions import db
+
+        hint = db.session.execute(
+            db.select(Tenant.next_job_at).where(Tenant.slug == 'hint')
+        ).scalar_one()
+        # SQLite drops the timezone; the tests use UTC throughout
+        return hint.replace(tzinfo=timezone.utc) if hint else None
+
+    def test_set_applies_when_nothing_was_scheduled(self, app):
+        """Test the scheduler's hint is stored when no job changed meanwhile."""
+        with app.app_context():
+            tenant = self._tenant()
+            version = tenant.next_job_version
+            later = datetime(2030, 1, 1, tzinfo=timezone.utc)
+
+            Tenant.set_next_job_at('hint', later, expected_version=version)
+
+            assert self._hint() == later
+
+    def test_job_scheduled_during_tick_is_not_overwritten(self, app):
+        """Test a job scheduled while the hint is unset survives the tick's write."""
+        with app.app_context():
+            # Tick starts: hint is NULL, so lowering it changes nothing
+            tenant = self._tenant()
+            version = tenant.next_job_version
+
+            # A job is created before the tick writes its hint
+            soon = datetime(2030, 1, 1, 0, 1, tzinfo=timezone.utc)
+            Tenant.lower_next_job_at('hint', soon)
+
+            # The tick computed its hint without seeing that job
+            later = datetime(2030, 1, 1, 1, 0, tzinfo=timezone.utc)
+            Tenant.set_next_job_at('hint', later, expected_version=version)
+
+            assert self._hint() is None
+
+    def test_lower_moves_hint_earlier_only(self, app):
+        """Test lowering keeps the earlier of the current hint and the job time."""
+        with app.app_context():
+            early = datetime(2030, 1, 1, tzinfo=timezone.utc)
+            self._tenant(next_job_at=early)
+
+            Tenant.lower_next_job_at('hint', datetime(2030, 6, 1, tzinfo=timezone.utc))
+
+            assert self._hint() == early
@@ -0,0 +1,286 @@
+"""Unit tests for scheduler service."""
+import os
+import threading
+import time
+import uuid
+from datetime import datetime, timezone
+from unittest.mock import MagicMock
+
+import pytest
+
+from app.models.tenant import Job
+from app.services.scheduler_service import (
+    SchedulerService,
+    JobExecutor,
+    JobExecutionContext,
+    HANDLER_KIND_CPU,
+    custom_script_handler,
+    _parsed_cron,
+)
+
+
+def _pid_handler(context):
+    return {'pid': os.getpid(), 'script': context.job.configuration.get('script_content')}
+
+
+def _sleep_handler(context):
+    pid_file = context.job.configuration.get('pid_file')
+    if pid_file:
+        with open(pid_file, 'w') as f:
+            f.write(str(os.getpid()))
+    time.sleep(context.job.configuration.get('sleep_seconds', 10))
+    return {'pid': os.getpid()}
+
+
+class TestCalculateNextRun:
+    """Tests for SchedulerService.calculate_next_run."""
+
+    def _job(self, schedule_type, schedule_config):
+        return Job(
+            name='Test Job',
+            type=Job.TYPE_ALERT_CHECK,
+            schedule_type=schedule_type,
+            schedule_config=schedule_config,
+        )
+
+    def test_once_has_no_next_run(self):
+        """Test one-time jobs are not rescheduled."""
+        service = SchedulerService(session=None)
+        assert service.calculate_next_run(self._job(Job.SCHEDULE_ONCE, {})) is None
+
+    def test_interval_next_run(self):
+        """Test interval jobs run again after interval_seconds."""
+        service = SchedulerService(session=None)
+        before = datetime.now(timezone.utc)
+        next_run = service.calculate_next_run(
+            self._job(Job.SCHEDULE_INTERVAL, {'interval_seconds': 120})
+        )
+        assert 119 <= (next_run - before).total_seconds() <= 121
+
+    def test_cron_next_run_is_future_and_aware(self):
+        """Test cron jobs return a future, timezone-aware datetime."""
+        service = SchedulerService(session=None)
+        now = datetime.now(timezone.utc)
+        next_run = service.calculate_next_run(
+            self._job(Job.SCHEDULE_CRON, {'expression': '*/5 * * * *'})
+        )
+        assert next_run.tzinfo is not None
+        assert next_run > now
+        assert next_run.minute % 5 == 0
+
+    def test_cron_expression_parsed_once(self):
+        """Test repeated calls reuse the cached parsed schedule."""
+        service = SchedulerService(session=None)
+        job = self._job(Job.SCHEDULE_CRON, {'expression': '15 3 * * *'})
+
+        first = service.calculate_next_run(job)
+        hits = _parsed_cron.cache_info().hits
+        second = service.calculate_next_run(job)
+
+        assert first == second
+        assert _parsed_cron.cache_info().hits == hits + 1
+
+    def test_invalid_cron_returns_none(self):
+        """Test invalid cron expressions are not scheduled."""
+        service = SchedulerService(session=None)
+        job = self._job(Job.SCHEDULE_CRON, {'expression': 'not a cron'})
+        assert service.calculate_next_run(job) is None
+
+
+class TestRebind:
+    """Tests for SchedulerService.rebind."""
+
+    def test_rebind_switches_session_and_forgets_claims(self):
+        """Test rebinding uses the new session and clears tracked claims."""
+        service = SchedulerService(session=object())
+        service.claimed_due_at['job'] = datetime.now(timezone.utc)
+
+        new_session = object()
+        service.rebind(new_session)
+
+        assert service.session is new_session
+        assert service.claimed_due_at == {}
+
+
+class TestReload:
+    """Tests for SchedulerService._reload."""
+
+    def test_reload_skips_deleted_rows(self):
+        """Test ids whose rows are gone are left out instead of raising."""
+        kept = [Job(id=uuid.uuid4(), name='Kept', type=Job.TYPE_CUSTOM_SCRIPT) for _ in range(2)]
+        session = MagicMock()
+        session.execute.return_value.scalars.return_value = list(reversed(kept))
+        service = SchedulerService(session=session)
+
+        reloaded = service._reload(Job, [kept[0].id, uuid.uuid4(), kept[1].id])
+
+        assert reloaded == kept
+
+
+class TestJobExecutorTimeout:
+    """Tests for JobExecutor timeout handling."""
+
+    def _context(self, configuration=None):
+        job = Job(name='Slow Job', type=Job.TYPE_CUSTOM_SCRIPT, configuration=configuration or {})
+        return JobExecutionContext(job=job, execution=None, session=None, tenant_slug='test')
+
+    def _slow_handler(self, context):
+        time.sleep(2.5)
+        return {}
+
+    def _socket_timeout_handler(self, context):
+        raise TimeoutError('Login timeout expired')
+
+    def test_timeout_interrupts_handler_in_main_thread(self):
+        """Test the alarm-based timeout stops the handler itself."""
+        executor = JobExecutor(max_workers=1)
+        executor.register_handler(Job.TYPE_CUSTOM_SCRIPT, self._slow_handler)
+
+        start = time.monotonic()
+        success, result, error = executor.execute(self._context(), timeout=0.2)
+
+        assert success is False
+        assert 'timed out' in error
+        assert time.monotonic() - start < 1
+        executor.shutdown()
+
+    def _checking_handler(self, context):
+        for _ in range(50):
+            context.check_timeout()
+            time.sleep(0.05)
+        return {}
+
+    def _execute_in_thread(self, executor, context, timeout):
+        outcome = {}
+        thread = threading.Thread(
+            target=lambda: outcome.update(result=executor.execute(context, timeout=timeout))
+        )
+        thread.start()
+        thread.join()
+        return outcome['result']
+
+    def test_io_handler_in_worker_thread_gets_live_context(self):
+        """Test io handlers called off the main thread run in place with the session."""
+        executor = JobExecutor(max_workers=1)
+        session = object()
+        executor.register_handler(
+            Job.TYPE_CUSTOM_SCRIPT,
+            lambda context: {'session': context.session, 'thread': threading.current_thread()}
+        )
+        context = JobExecutionContext(
+            job=Job(name='Job', type=Job.TYPE_CUSTOM_SCRIPT, configuration={}),
+            execution=None, session=session, tenant_slug='test'
+        )
+
+        success, result, error = self._execute_in_thread(executor, context, timeout=5)
+
+        assert success is True
+        assert error is None
+        assert result['session'] is session
+        assert result['thread'] is not threading.main_thread()
+        executor.shutdown()
+
+    def test_timeout_checked_by_handler_in_worker_thread(self):
+        """Test io handlers off the main thread stop at check_timeout() past the deadline."""
+        executor = JobExecutor(max_workers=1)
+        executor.register_handler(Job.TYPE_CUSTOM_SCRIPT, self._checking_handler)
+
+        start = time.monotonic()
+        success, _, error = self._execute_in_thread(executor, self._context(), timeout=0.2)
+
+        assert success is False
+        assert 'timed out' in error
+        assert time.monotonic() - start < 1
+        executor.shutdown()
+
+    def test_overrunning_handler_in_worker_thread_is_timed_out(self):
+        """Test a handler that ignores the deadline is still reported as timed out."""
+        executor = JobExecutor(max_workers=1)
+        executor.register_handler(Job.TYPE_CUSTOM_SCRIPT, lambda context: time.sleep(0.3) or {})
+
+        success, result, error = self._execute_in_thread(executor, self._context(), timeout=0.1)
+
+        assert success is False
+        assert result is None
+        assert 'timed out' in error
+        executor.shutdown()
+
+    def test_handler_timeout_error_is_not_a_job_timeout(self):
+        """Test a TimeoutError raised by the handler is reported as its own failure."""
+        executor = JobExecutor(max_workers=1)
+        executor.register_handler(Job.TYPE_CUSTOM_SCRIPT, self._socket_timeout_handler)
+
+        success, _, error = executor.execute(self._context(), timeout=5)
+
+        assert success is False
+        assert error == 'Login timeout expired'
+        executor.shutdown()
+
+
+class TestJobExecutorProcessPool:
+    """Tests for CPU-bound handlers run in worker processes."""
+
+    def _context(self, configuration=None):
+        job = Job(name='Script Job', type=Job.TYPE_CUSTOM_SCRIPT, configuration=configuration or {})
+        return JobExecutionContext(job=job, execution=None, session=None, tenant_slug='test')
+
+    def test_cpu_handler_runs_in_worker_process(self):
+        """Test 'cpu' handlers run outside this process with a detached context."""
+        executor = JobExecutor(max_workers=1)
+        executor.register_handler(Job.TYPE_CUSTOM_SCRIPT, _pid_handler, kind=HANDLER_KIND_CPU)
+
+        success, result, error = executor.execute(self._context({'script_content': 'SELECT 1'}))
+
+        assert success is True
+        assert error is None
+        assert result['pid'] != os.getpid()
+        assert result['script'] == 'SELECT 1'
+        executor.shutdown()
+
+    def test_cpu_handler_timeout_terminates_worker(self, tmp_path):
+        """Test a timed-out process handler fails and its worker is killed."""
+        executor = JobExecutor(max_workers=1)
+        executor.register_handler(Job.TYPE_CUSTOM_SCRIPT, _sleep_handler, kind=HANDLER_KIND_CPU)
+        pid_file = tmp_path / 'pid'
+
+        success, _, error = executor.execute(self._context({'pid_file': str(pid_file)}), timeout=3)
+
+        assert success is False
+        assert 'timed out' in error
+        with pytest.raises(ProcessLookupError):
+            os.kill(int(pid_file.read_text()), 0)
+
+        executor.register_handler(Job.TYPE_CUSTOM_SCRIPT, custom_script_handler, kind=HANDLER_KIND_CPU)
+        success, result, _ = executor.execute(self._context({'script_content': 'SELECT 1'}))
+        assert success is True
+        assert result['script_length'] == 8
+        executor.shutdown()
+
+    def test_cpu_handler_timeout_leaves_other_jobs_running(self):
+        """Test a timeout only recycles the timed-out job's worker."""
+        executor = JobExecutor(max_workers=2)
+        executor.register_handler(Job.TYPE_CUSTOM_SCRIPT, _sleep_handler, kind=HANDLER_KIND_CPU)
+        outcome = {}
+
+        thread = threading.Thread(
+            target=lambda: outcome.update(result=executor.execute(
+                self._context({'sleep_seconds': 3}), timeout=10
+            ))
+        )
+        thread.start()
+        success, _, _ = executor.execute(self._context(), timeout=3)
+        thread.join()
+
+        assert success is False
+        other_success, other_result, other_error = outcome['result']
+        assert other_success is True
+        assert other_error is None
+        assert other_result['pid'] != os.getpid()
+        executor.shutdown()
+
+    def test_invalid_handler_kind(self):
+        """Test unknown handler kinds are rejected."""
+        executor = JobExecutor(max_workers=1)
+        with pytest.raises(ValueError):
+            executor.register_handler(Job.TYPE_CUSTOM_SCRIPT, _pid_handler, kind='gpu')
+        executor.shutdown()
@@ -1,10 +1,11 @@
 """Tests for Server model."""
+import time
 import uuid
 from datetime import datetime, timezone
 
 import pytest
 
-from app.models.tenant import Server
+from app.models.tenant import Server, uuid7
 
 
 class TestServerModel:
@@ -110,3 +111,21 @@ class TestServerModel:
         assert Server.AUTH_TYPE_WINDOWS == 'windows'
         assert 'sql' in Server.VALID_AUTH_TYPES
         assert 'windows' in Server.VALID_AUTH_TYPES
+
+
+class TestUuid7:
+    """Tests for time-ordered primary key generation."""
+
+    def test_version_and_variant(self):
+        """Test generated ids are RFC 9562 version 7 UUIDs."""
+        value = uuid7()
+
+        assert value.version == 7
+        assert value.variant == uuid.RFC_4122
+
+    def test_ids_sort_by_creation_time(self):
+        """Test ids from different milliseconds sort in creation order."""
+        first = uuid7()
+        time.sleep(0.002)
+
+        assert uuid7() > first
@@ -178,15 +178,23 @@ class TestSQLServerConnector:
 
         assert edition == "Express"
 
+    def test_parse_version_ignores_host_os_edition(self):
+        """Test the host OS edition after the SQL Server edition is ignored."""
+        connector = SQLServerConnector()
+        version_str = "Microsoft SQL Server 2019 (RTM) - 15.0.2000.5 (X64)   Developer Edition (64-bit) on Windows Server 2019 Standard 10.0 <X64>"
+
+        major, edition, product_version = connector._parse_version(version_str)
+
+        assert edition == "Developer"
+
     def test_categorize_error_auth_failed(self):
         """Test error categorization for auth failure."""
         connector = SQLServerConnector()
 
-        # Mock pyodbc error
-        mock_error = Mock()
-        mock_error.__str__ = Mock(return_value="Login failed for user 'sa' (18456)")
+        # Same args shape as pyodbc.Error: (SQLSTATE, message)
+        error = Exception('28000', "[28000] Login failed for user 'sa'. (18456)")
 
-        msg, code = connector._categorize_error(mock_error)
+        msg, code = connector._categorize_error(error)
 
         assert code == "AUTH_FAILED"
         assert "Authentication failed" in msg
@@ -195,10 +203,9 @@ class TestSQLServerConnector:
         """Test error categorization for connection failure."""
         connector = SQLServerConnector()
 
-        mock_error = Mock()
-        mock_error.__str__ = Mock(return_value="TCP Provider: No connection could be made")
+        error = Exception('08001', "[08001] TCP Provider: No connection could be made")
 
-        msg, code = connector._categorize_error(mock_error)
+        msg, code = connector._categorize_error(error)
 
         assert code == "CONNECTION_FAILED"
         assert "Cannot connect" in msg
@@ -207,10 +214,9 @@ class TestSQLServerConnector:
         """Test error categorization for timeout."""
         connector = SQLServerConnector()
 
-        mock_error = Mock()
-        mock_error.__str__ = Mock(return_value="Timeout expired while attempting to connect")
+        error = Exception('HYT00', "[HYT00] Timeout expired while attempting to connect")
 
-        msg, code = connector._categorize_error(mock_error)
+        msg, code = connector._categorize_error(error)
 
         assert code == "TIMEOUT"
         assert "timed out" in msg
@@ -219,14 +225,33 @@ class TestSQLServerConnector:
         """Test error categorization for driver not found."""
         connector = SQLServerConnector()
 
-        mock_error = Mock()
-        mock_error.__str__ = Mock(return_value="Data source name not found and no default driver specified")
+        error = Exception('IM002', "[IM002] Data source name not found and no default driver specified")
 
-        msg, code = connector._categorize_error(mock_error)
+        msg, code = connector._categorize_error(error)
 
         assert code == "DRIVER_NOT_FOUND"
         assert "ODBC driver" in msg
 
+    def test_categorize_error_by_sqlstate(self):
+        """Test the SQLSTATE decides the category without a message match."""
+        connector = SQLServerConnector()
+
+        error = Exception('28000', "[28000] Invalid authorization specification")
+
+        msg, code = connector._categorize_error(error)
+
+        assert code == "AUTH_FAILED"
+
+    def test_categorize_error_falls_back_to_message(self):
+        """Test an ambiguous SQLSTATE is categorized by its message."""
+        connector = SQLServerConnector()
+
+        error = Exception('08001', "[08001] SSL Provider: The certificate chain was issued by an untrusted authority")
+
+        msg, code = connector._categorize_error(error)
+
+        assert code == "SSL_ERROR"
+
 
 @pytest.mark.skipif(not PYODBC_AVAILABLE, reason="pyodbc not installed")
 class TestSQLServerConnectorIntegration:
@@ -1,15 +1,23 @@
 """Background worker for collecting metrics from SQL Servers."""
 import signal
+import threading
 import time
 import logging
 from datetime import datetime, timezone
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FuturesTimeoutError, as_completed
+from functools import lru_cache
 from typing import Optional
 
 from app import create_app
 from app.extensions import db
 from app.models.system import Tenant
-from app.models.tenant import Server, ServerSnapshot, CollectionConfig, RunningQuerySnapshot
+from sqlalchemy import insert, literal_column, or_, select, text
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+
+from app.models.tenant import (
+    Server, ServerSnapshot, CollectionConfig, QueryText, RunningQuerySnapshot, RunningQueryHourly,
+    WaitType, QUERY_STATUSES,
+)
 from app.core.tenant_manager import tenant_manager
 from app.core.encryption import decrypt_password, EncryptionError
 from app.connectors import SQLServerConnector
@@ -23,6 +31,138 @@ logging.basicConfig(
 logger = logging.getLogger('metric_collector')
 
 
+@lru_cache(maxsize=1024)
+def _decrypt_cached(encrypted_password: str) -> str:
+    """Decrypt a server password, reusing the result on later cycles.
+
+    Keyed by the ciphertext, so a changed password is a new entry;
+    failures raise and are not cached.
+    """
+    return decrypt_password(encrypted_password)
+
+
+def _close_quietly(conn):
+    """Close a SQL Server connection, ignoring errors from a dead one."""
+    try:
+        conn.close()
+    except Exception:
+        pass
+
+
+# Set once per connection: monitoring reads give up on a lock after a
+# second instead of waiting out the collection timeout, and don't take
+# shared locks on the objects they read
+_SESSION_SETUP = "SET LOCK_TIMEOUT 1000; SET TRANSACTION ISOLATION LEVEL READ UNCOMMITTED;"
+
+
+# Applies to the current tenant database transaction only
+_ASYNC_COMMIT = text("SET LOCAL synchronous_commit TO OFF")
+
+
+# (metric key, single value query), in the column order of _METRICS_QUERY
+_METRIC_QUERIES = (
+    ('cpu_percent', """
+        SELECT TOP 1
+            record.value('(./Record/SchedulerMonitorEvent/SystemHealth/ProcessUtilization)[1]', 'int') AS SqlProcessUtilization
+        FROM (
+            SELECT CAST(record AS XML) AS record
+            FROM sys.dm_os_ring_buffers
+            WHERE ring_buffer_type = N'RING_BUFFER_SCHEDULER_MONITOR'
+            AND record LIKE '%<SystemHealth>%'
+        ) AS t
+    """),
+    ('memory_percent', """
+        SELECT TOP 1
+            (total_physical_memory_kb - available_physical_memory_kb) * 100.0 / total_physical_memory_kb
+        FROM sys.dm_os_sys_memory
+    """),
+    ('connection_count', "SELECT COUNT(*) FROM sys.dm_exec_sessions WHERE is_user_process = 1"),
+    ('batch_requests_sec', """
+        SELECT TOP 1 cntr_value
+        FROM sys.dm_os_performance_counters
+        WHERE counter_name = 'Batch Requests/sec'
+    """),
+    ('page_life_expectancy', """
+        SELECT TOP 1 cntr_value
+        FROM sys.dm_os_performance_counters
+        WHERE counter_name = 'Page life expectancy'
+        AND object_name LIKE '%Buffer Manager%'
+    """),
+    ('blocked_processes', "SELECT COUNT(*) FROM sys.dm_exec_requests WHERE blocking_session_id > 0"),
+)
+
+# All metrics as scalar subqueries of one SELECT, one column per metric
+_METRICS_QUERY = 'SELECT ' + ',\n'.join(
+    f'({query}) AS {key}' for key, query in _METRIC_QUERIES
+)
+
+
+# Conditions for the optional running query filters, in the order of the
+# CollectionConfig query_filter_* columns they bind
+_RUNNING_QUERY_FILTERS = (
+    "DB_NAME(r.database_id) LIKE ?",
+    "s.login_name LIKE ?",
+    "s.nt_user_name LIKE ?",
+    "t.text LIKE ?",
+    "t.text NOT LIKE ?",
+)
+
+
+@lru_cache(maxsize=2 ** len(_RUNNING_QUERY_FILTERS))
+def _running_queries_sql(active_filters: tuple[bool, ...]) -> str:
+    """Build the running queries SQL for a combination of active filters.
+
+    Args:
+        active_filters: Whether each of _RUNNING_QUERY_FILTERS is applied
+
+    Returns:
+        SQL taking the minimum duration and then each active filter's
+        pattern as parameters
+    """
+    where_conditions = [
+        "r.session_id > 50",
+        "r.session_id != @@SPID",
+        "r.sql_handle IS NOT NULL",
+        "DATEDIFF(MILLISECOND, r.start_time, GETDATE()) >= ?",
+    ]
+    where_conditions.extend(
+        condition for condition, active in zip(_RUNNING_QUERY_FILTERS, active_filters) if active
+    )
+    where_clause = " AND ".join(where_conditions)
+
+    # Always join sys.dm_exec_sessions for analytics breakdowns
+    return f"""
+        SELECT
+            r.session_id,
+            r.request_id,
+            r.blocking_session_id,
+            DB_NAME(r.database_id) AS database_name,
+            s.login_name,
+            s.host_name,
+            s.program_name,
+            SUBSTRING(t.text,
+                (r.statement_start_offset/2) + 1,
+                ((CASE WHEN r.statement_end_offset = -1
+                     THEN LEN(CONVERT(NVARCHAR(MAX), t.text)) * 2
+                     ELSE r.statement_end_offset
+                END) - r.statement_start_offset) / 2 + 1) AS query_text,
+            r.start_time,
+            DATEDIFF(MILLISECOND, r.start_time, GETDATE()) AS duration_ms,
+            r.status,
+            r.wait_type,
+            r.wait_time AS wait_time_ms,
+            r.cpu_time AS cpu_time_ms,
+            r.logical_reads,
+            r.reads AS physical_reads,
+            r.writes
+        FROM sys.dm_exec_requests r
+        CROSS APPLY sys.dm_exec_sql_text(r.sql_handle) t
+        JOIN sys.dm_exec_sessions s ON r.session_id = s.session_id
+        WHERE {where_clause}
+        ORDER BY r.start_time
+    """
+
+
 class MetricCollector:
     """
     Background worker that collects metrics from SQL Servers.
@@ -34,7 +174,8 @@ class MetricCollector:
     # Default settings
     DEFAULT_CONCURRENCY = 10
     MAIN_LOOP_INTERVAL = 30  # seconds between collection cycles
-    COLLECTION_TIMEOUT = 5  # seconds per server
+    RUNNING_QUERY_BATCH_SIZE = 500  # rows fetched and inserted at a time
+    CONNECTION_IDLE_TIMEOUT = 300  # seconds an unused cached connection is kept
 
     def __init__(self, concurrency: int = DEFAULT_CONCURRENCY):
         """
@@ -44,10 +185,23 @@ class MetricCollector:
             concurrency: Number of parallel server connections
         """
         self.app = create_app()
+        # Every worker thread may hold a connection to the same tenant; past
+        # the pool size, connections would be opened and closed each cycle
+        self.app.config['TENANT_DB_POOL_SIZE'] = max(
+            self.app.config.get('TENANT_DB_POOL_SIZE', 5), concurrency
+        )
         self.running = True
         self.concurrency = concurrency
         self.executor: Optional[ThreadPoolExecutor] = None
         self.connector = None
+        # wait_types ids by (tenant database, wait type name); ids never
+        # change once assigned, so lookups only hit the database for new names
+        self._wait_type_ids: dict[tuple[str, str], int] = {}
+        # Open SQL Server connections reused across cycles, by (tenant, server
+        # id) -> (connection settings, last used, connection); a connection
+        # is taken out while in use so no two threads share one
+        self._connections: dict[tuple, tuple[tuple, float, object]] = {}
+        self._connections_lock = threading.Lock()
 
     def setup(self):
         """Initialize resources."""
@@ -68,6 +222,8 @@ class MetricCollector:
             self.executor.shutdown(wait=True)
             logger.info("Thread pool shut down")
 
+        self._close_connections(lambda last_used: True)
+
     def run(self):
         """Main worker loop."""
         # Setup signal handlers
@@ -101,53 +257,95 @@ class MetricCollector:
 
     def collect_all(self):
         """Collect metrics from all active tenants."""
+        # Servers no longer collected (disabled, deleted, moved to a longer
+        # interval) shouldn't hold connections open indefinitely
+        idle_before = time.monotonic() - self.CONNECTION_IDLE_TIMEOUT
+        self._close_connections(lambda last_used: last_used < idle_before)
+
         with self.app.app_context():
             try:
                 tenants = Tenant.query.filter_by(status='active').all()
                 logger.info(f"Processing {len(tenants)} active tenants")
 
+                # Submit every tenant's servers before waiting on any, so the
+                # pool's workers are shared across tenants instead of one
+                # tenant's slowest server holding up the next tenant
+                futures = {}
                 for tenant in tenants:
                     if not self.running:
                         break
                     try:
-                        self.collect_tenant(tenant)
+                        futures.update(self.collect_tenant(tenant))
                     except Exception as e:
                         logger.exception(f"Error collecting tenant {tenant.slug}: {e}")
 
+                self._wait_for_collections(futures)
+
             except Exception as e:
                 logger.exception(f"Error querying tenants: {e}")
 
-    def collect_tenant(self, tenant: Tenant):
-        """Collect metrics from all enabled servers for a tenant."""
+    def _wait_for_collections(self, futures: dict):
+        """
+        Wait for a cycle's collections against one shared deadline.
+
+        Collections still queued when the cycle's interval runs out are
+        cancelled, as the next cycle submits those servers again; ones
+        already running are left to finish.
+
+        Args:
+            futures: Submitted collection futures mapped to their server id
+        """
+        try:
+            for future in as_completed(futures, timeout=self.MAIN_LOOP_INTERVAL):
+                try:
+                    future.result()
+                except Exception as e:
+                    logger.warning(f"Collection error for server {futures[future]}: {e}")
+        except FuturesTimeoutError:
+            cancelled = [server_id for future, server_id in futures.items() if future.cancel()]
+            running = [server_id for future, server_id in futures.items() if not future.done()]
+            logger.warning(
+                f"Collection cycle overran {self.MAIN_LOOP_INTERVAL}s: "
+                f"{len(cancelled)} queued collections cancelled, {len(running)} still running"
+            )
+
+    def collect_tenant(self, tenant: Tenant) -> list:
+        """Submit collection for all of a tenant's enabled servers that are due.
+
+        Returns:
+            (future, server id) pairs for the submitted collections
+        """
+        futures = []
+        session = None
         try:
             session = tenant_manager.get_session(tenant.slug)
 
-            # Query servers with collection enabled
+            # Query servers with collection enabled whose interval has
+            # elapsed, so servers that aren't due are never loaded
+            now = datetime.now(timezone.utc)
             servers_with_config = session.query(Server, CollectionConfig).join(
                 CollectionConfig,
                 Server.id == CollectionConfig.server_id
             ).filter(
                 Server.is_deleted == False,
-                CollectionConfig.enabled == True
+                CollectionConfig.enabled == True,
+                or_(
+                    CollectionConfig.last_collected_at.is_(None),
+                    CollectionConfig.last_collected_at
+                    <= now - CollectionConfig.interval_seconds * literal_column("interval '1 second'")
+                )
             ).all()
 
             if not servers_with_config:
-                return
+                return futures
 
             logger.info(f"Tenant {tenant.slug}: collecting from {len(servers_with_config)} servers")
 
             # Submit collection tasks
-            futures = []
             for server, config in servers_with_config:
                 if not self.running:
                     break
 
-                # Check if enough time has passed since last collection
-                if config.last_collected_at:
-                    elapsed = (datetime.now(timezone.utc) - config.last_collected_at).total_seconds()
-                    if elapsed < config.interval_seconds:
-                        continue  # Skip, not time yet
-
                 future = self.executor.submit(
                     self.collect_server,
                     tenant.slug,
@@ -156,21 +354,17 @@ class MetricCollector:
                 )
                 futures.append((future, server.id))
 
-            # Wait for completion with timeout
-            for future, server_id in futures:
-                try:
-                    future.result(timeout=self.COLLECTION_TIMEOUT)
-                except Exception as e:
-                    logger.warning(f"Collection timeout/error for server {server_id}: {e}")
-
         except Exception as e:
             logger.exception(f"Error in tenant collection: {e}")
         finally:
             # Clean up session
-            try:
-                session.remove()
-            except Exception:
-                pass
+            if session:
+                try:
+                    session.remove()
+                except Exception:
+                    pass
+
+        return futures
 
     def collect_server(self, tenant_slug: str, server: Server, config: CollectionConfig):
         """
@@ -191,47 +385,48 @@ class MetricCollector:
             try:
                 session = tenant_manager.get_session(tenant_slug)
 
-                # Re-query server and config in this session to ensure they're tracked
-                server = session.query(Server).filter_by(id=server.id).first()
-                config = session.query(CollectionConfig).filter_by(server_id=server.id).first()
-                if not server or not config:
-                    logger.warning(f"Server or config not found for {tenant_slug}")
-                    return
+                # Attach the server and config loaded by collect_tenant to this
+                # thread's session; load=False trusts their state instead of
+                # selecting both rows again
+                server = session.merge(server, load=False)
+                config = session.merge(config, load=False)
+                # Commits expire the instance; keep the name for logging
+                # without reloading the row
+                server_name = server.name
 
                 # Decrypt password
                 password = None
                 if server.encrypted_password:
                     try:
-                        password = decrypt_password(server.encrypted_password)
+                        password = _decrypt_cached(server.encrypted_password)
                     except EncryptionError as e:
                         logger.error(f"Failed to decrypt password for {server.name}: {e}")
                         self._update_server_status(session, server, 'error')
                         return
 
                 # Connect and collect metrics
+                connection_key = (tenant_slug, server.id)
+                connection_settings = (
+                    server.hostname, server.port, server.instance_name,
+                    server.auth_type, server.username, server.encrypted_password,
+                )
                 try:
-                    conn = self.connector.connect(
-                        hostname=server.hostname,
-                        port=server.port,
-                        instance_name=server.instance_name,
-                        auth_type=server.auth_type,
-                        username=server.username,
-                        password=password,
-                        database='master'
-                    )
+                    conn = self._get_connection(connection_key, connection_settings, server, password)
                 except Exception as e:
                     logger.warning(f"Connection failed for {server.name}: {e}")
                     self._update_server_status(session, server, 'offline')
                     return
 
                 try:
+                    # One timestamp for everything this collection writes
+                    collected_at = datetime.now(timezone.utc)
                     cursor = conn.cursor()
                     metrics = self._collect_metrics(cursor)
 
                     # Create snapshot
                     snapshot = ServerSnapshot(
                         server_id=server.id,
-                        collected_at=datetime.now(timezone.utc),
+                        collected_at=collected_at,
                         cpu_percent=metrics.get('cpu_percent'),
                         memory_percent=metrics.get('memory_percent'),
                         connection_count=metrics.get('connection_count'),
@@ -244,24 +439,32 @@ class MetricCollector:
                     session.add(snapshot)
 
                     # Update config last_collected_at
-                    config.last_collected_at = datetime.now(timezone.utc)
+                    config.last_collected_at = collected_at
 
                     # Collect running queries if enabled
                     if config.query_collection_enabled:
-                        if self._should_collect_queries(config):
-                            self._collect_running_queries(session, server, config, cursor)
+                        if self._should_collect_queries(config, collected_at):
+                            self._collect_running_queries(session, server, config, cursor, collected_at)
 
-                    conn.close()
+                    # Don't wait for the WAL flush when this collection's
+                    # transaction commits: a database crash can then lose
+                    # the last moments of samples, but never corrupts them
+                    session.execute(_ASYNC_COMMIT)
 
                     # Update server status
-                    self._update_server_status(session, server, 'online')
+                    self._update_server_status(session, server, 'online', collected_at)
 
                     session.commit()
-                    logger.debug(f"Collected metrics from {server.name}")
+
+                    # Cache the connection only after the commit: the error
+                    # path closes conn, which must not happen once another
+                    # cycle can take it from the cache
+                    self._release_connection(connection_key, connection_settings, conn)
+                    logger.debug(f"Collected metrics from {server_name}")
 
                 except Exception as e:
                     logger.exception(f"Error collecting metrics from {server.name}: {e}")
-                    conn.close()
+                    _close_quietly(conn)
                     self._update_server_status(session, server, 'error')
 
             except Exception as e:
@@ -273,102 +476,129 @@ class MetricCollector:
                     except Exception:
                         pass
 
-    def _collect_metrics(self, cursor) -> dict:
+    def _get_connection(self, key: tuple, settings: tuple, server: Server, password: Optional[str]):
         """
-        Execute metric collection queries.
+        Get a connection to a server, reusing the one left by its last cycle.
+
+        A cached connection is only reused if the server's connection
+        settings are unchanged and it still answers a trivial query.
+
+        Args:
+            key: (tenant slug, server id)
+            settings: Server fields the connection was opened with
+            server: Server model instance
+            password: Decrypted password
 
         Returns:
-            Dict of collected metrics
+            pyodbc connection, taken out of the cache
         """
-        metrics = {}
+        with self._connections_lock:
+            cached = self._connections.pop(key, None)
 
-        # Collect CPU from ring buffers
+        if cached:
+            cached_settings, _, conn = cached
+            if cached_settings == settings:
+                try:
+                    conn.cursor().execute("SELECT 1").fetchone()
+                    return conn
+                except Exception as e:
+                    logger.debug(f"Cached connection to {server.name} is no longer usable: {e}")
+            _close_quietly(conn)
+
+        conn = self.connector.connect(
+            hostname=server.hostname,
+            port=server.port,
+            instance_name=server.instance_name,
+            auth_type=server.auth_type,
+            username=server.username,
+            password=password,
+            database='master'
+        )
+        # Session options outlive the cycle along with the connection
         try:
-            cursor.execute("""
-                SELECT TOP 1
-                    record.value('(./Record/SchedulerMonitorEvent/SystemHealth/ProcessUtilization)[1]', 'int') AS SqlProcessUtilization
-                FROM (
-                    SELECT CAST(record AS XML) AS record
-                    FROM sys.dm_os_ring_buffers
-                    WHERE ring_buffer_type = N'RING_BUFFER_SCHEDULER_MONITOR'
-                    AND record LIKE '%<SystemHealth>%'
-                ) AS t
-            """)
-            row = cursor.fetchone()
-            if row and row[0] is not None:
-                metrics['cpu_percent'] = row[0]
-        except Exception as e:
-            logger.debug(f"CPU collection failed: {e}")
-
-        # Collect memory
+            conn.cursor().execute(_SESSION_SETUP)
+        except Exception:
+            _close_quietly(conn)
+            raise
+        return conn
+
+    def _release_connection(self, key: tuple, settings: tuple, conn):
+        """Put a healthy connection back in the cache for the next cycle."""
         try:
-            cursor.execute("""
-                SELECT
-                    (total_physical_memory_kb - available_physical_memory_kb) * 100.0 / total_physical_memory_kb
-                FROM sys.dm_os_sys_memory
-            """)
-            row = cursor.fetchone()
-            if row and row[0] is not None:
-                metrics['memory_percent'] = round(float(row[0]), 2)
-        except Exception as e:
-            logger.debug(f"Memory collection failed: {e}")
+            # End the implicit transaction so no session state is held open
+            conn.rollback()
+        except Exception:
+            _close_quietly(conn)
+            return
 
-        # Collect connection count
-        try:
-            cursor.execute("SELECT COUNT(*) FROM sys.dm_exec_sessions WHERE is_user_process = 1")
-            row = cursor.fetchone()
-            if row:
-                metrics['connection_count'] = row[0]
-        except Exception as e:
-            logger.debug(f"Connection count failed: {e}")
+        with self._connections_lock:
+            replaced = self._connections.get(key)
+            self._connections[key] = (settings, time.monotonic(), conn)
+        if replaced:
+            _close_quietly(replaced[2])
+
+    def _close_connections(self, should_close):
+        """Close cached connections whose last use matches should_close."""
+        with self._connections_lock:
+            expired = [
+                key for key, (_, last_used, _) in self._connections.items()
+                if should_close(last_used)
+            ]
+            connections = [self._connections.pop(key)[2] for key in expired]
 
-        # Collect batch requests per second
-        try:
-            cursor.execute("""
-                SELECT cntr_value
-                FROM sys.dm_os_performance_counters
-                WHERE counter_name = 'Batch Requests/sec'
-            """)
-            row = cursor.fetchone()
-            if row:
-                metrics['batch_requests_sec'] = row[0]
-        except Exception as e:
-            logger.debug(f"Batch requests failed: {e}")
+        for conn in connections:
+            _close_quietly(conn)
 
-        # Collect page life expectancy
-        try:
-            cursor.execute("""
-                SELECT cntr_value
-                FROM sys.dm_os_performance_counters
-                WHERE counter_name = 'Page life expectancy'
-                AND object_name LIKE '%Buffer Manager%'
-            """)
-            row = cursor.fetchone()
-            if row:
-                metrics['page_life_expectancy'] = row[0]
-        except Exception as e:
-            logger.debug(f"PLE collection failed: {e}")
+    def _collect_metrics(self, cursor) -> dict:
+        """
+        Execute metric collection queries.
 
-        # Collect blocked processes
+        All metrics are read in one round trip; if that fails, each
+        metric is queried on its own so one failing DMV does not lose
+        the others.
+
+        Returns:
+            Dict of collected metrics
+        """
         try:
-            cursor.execute("SELECT COUNT(*) FROM sys.dm_exec_requests WHERE blocking_session_id > 0")
+            cursor.execute(_METRICS_QUERY)
             row = cursor.fetchone()
-            if row:
-                metrics['blocked_processes'] = row[0]
         except Exception as e:
-            logger.debug(f"Blocked processes failed: {e}")
+            logger.debug(f"Combined metric query failed, querying separately: {e}")
+            values = {}
+            for key, query in _METRIC_QUERIES:
+                try:
+                    cursor.execute(query)
+                    row = cursor.fetchone()
+                    if row:
+                        values[key] = row[0]
+                except Exception as e:
+                    logger.debug(f"{key} collection failed: {e}")
+        else:
+            values = dict(zip((key for key, _ in _METRIC_QUERIES), row or ()))
 
+        metrics = {key: value for key, value in values.items() if value is not None}
+        if 'memory_percent' in metrics:
+            metrics['memory_percent'] = round(float(metrics['memory_percent']), 2)
         return metrics
 
-    def _should_collect_queries(self, config: CollectionConfig) -> bool:
+    def _should_collect_queries(self, config: CollectionConfig, now: Optional[datetime] = None) -> bool:
         """Check if enough time has passed to collect running queries."""
         if not config.last_query_collected_at:
             return True
 
-        elapsed = (datetime.now(timezone.utc) - config.last_query_collected_at).total_seconds()
+        now = now or datetime.now(timezone.utc)
+        elapsed = (now - config.last_query_collected_at).total_seconds()
         return elapsed >= config.query_collection_interval
 
-    def _collect_running_queries(self, session, server: Server, config: CollectionConfig, cursor):
+    def _collect_running_queries(
+        self,
+        session,
+        server: Server,
+        config: CollectionConfig,
+        cursor,
+        collected_at: Optional[datetime] = None
+    ):
         """
         Collect running queries from SQL Server with full session context.
 
@@ -381,110 +611,48 @@ class MetricCollector:
             server: Server model instance
             config: Collection config for the server
             cursor: Database cursor
+            collected_at: Collection timestamp (defaults to current UTC time)
+
+        Returns:
+            Number of running queries saved
         """
         try:
             min_duration_ms = config.query_min_duration_ms or 0
-            collected_at = datetime.now(timezone.utc)
-
-            # Build dynamic WHERE clause based on filters
-            where_conditions = [
-                "r.session_id > 50",
-                "r.session_id != @@SPID",
-                "r.sql_handle IS NOT NULL",
-                f"DATEDIFF(MILLISECOND, r.start_time, GETDATE()) >= {min_duration_ms}"
-            ]
-
-            # Add filter conditions (using parameterized-style escaping)
-            if config.query_filter_database:
-                # Escape single quotes in the pattern
-                db_pattern = config.query_filter_database.replace("'", "''")
-                where_conditions.append(f"DB_NAME(r.database_id) LIKE '{db_pattern}'")
-
-            if config.query_filter_login:
-                login_pattern = config.query_filter_login.replace("'", "''")
-                where_conditions.append(f"s.login_name LIKE '{login_pattern}'")
-
-            if config.query_filter_user:
-                user_pattern = config.query_filter_user.replace("'", "''")
-                where_conditions.append(f"s.nt_user_name LIKE '{user_pattern}'")
-
-            if config.query_filter_text_include:
-                include_pattern = config.query_filter_text_include.replace("'", "''")
-                where_conditions.append(f"t.text LIKE '{include_pattern}'")
-
-            if config.query_filter_text_exclude:
-                exclude_pattern = config.query_filter_text_exclude.replace("'", "''")
-                where_conditions.append(f"t.text NOT LIKE '{exclude_pattern}'")
-
-            where_clause = " AND ".join(where_conditions)
-
-            # Query to fetch running queries with full session context
-            # Always join sys.dm_exec_sessions for analytics breakdowns
-            cursor.execute(f"""
-                SELECT
-                    r.session_id,
-                    r.request_id,
-                    r.blocking_session_id,
-                    DB_NAME(r.database_id) AS database_name,
-                    s.login_name,
-                    s.host_name,
-                    s.program_name,
-                    SUBSTRING(t.text,
-                        (r.statement_start_offset/2) + 1,
-                        ((CASE WHEN r.statement_end_offset = -1
-                             THEN LEN(CONVERT(NVARCHAR(MAX), t.text)) * 2
-                             ELSE r.statement_end_offset
-                        END) - r.statement_start_offset) / 2 + 1) AS query_text,
-                    r.start_time,
-                    DATEDIFF(MILLISECOND, r.start_time, GETDATE()) AS duration_ms,
-                    r.status,
-                    r.wait_type,
-                    r.wait_time AS wait_time_ms,
-                    r.cpu_time AS cpu_time_ms,
-                    r.logical_reads,
-                    r.reads AS physical_reads,
-                    r.writes
-                FROM sys.dm_exec_requests r
-                CROSS APPLY sys.dm_exec_sql_text(r.sql_handle) t
-                JOIN sys.dm_exec_sessions s ON r.session_id = s.session_id
-                WHERE {where_clause}
-                ORDER BY r.start_time
-            """)
-
-            rows = cursor.fetchall()
-            query_count = 0
-
-            for row in rows:
-                try:
-                    # blocking_session_id: 0 means not blocked, convert to None for cleaner data
-                    blocking_id = row[2] if row[2] and row[2] > 0 else None
+            collected_at = collected_at or datetime.now(timezone.utc)
+
+            # Filter values are bound as parameters so SQL Server filters
+            # before sending rows back; the SQL text only depends on which
+            # filters are set
+            params = [min_duration_ms]
+            active_filters = []
+            for pattern in (
+                config.query_filter_database,
+                config.query_filter_login,
+                config.query_filter_user,
+                config.query_filter_text_include,
+                config.query_filter_text_exclude,
+            ):
+                active_filters.append(bool(pattern))
+                if pattern:
+                    params.append(pattern)
+
+            cursor.arraysize = self.RUNNING_QUERY_BATCH_SIZE
+            cursor.execute(_running_queries_sql(tuple(active_filters)), params)
+
+            # Write under a savepoint so a failed insert only drops this
+            # poll's running queries, not the rest of the collection
+            with session.begin_nested():
+                # Stream rows in batches so memory stays bounded however many
+                # sessions are active, inserting each batch as it arrives
+                query_count = 0
+                while True:
+                    rows = cursor.fetchmany(self.RUNNING_QUERY_BATCH_SIZE)
+                    if not rows:
+                        break
+                    query_count += self._save_running_queries(session, server, collected_at, rows)
 
-                    snapshot = RunningQuerySnapshot(
-                        server_id=server.id,
-                        collected_at=collected_at,
-                        session_id=row[0],
-                        request_id=row[1],
-                        blocking_session_id=blocking_id,
-                        database_name=row[3],
-                        login_name=row[4],
-                        host_name=row[5],
-                        program_name=row[6],
-                        query_text=row[7],
-                        start_time=row[8],
-                        duration_ms=row[9],
-                        status=row[10],
-                        wait_type=row[11],
-                        wait_time_ms=row[12],
-                        cpu_time_ms=row[13],
-                        logical_reads=row[14],
-                        physical_reads=row[15],
-                        writes=row[16],
-                    )
-                    session.add(snapshot)
-                    query_count += 1
-                except Exception as e:
-                    logger.debug(f"Error processing query row: {e}")
-                    continue
+                if query_count > 0:
+                    self._increment_hourly_count(session, server, collected_at, query_count)
 
             # Update last_query_collected_at
             config.last_query_collected_at = collected_at
@@ -492,14 +660,138 @@ class MetricCollector:
             if query_count > 0:
                 logger.debug(f"Collected {query_count} running queries from {server.name}")
 
+            return query_count
+
         except Exception as e:
-            logger.debug(f"Running queries collection failed for {server.name}: {e}")
+            logger.warning(f"Running queries collection failed for {server.name}: {e}")
+            return 0
+
+    def _save_running_queries(self, session, server: Server, collected_at: datetime, rows) -> int:
+        """
+        Save one batch of running query rows.
+
+        Args:
+            session: Database session
+            server: Server model instance
+            collected_at: Collection timestamp shared by the whole poll
+            rows: Rows from the running queries cursor
 
-    def _update_server_status(self, session, server: Server, status: str):
+        Returns:
+            Number of snapshots saved
+        """
+        wait_type_ids = self._get_wait_type_ids(session, {row[11] for row in rows if row[11]})
+
+        snapshots = []
+        query_texts = {}
+        for row in rows:
+            try:
+                text_hash = None
+                if row[7] is not None:
+                    text_hash = QueryText.hash_text(row[7])
+                    query_texts[text_hash] = row[7]
+
+                snapshots.append({
+                    'server_id': server.id,
+                    'collected_at': collected_at,
+                    'session_id': row[0],
+                    'request_id': row[1],
+                    # blocking_session_id: 0 means not blocked, convert to None for cleaner data
+                    'blocking_session_id': row[2] if row[2] and row[2] > 0 else None,
+                    'database_name': row[3],
+                    'login_name': row[4],
+                    'host_name': row[5],
+                    'program_name': row[6],
+                    'query_text_hash': text_hash,
+                    'start_time': row[8],
+                    'duration_ms': row[9],
+                    # Statuses outside the query_status enum are dropped
+                    'status': row[10].lower() if row[10] and row[10].lower() in QUERY_STATUSES else None,
+                    'wait_type_id': wait_type_ids.get(row[11]),
+                    'wait_time_ms': row[12],
+                    'cpu_time_ms': row[13],
+                    'logical_reads': row[14],
+                    'physical_reads': row[15],
+                    'writes': row[16],
+                })
+            except Exception as e:
+                logger.debug(f"Error processing query row: {e}")
+                continue
+
+        # Texts already seen are kept as they are
+        if query_texts:
+            session.execute(
+                pg_insert(QueryText).on_conflict_do_nothing(index_elements=['hash']),
+                [
+                    {'hash': text_hash, 'text': text, 'first_seen': collected_at}
+                    for text_hash, text in query_texts.items()
+                ]
+            )
+
+        # One batched multi-row INSERT instead of a flush per ORM object
+        if snapshots:
+            session.execute(insert(RunningQuerySnapshot), snapshots)
+
+        return len(snapshots)
+
+    def _get_wait_type_ids(self, session, names: set[str]) -> dict[str, int]:
+        """
+        Map wait type names to wait_types ids, adding names not seen before.
+
+        Args:
+            session: Database session
+            names: Wait type names in the batch
+
+        Returns:
+            Dictionary of wait type name to id
+        """
+        engine = session.get_bind()
+        database = engine.url.database
+        missing = [name for name in names if (database, name) not in self._wait_type_ids]
+        if missing:
+            # Add new names in their own committed transaction: ids are cached
+            # for the life of the process, and a rollback of the collection's
+            # transaction would otherwise leave the cache pointing at rows
+            # that don't exist (Postgres never reuses identity values)
+            with engine.begin() as conn:
+                conn.execute(
+                    pg_insert(WaitType).on_conflict_do_nothing(index_elements=['name']),
+                    [{'name': name} for name in missing]
+                )
+                found = conn.execute(
+                    select(WaitType.id, WaitType.name).where(WaitType.name.in_(missing))
+                ).all()
+            for wait_type_id, name in found:
+                self._wait_type_ids[(database, name)] = wait_type_id
+
+        return {
+            name: self._wait_type_ids[(database, name)]
+            for name in names if (database, name) in self._wait_type_ids
+        }
+
+    def _increment_hourly_count(self, session, server: Server, collected_at: datetime, count: int):
+        """Add collected snapshots to the server's running_query_hourly bucket."""
+        hour = collected_at.replace(minute=0, second=0, microsecond=0)
+        stmt = pg_insert(RunningQueryHourly).values(
+            server_id=server.id,
+            hour=hour,
+            snapshot_count=count,
+        )
+        session.execute(stmt.on_conflict_do_update(
+            index_elements=['server_id', 'hour'],
+            set_={'snapshot_count': RunningQueryHourly.snapshot_count + stmt.excluded.snapshot_count},
+        ))
+
+    def _update_server_status(
+        self,
+        session,
+        server: Server,
+        status: str,
+        checked_at: Optional[datetime] = None
+    ):
         """Update server status and last_checked timestamp."""
         try:
             server.status = status
-            server.last_checked = datetime.now(timezone.utc)
+            server.last_checked = checked_at or datetime.now(timezone.utc)
             session.commit()
         except Exception as e:
             logger.error(f"Failed to update server status: {e}")
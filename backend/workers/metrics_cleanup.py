@@ -5,11 +5,14 @@ import logging
 from datetime import datetime, timezone, timedelta
 from typing import Optional
 
+from sqlalchemy import delete, select
+
 from app import create_app
 from app.models.system import Tenant
-from app.models.tenant import Setting, ServerSnapshot, Metric, RunningQuerySnapshot
+from app.models.tenant import Setting, ServerSnapshot, Metric, QueryText, RunningQuerySnapshot, RunningQueryHourly
 from app.core.tenant_manager import tenant_manager
 from app.services.retention_service import RetentionService
+from app.services.partition_service import PartitionService, PARTITIONED_TABLES
 
 # Configure logging
 logging.basicConfig(
@@ -33,6 +36,10 @@ class MetricsCleanup:
     # Run cleanup every 24 hours
     CLEANUP_INTERVAL_HOURS = 24
 
+    # Query texts first seen within this long before the retention cutoff
+    # are kept, so texts a collector is about to reference are not dropped
+    QUERY_TEXT_GRACE_HOURS = 24
+
     def __init__(self):
         """Initialize the cleanup worker."""
         self.app = create_app()
@@ -111,6 +118,10 @@ class MetricsCleanup:
 
             logger.info(f"Tenant {tenant.slug}: cleaning data older than {cutoff.date()} ({retention_days} days retention)")
 
+            # Drop whole expired months first so the batched deletes below
+            # only touch the partition straddling the cutoff
+            self._maintain_partitions(session, tenant, cutoff)
+
             # Clean up snapshots
             snapshots_deleted = self._delete_in_batches(
                 session,
@@ -132,6 +143,32 @@ class MetricsCleanup:
                 RunningQuerySnapshot.collected_at < cutoff
             )
 
+            # Drop hourly rollup buckets whose whole hour is past retention;
+            # one row per server per hour, so no batching needed
+            try:
+                session.query(RunningQueryHourly).filter(
+                    RunningQueryHourly.hour <= cutoff - timedelta(hours=1)
+                ).delete(synchronize_session=False)
+                session.commit()
+            except Exception as e:
+                logger.exception(f"Error deleting running query rollups: {e}")
+                session.rollback()
+
+            # Drop query texts no remaining snapshot refers to. A collector
+            # reusing an old text while this runs can still lose it; its next
+            # poll inserts the text again under the same hash
+            try:
+                session.query(QueryText).filter(
+                    QueryText.first_seen < cutoff - timedelta(hours=self.QUERY_TEXT_GRACE_HOURS),
+                    ~session.query(RunningQuerySnapshot.id).filter(
+                        RunningQuerySnapshot.query_text_hash == QueryText.hash
+                    ).exists()
+                ).delete(synchronize_session=False)
+                session.commit()
+            except Exception as e:
+                logger.exception(f"Error deleting unreferenced query texts: {e}")
+                session.rollback()
+
             if snapshots_deleted > 0 or metrics_deleted > 0 or queries_deleted > 0:
                 logger.info(
                     f"Tenant {tenant.slug}: deleted {snapshots_deleted} snapshots, "
@@ -149,6 +186,34 @@ class MetricsCleanup:
                 except Exception:
                     pass
 
+    def _maintain_partitions(self, session, tenant: Tenant, cutoff: datetime):
+        """Create upcoming monthly partitions and drop expired ones.
+
+        Args:
+            session: SQLAlchemy session
+            tenant: Tenant being cleaned up
+            cutoff: Retention cutoff
+        """
+        service = PartitionService(session)
+        for table in PARTITIONED_TABLES:
+            # Separate steps, so a failure creating partitions doesn't also
+            # stop expired ones from being dropped
+            try:
+                created = service.ensure_partitions(table)
+                if created:
+                    logger.info(f"Tenant {tenant.slug}: {table} partitions created {created}")
+            except Exception as e:
+                logger.exception(f"Error creating {table} partitions: {e}")
+                session.rollback()
+
+            try:
+                dropped = service.drop_partitions_before(table, cutoff)
+                if dropped:
+                    logger.info(f"Tenant {tenant.slug}: {table} partitions dropped {dropped}")
+            except Exception as e:
+                logger.exception(f"Error dropping {table} partitions: {e}")
+                session.rollback()
+
     def _delete_in_batches(self, session, model, condition) -> int:
         """
         Delete rows matching condition in batches.
@@ -165,20 +230,15 @@ class MetricsCleanup:
 
         while self.running:
             try:
-                # Get IDs of rows to delete (limited batch)
-                rows_to_delete = session.query(model.id).filter(
-                    condition
-                ).limit(self.BATCH_SIZE).all()
-
-                if not rows_to_delete:
-                    break
-
-                ids_to_delete = [row[0] for row in rows_to_delete]
-
-                # Delete the batch
-                deleted = session.query(model).filter(
-                    model.id.in_(ids_to_delete)
-                ).delete(synchronize_session=False)
+                # Select and delete the batch in one statement; repeating the
+                # condition outside the subquery lets Postgres prune partitions
+                deleted = session.execute(
+                    delete(model)
+                    .where(condition, model.id.in_(
+                        select(model.id).where(condition).limit(self.BATCH_SIZE)
+                    ))
+                    .execution_options(synchronize_session=False)
+                ).rowcount
 
                 session.commit()
                 total_deleted += deleted
@@ -1,6 +1,8 @@
 """Run pending migrations on all active tenant databases."""
 import sys
 import os
+import traceback
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
 
 # Add backend to path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'backend'))
@@ -10,64 +12,130 @@ from app.extensions import db
 from app.models import Tenant
 from app.core import tenant_manager
 
+DEFAULT_JOBS = 4
 
-def migrate_all_tenants(dry_run: bool = False):
-    """Run migrations on all active tenant databases.
+# Seconds without any tenant finishing before the running ones are listed,
+# e.g. an upgrade waiting on a lock held by a long transaction
+STUCK_WARNING_SECONDS = 60
 
-    Args:
-        dry_run: If True, only show what would be done without executing.
-    """
-    app = create_app('development')
+# Per worker process app, set by _init_worker
+_app = None
 
-    with app.app_context():
-        tenants = Tenant.query.filter_by(status='active').all()
 
-        if not tenants:
-            print("No active tenants found.")
-            return
+def _init_worker():
+    global _app
+    _app = create_app('development')
+
+
+def _migrate(slug: str, head: str):
+    """Migrate one tenant to head.
+
+    Returns:
+        (slug, revision before, revision after); revision after is None
+        when the tenant was already at head
+    """
+    with _app.app_context():
+        # Reports the revision it started from, and has nothing to run
+        # for a tenant already at head
+        before = tenant_manager.run_migrations(slug)
+    # A successful upgrade leaves the tenant at head
+    return slug, before, None if before == head else head
 
-        print(f"Found {len(tenants)} active tenant(s)")
-        print("-" * 50)
 
-        success_count = 0
-        error_count = 0
+def migrate_all_tenants(dry_run: bool = False, jobs: int = DEFAULT_JOBS, verbose: bool = False) -> int:
+    """Run migrations on all active tenant databases.
 
-        for tenant in tenants:
-            print(f"\nTenant: {tenant.slug}")
+    Prints one line per upgraded or failed tenant as it finishes.
 
-            if dry_run:
-                print("  [DRY RUN] Would run migrations")
-                continue
+    Args:
+        dry_run: If True, only show what would be done without executing.
+        jobs: Number of tenants migrated at the same time.
+        verbose: If True, also list tenants that were already at head and
+            print full tracebacks for failures.
 
-            try:
-                # Get current status
-                status = tenant_manager.get_migration_status(tenant.slug)
-                print(f"  Current revision: {status.get('current_revision', 'None')}")
+    Returns:
+        Number of tenants whose migration failed
+    """
+    app = create_app('development')
+
+    with app.app_context():
+        slugs = [slug for (slug,) in db.session.query(Tenant.slug).filter_by(status='active')]
 
-                # Run migrations
-                tenant_manager.run_migrations(tenant.slug)
+    if not slugs:
+        print("No active tenants found.")
+        return 0
 
-                # Get new status
-                new_status = tenant_manager.get_migration_status(tenant.slug)
-                print(f"  New revision: {new_status.get('current_revision', 'None')}")
-                print("  Status: SUCCESS")
-                success_count += 1
+    print(f"Found {len(slugs)} active tenant(s)")
+    print("-" * 50)
 
-            except Exception as e:
-                print(f"  Status: ERROR - {str(e)}")
-                error_count += 1
+    if dry_run:
+        for slug in slugs:
+            print(f"  [DRY RUN] {slug}: would run migrations")
+        return 0
 
-        print("\n" + "=" * 50)
-        print(f"Summary: {success_count} succeeded, {error_count} failed")
+    with app.app_context():
+        head = tenant_manager.get_head_revision()
+
+    success_count = 0
+    skipped_count = 0
+    error_count = 0
+
+    # Alembic keeps its migration context in module globals, so concurrent
+    # upgrades need separate processes rather than threads
+    workers = max(1, min(jobs, len(slugs)))
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker) as executor:
+        futures = {executor.submit(_migrate, slug, head): slug for slug in slugs}
+        pending = set(futures)
+        while pending:
+            done, pending = wait(pending, timeout=STUCK_WARNING_SECONDS, return_when=FIRST_COMPLETED)
+            if not done:
+                running = sorted(futures[future] for future in pending if future.running())
+                print(f"  [WAIT] Nothing finished in {STUCK_WARNING_SECONDS}s, still running: {', '.join(running)}")
+
+            for future in done:
+                try:
+                    slug, before, after = future.result()
+                except Exception as e:
+                    print(f"  [ERROR] {futures[future]}: {e}")
+                    if verbose:
+                        # Includes the worker's traceback, chained as the cause
+                        print(''.join(traceback.format_exception(type(e), e, e.__traceback__)), file=sys.stderr)
+                    error_count += 1
+                    continue
+
+                if after is None:
+                    if verbose:
+                        print(f"  [SKIP] {slug}: already at {before}")
+                    skipped_count += 1
+                else:
+                    print(f"  [OK] {slug}: {before or 'None'} -> {after}")
+                    success_count += 1
+
+    print("=" * 50)
+    print(f"Summary: {success_count} succeeded, {skipped_count} already at head, {error_count} failed")
+    return error_count
 
 
 def main():
     import argparse
     parser = argparse.ArgumentParser(description='Run migrations on all tenant databases')
     parser.add_argument('--dry-run', action='store_true', help='Show what would be done')
+    parser.add_argument(
+        '--jobs',
+        type=int,
+        default=DEFAULT_JOBS,
+        help=f'Tenants migrated in parallel (default: {DEFAULT_JOBS})'
+    )
+    parser.add_argument(
+        '--verbose',
+        action='store_true',
+        help='Also list tenants already at head and show failure tracebacks'
+    )
     args = parser.parse_args()
 
-    migrate_all_tenants(dry_run=args.dry_run)
+    failed = migrate_all_tenants(dry_run=args.dry_run, jobs=args.jobs, verbose=args.verbose)
+    # Non-zero so deploy pipelines notice partial failures
+    sys.exit(1 if failed else 0)
 
 
 if __name__ == '__main__':
@@ -5,6 +5,8 @@ import os
 # Add backend to path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'backend'))
 
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+
 from app import create_app
 from app.extensions import db
 from app.models import Tenant
@@ -15,25 +17,29 @@ def seed_demo_tenant():
     app = create_app('development')
 
     with app.app_context():
-        # Check if demo tenant exists
-        existing = Tenant.query.filter_by(slug='demo').first()
-        if existing:
+        # Insert unless the slug is taken, in one statement; safe to run
+        # concurrently
+        tenant = db.session.scalars(
+            pg_insert(Tenant).values(
+                name='Demo Company',
+                slug='demo',
+                status='active',
+                settings={
+                    'timezone': 'UTC',
+                    'retention_days': 90
+                }
+            ).on_conflict_do_nothing(index_elements=['slug']).returning(Tenant)
+        ).first()
+        if tenant is not None:
+            # Keep the RETURNING values; commit would expire and reload them
+            db.session.expunge(tenant)
+        db.session.commit()
+
+        if tenant is None:
+            existing = Tenant.query.filter_by(slug='demo').first()
             print(f"Demo tenant already exists: {existing}")
             return existing
 
-        # Create demo tenant
-        tenant = Tenant(
-            name='Demo Company',
-            slug='demo',
-            status='active',
-            settings={
-                'timezone': 'UTC',
-                'retention_days': 90
-            }
-        )
-        db.session.add(tenant)
-        db.session.commit()
-
         print(f"Created demo tenant: {tenant}")
         print(f"  ID: {tenant.id}")
         print(f"  Slug: {tenant.slug}")